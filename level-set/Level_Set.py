@@ -1,6 +1,5 @@
 # general
 import numpy as np
-from numpy.lib.npyio import save
 
 # visualization
 import matplotlib.pyplot as plt
@@ -240,8 +239,9 @@ class Level_Set:
         return self.segment_image(phi, image)
 
 
-image_data = cv2.imread("mdb001.png", 0)
-ls = Level_Set('double-well')
-img = ls.run_level_set(image_data)
-plt.imshow(img)
-plt.show()
+if __name__ == "__main__":
+    image_data = cv2.imread("mdb001.png", 0)
+    ls = Level_Set('double-well')
+    img = ls.run_level_set(image_data)
+    plt.imshow(img)
+    plt.show()
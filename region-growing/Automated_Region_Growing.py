@@ -309,9 +309,10 @@ def run_region_growing_and_plot(starting_index, ending_index, max_iter):
 # In[14]:
 
 
-print("Key in any integer without padding (eg, 1 for 001)")
-sp = int(input("Starting from mdb_ _ _:"))
-ep = int(input("Until mdb_ _ _:"))
-print("Wait for your result!")
-run_region_growing_and_plot(sp,ep,6200)
+if __name__ == "__main__":
+    print("Key in any integer without padding (eg, 1 for 001)")
+    sp = int(input("Starting from mdb_ _ _:"))
+    ep = int(input("Until mdb_ _ _:"))
+    print("Wait for your result!")
+    run_region_growing_and_plot(sp,ep,6200)
 
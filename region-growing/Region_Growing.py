@@ -154,9 +154,10 @@ class Region_Growing():
         """
         return 0 <= pixel[0] < img_shape[0] and 0 <= pixel[1] < img_shape[1]
 
-image_data = cv2.imread("mdb001.pgm", 0)
-rg = Region_Growing(image_data, 6200, threshold=40, conn=8)
-rg.segment()
-result = rg.display_and_resegment()
-plt.imshow(result)
-plt.show()
+if __name__ == "__main__":
+    image_data = cv2.imread("mdb001.pgm", 0)
+    rg = Region_Growing(image_data, 6200, threshold=40, conn=8)
+    rg.segment()
+    result = rg.display_and_resegment()
+    plt.imshow(result)
+    plt.show()
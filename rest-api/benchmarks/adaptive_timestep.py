@@ -0,0 +1,136 @@
+"""
+Evaluates adaptive time stepping for the level set evolution against the fixed time step of find_lsf. Every image
+is evolved over the same time (iter_outer * iter_inner * timestep, then the refinement) three ways:
+
+- fixed: Level_Set.find_lsf with the fixed timestep,
+- stable: every iteration takes the largest step allowed by both stability conditions, the distance
+  regularization bound mu * step < 1/4 of DRLSE (Li et al. 2010) with mu = 0.2 / timestep, and a CFL condition
+  on the edge, area and curvature terms, which may move the zero level contour by at most one pixel: the step
+  times the largest |front term| / |grad phi| in the band of the Dirac function is at most 1,
+- regularization bound: every iteration takes the largest step of the regularization bound alone.
+
+Reports, per image, the number of iterations and the time of each, and the Dice of their muscle masks with that
+of the fixed step.
+
+Usage (from the rest-api directory):
+    python -m benchmarks.adaptive_timestep testing_images/*.pgm
+"""
+import argparse
+import time
+
+import numpy as np
+
+from segmentation import DOUBLE_WELL, Level_Set, preprocessing, read_image, spans_to_mask
+from segmentation.golden import image_name
+
+# distance the zero level contour may move in one step, in pixels
+CFL_PIXELS = 1.0
+
+# fraction of the regularization bound 1 / (4 * mu) taken, the bound itself is strict
+REGULARIZATION_MARGIN = 0.99
+
+# iterations of the refinement with alfa = 0 that ends find_lsf
+ITER_REFINE = 10
+
+
+def regularization_bound(phi, front, mu):
+    return REGULARIZATION_MARGIN / (4 * mu)
+
+
+def stable_bound(phi, front, mu):
+    [phi_y, phi_x] = np.gradient(phi)
+    band = front != 0
+    if not band.any():
+        return regularization_bound(phi, front, mu)
+    speed = np.abs(front[band]) / np.maximum(np.hypot(phi_x, phi_y)[band], 1e-3)
+    return min(regularization_bound(phi, front, mu), CFL_PIXELS / float(speed.max()))
+
+
+def evolve_adaptive(level_set, phi, g, lmda, mu, alfa, epsilon, duration, bound, steps):
+    """
+    Evolves phi over a duration, every step the largest one the bound allows.
+
+    Returns:
+        The level set function, the steps are appended to steps.
+    """
+    [vy, vx] = np.gradient(g)
+    remaining = duration
+    # the last step may fall short of the duration by a rounding error
+    while remaining > 1e-6 * duration:
+        phi = level_set.neumann_bound_cond(phi)
+        # the edge, area and curvature terms per unit of time, without the distance regularization
+        front = level_set.drlse_step(phi, g, vx, vy, lmda, 0, alfa, epsilon, 1, DOUBLE_WELL)
+        step = min(remaining, bound(phi, front, mu))
+        phi += step * (front + mu * level_set.dist_reg_p2(phi))
+        remaining -= step
+        steps.append(step)
+    return phi
+
+
+def find_lsf_adaptive(level_set, img, initial_lsf, timestep, iter_inner, iter_outer, lmda, alfa, epsilon, bound,
+                      **params):
+    """
+    Level_Set.find_lsf with adaptive steps over the same evolution time.
+
+    Returns:
+        Tuple of the level set function and the list of its steps.
+    """
+    mu = 0.2 / timestep
+    [Iy, Ix] = np.gradient(np.array(img, dtype='float32'))
+    g = 1 / (1 + np.square(Ix) + np.square(Iy))
+    steps = []
+    phi = evolve_adaptive(level_set, initial_lsf.copy(), g, lmda, mu, alfa, epsilon,
+                          iter_outer * iter_inner * timestep, bound, steps)
+    phi = evolve_adaptive(level_set, phi, g, lmda, mu, 0, epsilon, ITER_REFINE * timestep, bound, steps)
+    return phi, steps
+
+
+def muscle_mask(level_set, image, phi):
+    boundary = np.zeros(image.shape[0], dtype=int)
+    record_array = level_set.boundary(phi)
+    boundary[:len(record_array)] = record_array
+    return spans_to_mask(np.zeros_like(boundary), boundary, image.shape[1])
+
+
+def dice(mask, reference):
+    total = np.count_nonzero(mask) + np.count_nonzero(reference)
+    return 2 * np.count_nonzero(mask & reference) / total if total else 1.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("images", nargs="+", help="paths of the images to segment")
+    args = parser.parse_args()
+
+    level_set = Level_Set(DOUBLE_WELL)
+    images = [(image_name(path), preprocessing(read_image(path)[0])) for path in args.images]
+    # imports scipy and scikit-image before timing
+    level_set.find_lsf(**dict(level_set.initialise_params(images[0][1]), iter_outer=1))
+    totals = {}
+    scores = {}
+    for name, image in images:
+        params = level_set.initialise_params(image)
+        start = time.perf_counter()
+        phi = level_set.find_lsf(**params)
+        seconds = time.perf_counter() - start
+        reference = muscle_mask(level_set, image, phi)
+        iterations = params['iter_outer'] * params['iter_inner'] + ITER_REFINE
+        line = ["fixed {} iterations {:.2f}s".format(iterations, seconds)]
+        totals.setdefault('fixed', np.zeros(2))[:] += [iterations, seconds]
+        for mode, bound in [("stable", stable_bound), ("regularization bound", regularization_bound)]:
+            start = time.perf_counter()
+            phi, steps = find_lsf_adaptive(level_set, bound=bound, **params)
+            seconds = time.perf_counter() - start
+            scores.setdefault(mode, []).append(dice(muscle_mask(level_set, image, phi), reference))
+            totals.setdefault(mode, np.zeros(2))[:] += [len(steps), seconds]
+            line.append("{} {} iterations {:.2f}s (steps {:.2f} to {:.2f}) dice {:.4f}".format(
+                mode, len(steps), seconds, min(steps), max(steps), scores[mode][-1]))
+        print("{}: {}".format(name, ", ".join(line)))
+    print("total: fixed {:.0f} iterations {:.2f}s".format(*totals['fixed']))
+    for mode, values in scores.items():
+        print("       {} {:.0f} iterations {:.2f}s, dice mean {:.4f} min {:.4f}".format(
+            mode, *totals[mode], np.mean(values), np.min(values)))
+
+
+if __name__ == "__main__":
+    main()
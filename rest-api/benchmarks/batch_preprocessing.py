@@ -0,0 +1,44 @@
+"""
+Preprocesses a stack of images of the same size once image by image with preprocessing and once with
+preprocess_batch, checks that both give the same images and reports the time of both.
+
+Usage (from the rest-api directory):
+    python -m benchmarks.batch_preprocessing testing_images/*.pgm
+    python -m benchmarks.batch_preprocessing testing_images/*.pgm --repeat 20
+"""
+import argparse
+import time
+
+import numpy as np
+
+from segmentation import preprocess_batch, preprocessing, read_image
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("images", nargs="+", help="paths of the images to preprocess, all of the same size")
+    parser.add_argument("--repeat", type=int, default=10, help="number of times the stack is preprocessed")
+    args = parser.parse_args()
+
+    images = [read_image(path)[0] for path in args.images]
+    stack = np.stack([np.asarray(image) for image in images])
+
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        expected = [preprocessing(image) for image in images]
+    per_image = (time.perf_counter() - start) / args.repeat
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        batch = preprocess_batch(stack)
+    batched = (time.perf_counter() - start) / args.repeat
+
+    for i, path in enumerate(args.images):
+        if not np.array_equal(batch.image(i), expected[i]):
+            raise SystemExit("{} differs from its image preprocessed alone".format(path))
+    print("{} images of {}x{}".format(*stack.shape))
+    print("per image: {:.1f}ms".format(per_image * 1000))
+    print("batch:     {:.1f}ms".format(batched * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Compares the default dtype policy (uint8 images and masks, float32 level set fields) with the float64
+reference policy: memory of the arrays, latency and the largest numerical deviation.
+
+Usage (from the rest-api directory):
+    python -m benchmarks.dtype_policy testing_images/*.pgm
+"""
+import argparse
+import time
+
+import numpy as np
+from segmentation import (DEFAULT_POLICY, DOUBLE_WELL, FLOOD_FILL, REFERENCE_POLICY, Level_Set, find_region,
+                          preprocessing, read_image)
+
+
+def run(path, dtype_policy):
+    preprocessed_image = preprocessing(read_image(path)[0], dtype_policy)
+    start = time.perf_counter()
+    region = find_region(preprocessed_image, 6200, neighbours=4, engine=FLOOD_FILL, dtype_policy=dtype_policy)
+    flood_fill_time = time.perf_counter() - start
+    ls = Level_Set(DOUBLE_WELL, dtype_policy=dtype_policy)
+    start = time.perf_counter()
+    phi = ls.find_lsf(**ls.initialise_params(preprocessed_image))
+    level_set_time = time.perf_counter() - start
+    level_set_mask = ls.segment_image(phi, np.ones_like(preprocessed_image)) == 0
+    return {
+        "image": preprocessed_image,
+        "region": region.segmentation == 0,
+        "phi": phi,
+        "level_set": level_set_mask,
+        "bytes": preprocessed_image.nbytes + region.segmentation.nbytes + phi.nbytes,
+        "flood_fill_time": flood_fill_time,
+        "level_set_time": level_set_time,
+    }
+
+
+def dice(mask_a, mask_b):
+    return 2 * np.count_nonzero(mask_a & mask_b) / (np.count_nonzero(mask_a) + np.count_nonzero(mask_b))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("images", nargs="+", help="paths of the images to segment")
+    args = parser.parse_args()
+
+    totals = {"reference": [0, 0.0, 0.0], "default": [0, 0.0, 0.0]}
+    for path in args.images:
+        reference, default = run(path, REFERENCE_POLICY), run(path, DEFAULT_POLICY)
+        for name, result in [("reference", reference), ("default", default)]:
+            totals[name][0] += result["bytes"]
+            totals[name][1] += result["flood_fill_time"]
+            totals[name][2] += result["level_set_time"]
+        print("{}: image deviation {:.3f}, phi deviation {:.3f}, region dice {:.4f}, level set dice {:.4f}, "
+              "level set {:.2f}s -> {:.2f}s".format(
+                path, np.abs(default["image"] - reference["image"]).max(),
+                np.abs(default["phi"].astype(np.float64) - reference["phi"]).max(),
+                dice(default["region"], reference["region"]), dice(default["level_set"], reference["level_set"]),
+                reference["level_set_time"], default["level_set_time"]))
+
+    print()
+    for name, (nbytes, flood_fill_time, level_set_time) in totals.items():
+        print("{:9}: {:.1f} MB of image, mask and phi arrays, flood fill {:.2f}s, level set {:.2f}s".format(
+            name, nbytes / 1e6, flood_fill_time, level_set_time))
+
+
+if __name__ == "__main__":
+    main()
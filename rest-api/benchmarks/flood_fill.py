@@ -0,0 +1,46 @@
+"""
+Compares the latency of the flood fill engine against the classic region growing engine, together with
+the agreement (Dice coefficient) of the regions they remove.
+
+Usage (from the rest-api directory):
+    python -m benchmarks.flood_fill testing_images/*.pgm
+"""
+import argparse
+import time
+
+import numpy as np
+from segmentation import CLASSIC, FLOOD_FILL, find_region, preprocessing, read_image
+
+
+def dice(mask_a, mask_b):
+    return 2 * np.count_nonzero(mask_a & mask_b) / (np.count_nonzero(mask_a) + np.count_nonzero(mask_b))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("images", nargs="+", help="paths of the images to segment")
+    parser.add_argument("--max-iter", type=int, default=6200)
+    parser.add_argument("--neighbours", type=int, default=4)
+    args = parser.parse_args()
+
+    classic_timings, flood_fill_timings, dice_scores = [], [], []
+    for path in args.images:
+        preprocessed_image = preprocessing(read_image(path)[0])
+        regions = {}
+        for engine, timings in [(CLASSIC, classic_timings), (FLOOD_FILL, flood_fill_timings)]:
+            start = time.perf_counter()
+            regions[engine] = find_region(preprocessed_image, args.max_iter, args.neighbours, engine=engine)
+            timings.append(time.perf_counter() - start)
+        dice_scores.append(dice(regions[CLASSIC].segmentation == 0, regions[FLOOD_FILL].segmentation == 0))
+        print("{}: classic {:.3f}s (threshold {}), flood fill {:.3f}s (threshold {}), dice {:.3f}".format(
+            path, classic_timings[-1], regions[CLASSIC].threshold, flood_fill_timings[-1],
+            regions[FLOOD_FILL].threshold, dice_scores[-1]))
+
+    print("\nclassic:    median {:.3f}s  total {:.2f}s".format(np.median(classic_timings), np.sum(classic_timings)))
+    print("flood fill: median {:.3f}s  total {:.2f}s".format(np.median(flood_fill_timings),
+                                                             np.sum(flood_fill_timings)))
+    print("dice: mean {:.3f}  min {:.3f}".format(np.mean(dice_scores), np.min(dice_scores)))
+
+
+if __name__ == "__main__":
+    main()
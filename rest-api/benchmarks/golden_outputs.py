@@ -0,0 +1,66 @@
+"""
+Records or checks the golden output corpus: the masks of every segmentation configuration on the testing
+images, kept as mask hashes and per-row boundaries.
+
+check runs the configurations (optionally with another engine, thread count or dtype policy standing in for
+them) and prints, per image, whether the mask is exactly the recorded one, the Dice and IoU against it and the
+time next to the recorded time. It exits with status 1 if a mask is not exact (or, with --min-dice, if its Dice
+is below the given value), so optimised engines can be accepted or rejected automatically.
+
+Usage (from the rest-api directory):
+    python -m benchmarks.golden_outputs check testing_images/*.pgm
+    python -m benchmarks.golden_outputs check testing_images/*.pgm --config classic-cascade --engine flood-fill
+    python -m benchmarks.golden_outputs check testing_images/*.pgm --config level-set --threads 4
+    python -m benchmarks.golden_outputs record testing_images/*.pgm
+"""
+import argparse
+import sys
+
+from segmentation.golden import CONFIGS, DTYPE_POLICIES, check_config, load_corpus, record_corpus, save_corpus
+
+CORPUS_PATH = "../testing/segmentation/golden_outputs.json"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", choices=["check", "record"])
+    parser.add_argument("images", nargs="+", help="paths of the testing images")
+    parser.add_argument("--corpus", default=CORPUS_PATH, help="path of the corpus file")
+    parser.add_argument("--config", action="append", choices=sorted(CONFIGS),
+                        help="configuration to check (all of them by default), can be repeated")
+    parser.add_argument("--engine", help="region growing engine standing in for the configuration's one")
+    parser.add_argument("--threads", type=int, help="number of level set threads")
+    parser.add_argument("--dtype", choices=sorted(DTYPE_POLICIES), help="dtype policy")
+    parser.add_argument("--min-dice", type=float, help="accept masks that are not exact above this Dice")
+    args = parser.parse_args()
+
+    if args.command == "record":
+        save_corpus(record_corpus(args.images), args.corpus)
+        print("recorded {} configurations on {} images in {}".format(len(CONFIGS), len(args.images), args.corpus))
+        return
+
+    corpus = load_corpus(args.corpus)
+    overrides = {name: value for name, value in [('engine', args.engine), ('threads', args.threads),
+                                                  ('dtype', args.dtype)] if value is not None}
+    accepted = True
+    for config_name in args.config or sorted(corpus['configs']):
+        config = dict(corpus['configs'][config_name], **overrides)
+        print("{} {}".format(config_name, overrides or ""))
+        results = check_config(corpus, args.images, config, config_name)
+        for name, result in sorted(results.items()):
+            ok = result['exact'] or (args.min_dice is not None and result['dice'] >= args.min_dice)
+            accepted &= ok
+            print("    {}: {:5} dice {:.4f} iou {:.4f}  {:.3f}s (recorded {:.3f}s){}".format(
+                name, "exact" if result['exact'] else "diff", result['dice'], result['iou'], result['seconds'],
+                result['reference_seconds'], "" if ok else "  REJECTED"))
+        seconds = sum(result['seconds'] for result in results.values())
+        reference_seconds = sum(result['reference_seconds'] for result in results.values())
+        print("    total {:.2f}s (recorded {:.2f}s), {}/{} exact".format(
+            seconds, reference_seconds, sum(result['exact'] for result in results.values()), len(results)))
+
+    print("accepted" if accepted else "rejected")
+    sys.exit(0 if accepted else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Compares the peak memory of segmentation requests estimated from the image header with the peak measured by
+tracemalloc, for the images resized to several resolutions. tracemalloc does not see the pixel buffers of PIL
+images, which the estimate includes, so the estimate should always be the larger of the two.
+
+Usage (from the rest-api directory):
+    python -m benchmarks.memory_estimate testing_images/*.pgm
+"""
+import argparse
+import base64
+from io import BytesIO
+
+import level_set
+import region_growing
+from PIL import Image
+from segmentation import CLASSIC, FLOOD_FILL, PREDICTED
+from segmentation.image_io import read_image_header
+from segmentation.memory import estimate_request_bytes, measure_peak
+
+# requests measured for every image, as (name, algorithm, function, keyword arguments)
+REQUESTS = [
+    ("classic", "region-growing", region_growing.run_region_growing_on_image,
+     {'threshold_mode': PREDICTED, 'engine': CLASSIC}),
+    ("flood fill", "region-growing", region_growing.run_region_growing_on_image, {'engine': FLOOD_FILL, 'roi': True}),
+    ("flood fill full", "region-growing", region_growing.run_region_growing_on_image,
+     {'engine': FLOOD_FILL, 'roi': True, 'full_resolution': True}),
+    ("level set", "level-set", level_set.run_level_set_on_image, {'roi': False}),
+    ("level set full", "level-set", level_set.run_level_set_on_image, {'roi': True, 'full_resolution': True}),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("images", nargs="+", help="paths of the images to segment")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[512, 1024, 2048], help="sides of the images")
+    args = parser.parse_args()
+
+    for path in args.images:
+        image = Image.open(path).convert("L")
+        for size in args.sizes:
+            encoded = BytesIO()
+            image.resize((size, size)).save(encoded, format="PNG")
+            image_base64 = base64.b64encode(encoded.getvalue()).decode('utf-8')
+            header = read_image_header(image_base64)
+            for name, algorithm, function, params in REQUESTS:
+                # the first run imports the libraries the request needs
+                function(image_base64, **params)
+                _, peak = measure_peak(function, image_base64, **params)
+                estimate = estimate_request_bytes(len(image_base64), *header, algorithm,
+                                                  params.get('full_resolution', False))
+                print("{} {}px {:16}: estimated {:6.1f} MB, measured {:6.1f} MB{}".format(
+                    path, size, name, estimate / 1e6, peak / 1e6, "" if estimate >= peak else "  UNDERESTIMATED"))
+
+
+if __name__ == "__main__":
+    main()
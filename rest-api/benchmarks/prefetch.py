@@ -0,0 +1,55 @@
+"""
+Segments a list of images with one of the golden corpus configurations, once loading every image right before
+segmenting it and once with the prefetching loader, which reads and preprocesses the next images on background
+threads, and reports the wall time of both and the time the segmentation waited for its images.
+
+Usage (from the rest-api directory):
+    python -m benchmarks.prefetch testing_images/*.pgm
+    python -m benchmarks.prefetch testing_images/*.pgm --config classic-predicted --depth 8 --repeat 3
+"""
+import argparse
+import time
+
+from segmentation.golden import CONFIGS, segment_mask
+from segmentation.loader import PREFETCH_DEPTH, Prefetching_Loader, load_preprocessed
+
+
+def run_batch(loader, config):
+    start = time.perf_counter()
+    waited = 0
+    images = iter(loader)
+    while True:
+        wait_start = time.perf_counter()
+        item = next(images, None)
+        waited += time.perf_counter() - wait_start
+        if item is None:
+            return time.perf_counter() - start, waited
+        segment_mask(item[1], **config)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("images", nargs="+", help="paths of the images to segment")
+    parser.add_argument("--config", default="flood-fill-predicted-roi", choices=sorted(CONFIGS))
+    parser.add_argument("--depth", type=int, default=PREFETCH_DEPTH, help="number of images loaded ahead")
+    parser.add_argument("--workers", type=int, default=2, help="number of loading threads")
+    parser.add_argument("--repeat", type=int, default=1, help="number of times the list of images is segmented")
+    args = parser.parse_args()
+
+    paths = args.images * args.repeat
+    config = CONFIGS[args.config]
+    # loads every image once so both runs read them from the page cache
+    for path in args.images:
+        load_preprocessed(path)
+
+    sequential = ((path, load_preprocessed(path)) for path in paths)
+    seconds, waited = run_batch(sequential, config)
+    print("sequential:  {:.3f}s, {:.3f}s loading".format(seconds, waited))
+    with Prefetching_Loader(paths, depth=args.depth, workers=args.workers) as loader:
+        seconds, waited = run_batch(loader, config)
+    print("prefetching: {:.3f}s, {:.3f}s waiting for images (depth {}, {} threads)".format(
+        seconds, waited, args.depth, args.workers))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Compares the results store with a CSV file of the same results. The results are the golden corpus outputs,
+repeated under other image names and input hashes up to the requested number. Reports the time to write them
+(one bulk insert, or rows inserted and committed one at a time as a runner without batching would), the time
+of cache lookups by input hash (scanning the CSV file or reading the index) and the time of the latency report.
+
+Usage (from the rest-api directory):
+    python -m benchmarks.results_store
+    python -m benchmarks.results_store --results 100000 --lookups 200
+"""
+import argparse
+import csv
+import os
+import random
+import statistics
+import tempfile
+import time
+from collections import defaultdict
+
+from segmentation.golden import load_corpus
+from segmentation.results_store import Results_Store, params_key
+
+CORPUS_PATH = "../testing/segmentation/golden_outputs.json"
+
+CSV_COLUMNS = ['image', 'input_hash', 'engine', 'params', 'hash', 'area', 'boundary', 'seconds']
+
+
+def make_entries(corpus, count):
+    """
+    Returns:
+        List of count store entries cycling through the outputs of the corpus.
+    """
+    outputs = [(name, config_name, output) for config_name, images in sorted(corpus['outputs'].items())
+               for name, output in sorted(images.items())]
+    return [{'image': "image{:06d}".format(i // len(corpus['outputs'])),
+             'config': corpus['configs'][outputs[i % len(outputs)][1]],
+             'result': dict(outputs[i % len(outputs)][2], input_hash="{:064x}".format(i // len(corpus['outputs'])))}
+            for i in range(count)]
+
+
+def csv_lookup(path, input_hash, params):
+    with open(path, newline='') as results_file:
+        for row in csv.DictReader(results_file):
+            if row['input_hash'] == input_hash and row['params'] == params:
+                return row
+    return None
+
+
+def csv_latency_report(path):
+    seconds = defaultdict(list)
+    with open(path, newline='') as results_file:
+        for row in csv.DictReader(results_file):
+            seconds[row['params']].append(float(row['seconds']))
+    return {params: statistics.median(values) for params, values in seconds.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", default=CORPUS_PATH, help="path of the golden corpus")
+    parser.add_argument("--results", type=int, default=50000, help="number of results")
+    parser.add_argument("--lookups", type=int, default=50, help="number of cache lookups")
+    parser.add_argument("--single-inserts", type=int, default=500,
+                        help="number of results inserted one transaction at a time")
+    args = parser.parse_args()
+
+    entries = make_entries(load_corpus(args.corpus), args.results)
+    directory = tempfile.mkdtemp()
+    csv_path = os.path.join(directory, "results.csv")
+    start = time.perf_counter()
+    with open(csv_path, 'w', newline='') as results_file:
+        writer = csv.writer(results_file)
+        writer.writerow(CSV_COLUMNS)
+        for entry in entries:
+            engine, params, _ = params_key(entry['config'])
+            result = entry['result']
+            writer.writerow([entry['image'], result['input_hash'], engine, params, result['hash'], result['area'],
+                             result['boundary'], result['seconds']])
+    print("{} results, csv written in {:.2f}s".format(len(entries), time.perf_counter() - start))
+
+    with Results_Store(os.path.join(directory, "results.db")) as store:
+        start = time.perf_counter()
+        store.add(entries)
+        bulk = time.perf_counter() - start
+        with Results_Store(os.path.join(directory, "single.db")) as single:
+            start = time.perf_counter()
+            for entry in entries[:args.single_inserts]:
+                single.add([entry])
+            one_at_a_time = (time.perf_counter() - start) / args.single_inserts * len(entries)
+        print("store: bulk insert {:.2f}s, one transaction per result {:.2f}s (extrapolated from {})".format(
+            bulk, one_at_a_time, args.single_inserts))
+
+        lookups = random.Random(0).sample(entries, args.lookups)
+        for name, lookup in [
+            ("csv scan", lambda entry: csv_lookup(csv_path, entry['result']['input_hash'],
+                                                  params_key(entry['config'])[1])),
+            ("store index", lambda entry: store.lookup(entry['result']['input_hash'], entry['config'])),
+        ]:
+            start = time.perf_counter()
+            found = sum(lookup(entry) is not None for entry in lookups)
+            print("{:12}: {:.3f}ms per cache lookup ({}/{} found)".format(
+                name, (time.perf_counter() - start) / len(lookups) * 1e3, found, len(lookups)))
+
+        start = time.perf_counter()
+        csv_latency_report(csv_path)
+        csv_report = time.perf_counter() - start
+        start = time.perf_counter()
+        store.latency_report()
+        print("latency report: csv {:.3f}s, store {:.3f}s".format(csv_report, time.perf_counter() - start))
+
+
+if __name__ == "__main__":
+    main()
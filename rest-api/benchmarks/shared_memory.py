@@ -0,0 +1,92 @@
+"""
+Compares handing the segmentation stage to worker processes by pickling its arrays (a plain ProcessPoolExecutor)
+with the shared memory worker pool, on what the API sends them: the preprocessed image of the working frame in,
+and the uint8 mask of region growing or the float32 level set function out. Decoding, preprocessing and rendering
+stay in the server process with the stage graph. Reports the bytes serialized per request and the round trip
+latency with a task that only returns a level set function sized result, with a flood fill segmentation and
+with a level set evolution.
+
+Usage (from the rest-api directory):
+    python -m benchmarks.shared_memory testing_images/*.pgm
+    python -m benchmarks.shared_memory testing_images/*.pgm --size 512
+"""
+import argparse
+import pickle
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import level_set
+import numpy as np
+import region_growing
+from segmentation import FLOOD_FILL, Deadline, Shared_Memory_Pool, read_image
+from segmentation.resolution import RESOLUTIONS
+from segmentation.stage_graph import preprocess_pixels
+from segmentation.transform import WORKING_SIZE
+from segmentation.worker_pool import Shared_Array, run_task
+
+
+def field(image, deadline=None):
+    # the size and type of a level set function
+    return image.astype(np.float32)
+
+
+def flood_fill(image, deadline=None, size=WORKING_SIZE):
+    return region_growing.find_segmentation(image, deadline=deadline, engine=FLOOD_FILL, roi=True, size=size)
+
+
+def pickled_call(function, image, **kwargs):
+    deadline = Deadline()
+    return function(image, deadline=deadline, **kwargs)
+
+
+def time_requests(run, images, repeat):
+    times = []
+    for _ in range(repeat):
+        for image in images:
+            start = time.perf_counter()
+            run(image)
+            times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("images", nargs="+", help="paths of the images to segment")
+    parser.add_argument("--size", type=int, default=WORKING_SIZE, choices=RESOLUTIONS,
+                        help="side of the working frame")
+    parser.add_argument("--workers", type=int, default=1, help="number of worker processes")
+    parser.add_argument("--repeat", type=int, default=20, help="number of times every image is sent")
+    args = parser.parse_args()
+
+    images = [preprocess_pixels(np.asarray(read_image(path)[0]), size=args.size)[0] for path in args.images]
+    image = images[0]
+    result = field(image)
+    pickled_bytes = len(pickle.dumps((pickled_call, field, image))) + len(pickle.dumps(result))
+    descriptor = Shared_Array("psm_0123abcd", image.shape, image.dtype.str)
+    shared_bytes = len(pickle.dumps((run_task, field, descriptor, "psm_0123abcd", 0, None, (), {}))) + \
+        len(pickle.dumps((Shared_Array("psm_0123abcd", result.shape, result.dtype.str), False)))
+    print("{}x{} working frame, bytes serialized per request: pickled {}, shared memory {}".format(
+        *image.shape, pickled_bytes, shared_bytes))
+
+    executor = ProcessPoolExecutor(max_workers=args.workers)
+    with Shared_Memory_Pool(args.workers) as pool:
+        pool.start()
+        for name, function, kwargs, repeat in [
+            ("transport only", field, {}, args.repeat),
+            ("flood fill", flood_fill, {'size': args.size}, 3),
+            ("level set", level_set.find_phi, {'size': args.size}, 1),
+        ]:
+            # warm up the workers
+            executor.submit(pickled_call, function, image, **kwargs).result()
+            pool.run(function, image, **kwargs)
+            pickled = time_requests(lambda i: executor.submit(pickled_call, function, i, **kwargs).result(), images,
+                                    repeat)
+            shared = time_requests(lambda i: pool.run(function, i, **kwargs), images, repeat)
+            print("{:15}: median round trip pickled {:.2f}ms, shared memory {:.2f}ms".format(
+                name, pickled * 1e3, shared * 1e3))
+    executor.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Sends every image through a sequence of requests that only differ in their segmentation parameters (engine,
+threshold selection, algorithm, full resolution), once without and once with the stage cache, and reports the
+time spent in every stage.
+
+Usage (from the rest-api directory):
+    python -m benchmarks.stage_graph testing_images/*.pgm
+"""
+import argparse
+import base64
+import time
+
+import level_set
+import region_growing
+from segmentation import CASCADE, CLASSIC, FLOOD_FILL, PREDICTED, Stage_Graph
+
+# parameters of the requests sent for every image, as (function, keyword arguments)
+REQUESTS = [
+    (region_growing.run_region_growing_on_image, {'threshold_mode': PREDICTED, 'engine': CLASSIC}),
+    (region_growing.run_region_growing_on_image, {'threshold_mode': CASCADE, 'engine': FLOOD_FILL, 'roi': True}),
+    (region_growing.run_region_growing_on_image, {'threshold_mode': PREDICTED, 'engine': FLOOD_FILL, 'roi': True}),
+    (region_growing.run_region_growing_on_image, {'threshold_mode': PREDICTED, 'engine': FLOOD_FILL, 'roi': True,
+                                                  'full_resolution': True}),
+    (level_set.run_level_set_on_image, {'roi': True}),
+    (level_set.run_level_set_on_image, {'roi': True, 'full_resolution': True}),
+]
+
+
+def run_requests(images, graph):
+    start = time.perf_counter()
+    for image_base64 in images:
+        for function, params in REQUESTS:
+            function(image_base64, graph=graph, **params)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("images", nargs="+", help="paths of the images to segment")
+    args = parser.parse_args()
+
+    images = []
+    for path in args.images:
+        with open(path, "rb") as image_file:
+            images.append(base64.b64encode(image_file.read()).decode('utf-8'))
+
+    for name, graph in [("without cache", Stage_Graph(0)), ("with cache", Stage_Graph())]:
+        total = run_requests(images, graph)
+        print("{}: {} requests in {:.2f}s".format(name, len(images) * len(REQUESTS), total))
+        for stage, stats in graph.timings.items():
+            print("    {:34} {:3} runs {:3} hits {:8.3f}s".format(stage, stats['runs'], stats['hits'],
+                                                                  stats['seconds']))
+
+
+if __name__ == "__main__":
+    main()
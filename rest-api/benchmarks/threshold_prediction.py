@@ -0,0 +1,50 @@
+"""
+Compares the histogram predicted threshold with the full threshold cascade of region growing.
+
+Usage (from the rest-api directory):
+    python -m benchmarks.threshold_prediction testing_images/*.pgm
+"""
+import argparse
+import time
+
+import numpy as np
+from segmentation import CASCADE, PREDICTED, THRESHOLDS, predict_threshold, preprocessing, read_image, region_growing
+
+
+def percentiles(timings):
+    return "p50 {:.2f}s  p90 {:.2f}s  max {:.2f}s  total {:.2f}s".format(
+        np.percentile(timings, 50), np.percentile(timings, 90), np.max(timings), np.sum(timings))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("images", nargs="+", help="paths of the images to segment")
+    parser.add_argument("--max-iter", type=int, default=6200)
+    args = parser.parse_args()
+
+    matches = 0
+    cascade_timings, predicted_timings = [], []
+    for path in args.images:
+        preprocessed_image = preprocessing(read_image(path)[0])
+
+        start = time.perf_counter()
+        cascade_result = region_growing(preprocessed_image, args.max_iter, neighbours=4, threshold_mode=CASCADE)
+        cascade_timings.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        predicted_result = region_growing(preprocessed_image, args.max_iter, neighbours=4, threshold_mode=PREDICTED)
+        predicted_timings.append(time.perf_counter() - start)
+
+        match = np.array_equal(cascade_result, predicted_result)
+        matches += match
+        print("{}: predicted threshold {}, {}, cascade {:.2f}s, predicted {:.2f}s".format(
+            path, predict_threshold(preprocessed_image, THRESHOLDS), "match" if match else "MISMATCH",
+            cascade_timings[-1], predicted_timings[-1]))
+
+    print("\nPrediction matches the cascade on {}/{} images".format(matches, len(args.images)))
+    print("cascade:   " + percentiles(cascade_timings))
+    print("predicted: " + percentiles(predicted_timings))
+
+
+if __name__ == "__main__":
+    main()
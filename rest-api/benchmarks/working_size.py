@@ -0,0 +1,53 @@
+"""
+Segments a list of images with one of the golden corpus configurations in working frames of every size of
+segmentation.RESOLUTIONS and reports, per size, the time the segmentations took and the Dice of their muscle
+masks with the masks of the 256 px frame, both mapped back onto the original images.
+
+Usage (from the rest-api directory):
+    python -m benchmarks.working_size testing_images/*.pgm
+    python -m benchmarks.working_size testing_images/*.pgm --config level-set
+"""
+import argparse
+import time
+
+import numpy as np
+
+from segmentation import RESOLUTIONS, WORKING_SIZE, preprocessing, read_image
+from segmentation.golden import CONFIGS, segment_mask
+
+
+def segment_original(image, config, size):
+    """
+    Returns:
+        Tuple of the muscle mask mapped onto the original image and the seconds the segmentation took.
+    """
+    preprocessed_image, transform = preprocessing(image, return_transform=True, size=size)
+    start = time.perf_counter()
+    mask = segment_mask(preprocessed_image, size=size, **config)
+    seconds = time.perf_counter() - start
+    return transform.mask_to_original(mask), seconds
+
+
+def dice(mask, reference):
+    total = np.count_nonzero(mask) + np.count_nonzero(reference)
+    return 2 * np.count_nonzero(mask & reference) / total if total else 1.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("images", nargs="+", help="paths of the images to segment")
+    parser.add_argument("--config", default="flood-fill-predicted-roi", choices=sorted(CONFIGS))
+    args = parser.parse_args()
+
+    config = CONFIGS[args.config]
+    images = [read_image(path)[0] for path in args.images]
+    references = [segment_original(image, config, WORKING_SIZE)[0] for image in images]
+    for size in RESOLUTIONS:
+        results = [segment_original(image, config, size) for image in images]
+        scores = [dice(mask, reference) for (mask, _), reference in zip(results, references)]
+        print("{:4} px: {:.3f}s, dice with {} px mean {:.4f} min {:.4f}".format(
+            size, sum(seconds for _, seconds in results), WORKING_SIZE, np.mean(scores), np.min(scores)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+# The level set algorithm lives in the segmentation package, this module wires it to the base64
+# images handled by the API.
+import numpy as np
+from segmentation.image_io import encode_base64_png
+from segmentation.level_set import DOUBLE_WELL, Level_Set
+from segmentation.stage_graph import Stage_Graph, decode_pixels, preprocess_pixels
+from segmentation.transform import WORKING_SIZE, spans_to_mask
+
+# one engine per thread count, so requests share the engine's thread pool
+level_set_engines = {}
+
+
+def get_level_set(threads):
+    if threads not in level_set_engines:
+        level_set_engines[threads] = Level_Set(DOUBLE_WELL, threads=threads)
+    return level_set_engines[threads]
+
+
+def run_level_set_on_image(image_base64, deadline=None, roi=False, threads=1, full_resolution=False, pool=None,
+                           graph=None, reduce=1, size=WORKING_SIZE):
+    # the stages before the one whose parameters changed are taken from the graph's cache
+    graph = graph if graph is not None else Stage_Graph(0)
+    # keyed by its pixels, so the same image in another encoding shares the stages after the decode
+    pixels = graph.by_content(graph.run("decode", decode_pixels, graph.source(image_base64), reduce=reduce))
+    preprocessed = graph.run("preprocess", preprocess_pixels, pixels, size=size)
+    # with a pool the preprocessed image and the level set function are handed over through shared memory
+    phi = graph.run("level-set", find_phi, preprocessed.item(0), deadline=deadline, pool=pool, roi=roi,
+                    threads=threads, size=size)
+    if full_resolution:
+        segmented_img = graph.run("render-level-set-full-resolution", render_full_resolution, pixels,
+                                  preprocessed.item(1), phi)
+    else:
+        segmented_img = graph.run("render-level-set", render, preprocessed.item(0), phi)
+    return graph.run("encode", encode_base64_png, segmented_img).value
+
+
+def find_phi(preprocessed_image, deadline=None, roi=False, threads=1, size=WORKING_SIZE):
+    return get_level_set(threads).find_image_lsf(preprocessed_image, deadline=deadline, roi=roi, size=size)
+
+
+def render(preprocessed_image, phi):
+    # segment_image blanks the muscle in place, the preprocessed image may be cached
+    return get_level_set(1).segment_image(phi, preprocessed_image.copy())
+
+
+def render_full_resolution(pixels, transform, phi):
+    # blank the muscle on the original image
+    start, end = transform.boundary_to_original(get_level_set(1).boundary(phi))
+    return np.where(spans_to_mask(start, end, transform.original_shape[1]), 0, pixels).astype(np.uint8)
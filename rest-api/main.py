@@ -1,8 +1,25 @@
 import region_growing
+import level_set
 from flask import request, Flask
 from flask_restful import reqparse
+import atexit
 import base64
+import os
+import threading
+from concurrent.futures.process import BrokenProcessPool
 from flask import abort, jsonify
+from segmentation.deadline import Deadline
+from segmentation.image_io import encode_base64_png, read_image_header
+from segmentation.kernels import warm_up
+from segmentation.memory import ENGINE_BYTES, Memory_Budget, estimate_request_bytes, fitting_reduction, measure_peak
+from segmentation.region_growing import CLASSIC, FLOOD_FILL
+from segmentation.resolution import RESOLUTIONS, scale_area, working_size_for_budget
+from segmentation.session import Level_Set_Session, Region_Growing_Session, Session_Store, max_iterations
+from segmentation.stage_graph import Stage_Graph, decode_pixels, preprocess_pixels
+from segmentation.threshold_selection import CASCADE, PREDICTED
+from segmentation.topology import plan_workers
+from segmentation.transform import WORKING_SIZE
+from segmentation.worker_pool import Shared_Memory_Pool
 
 '''
 Pectoral Muscle Segmentation API
@@ -11,15 +28,97 @@ and gives a JSON response with the segmented image in base64 encoded string.
 >> Usage
 Valid Methods = POST
 Valid Endpoint = /segment
+GET /stats gives the number of runs, cache hits, runs shared with a concurrent duplicate request and seconds
+spent in every stage of the requests so far
+POST /sessions keeps the preprocessed image and the state of its segmentation, follow-up requests to
+POST /sessions/<sessionId>/segment change 'threshold', 'maxIter', 'seed' ([x, y]) and 'thresholdSelection'
+(region growing) or 'iterations' (level set) and are answered from it, DELETE /sessions/<sessionId> drops it
 >> Sample API Request
 Make the request to
 http://127.0.0.1:5000/segment
 Ensure to include a JSON body containing 'base64Image' as an attribute
+Optionally include 'algorithm' ("region-growing" or "level-set"), 'timeBudget' (seconds)
+'thresholdSelection' ("cascade" or "predicted") and 'regionGrowingEngine' ("classic" or "flood-fill"),
+the last two only apply to region growing, and 'roi' (true or false) to segment only the estimated
+bounding box of the muscle and 'fullResolution' (true or false) to get the original image back at its
+full size with the muscle blanked, instead of the preprocessed image, and 'workingSize' (128, 256 or 512) or
+'pixelBudget' (the largest of those with at most that many pixels) for the side of the working frame the image
+is segmented in, 256 px by default; the parameters of the algorithms are scaled to it
 >> Sample Response
-{"segmentedImage" : "base_64_image_string"}
+{"segmentedImage" : "base_64_image_string", "partial": false, "downscaled": false, "workingSize": 256}
 '''
 app = Flask(__name__)
 
+# server-wide time budget (seconds) for a single segmentation, requests can override it with timeBudget
+app.config['SEGMENT_TIME_BUDGET'] = float(os.environ.get('SEGMENT_TIME_BUDGET', 25))
+
+# longest time budget (seconds) a request may ask for with timeBudget, longer ones are capped to it
+app.config['MAX_TIME_BUDGET'] = float(os.environ.get('MAX_TIME_BUDGET', 60))
+
+# number of threads a single level set segmentation is spread over
+app.config['LEVEL_SET_THREADS'] = int(os.environ.get('LEVEL_SET_THREADS', 1))
+
+# number of worker processes segmentations run in, images are handed over through shared memory (0 runs in process,
+# auto runs one per available core)
+app.config['SEGMENT_WORKERS'] = os.environ.get('SEGMENT_WORKERS', '0')
+
+# native threads (OpenCV, BLAS, OpenMP) of each worker process, 0 shares the available cores between the workers
+app.config['WORKER_THREADS'] = int(os.environ.get('WORKER_THREADS', 0))
+
+# pin every worker process to its own cores
+app.config['WORKER_AFFINITY'] = os.environ.get('WORKER_AFFINITY', '') == '1'
+
+# seconds the worker processes have to start and warm up, the segmentations run in the server process otherwise
+app.config['WORKER_START_TIMEOUT'] = float(os.environ.get('WORKER_START_TIMEOUT', 120))
+
+# memory (MB) the requests running at once may use, estimated from the image headers (0 disables the accounting)
+app.config['MEMORY_BUDGET_MB'] = float(os.environ.get('MEMORY_BUDGET_MB', 1024))
+
+# measure the peak memory of every request with tracemalloc and return it with the estimate
+app.config['MEMORY_DEBUG'] = os.environ.get('MEMORY_DEBUG', '') == '1'
+
+# memory budget (MB) of the cache of decoded, preprocessed and segmented images reused across requests
+app.config['STAGE_CACHE_MB'] = float(os.environ.get('STAGE_CACHE_MB', 64))
+
+# seconds an interactive session is kept after its last request
+app.config['SESSION_TTL'] = float(os.environ.get('SESSION_TTL', 600))
+
+# number of interactive sessions kept at once, the least recently used one is dropped first
+app.config['SESSION_LIMIT'] = int(os.environ.get('SESSION_LIMIT', 32))
+
+SEGMENTATION_ALGORITHMS = ["region-growing", "level-set"]
+THRESHOLD_SELECTIONS = [CASCADE, PREDICTED]
+REGION_GROWING_ENGINES = [CLASSIC, FLOOD_FILL]
+
+# caches the output of every stage of a request, keyed by the image and the parameters of the stages
+stage_graph = Stage_Graph(int(app.config['STAGE_CACHE_MB'] * 1024 * 1024))
+
+# requests whose estimated peak memory does not fit next to the running ones wait for them to finish
+memory_budget = Memory_Budget(int(app.config['MEMORY_BUDGET_MB'] * 1024 * 1024))
+
+# preprocessed images and segmentation states of the interactive sessions
+sessions = Session_Store(app.config['SESSION_TTL'], app.config['SESSION_LIMIT'],
+                         memory_budget if memory_budget.budget_bytes > 0 else None)
+
+# compile the JIT kernels (when Numba is installed) when the server starts rather than on the first request
+warm_up()
+
+# how the worker processes share the cores, None when the segmentations run in the server process
+worker_layout = None
+if app.config['SEGMENT_WORKERS'] != '0':
+    workers = app.config['SEGMENT_WORKERS']
+    worker_layout = plan_workers(None if workers == 'auto' else int(workers), app.config['WORKER_THREADS'] or None,
+                                 app.config['WORKER_AFFINITY'])
+    print("segmentation workers: {}, {} level set threads".format(worker_layout.describe(),
+                                                                       app.config['LEVEL_SET_THREADS']), flush=True)
+else:
+    print("segmentations run in the server process, {} level set threads".format(
+        app.config['LEVEL_SET_THREADS']), flush=True)
+
+# created on the first request, so every server process gets its own workers
+worker_pool = None
+worker_pool_lock = threading.Lock()
+
 base64_string_post_args = reqparse.RequestParser()
 base64_string_post_args.add_argument("base64 string", type=str, help="Please input string type")
 
@@ -83,8 +182,62 @@ def segment():
         if request.method == 'POST':
             # checking if the base64 string can be decoded
             if is_base64(base64str):
-                status_code = 200
-                response = {"segmentedImage": region_growing.run_region_growing_on_image(base64str)}
+                algorithm = request.get_json().get("algorithm", "region-growing")
+                time_budget = request.get_json().get("timeBudget", app.config['SEGMENT_TIME_BUDGET'])
+                threshold_mode = request.get_json().get("thresholdSelection", CASCADE)
+                engine = request.get_json().get("regionGrowingEngine", CLASSIC)
+                # the classic engine only visits the region itself, so the ROI only speeds up the other engines
+                roi = request.get_json().get("roi", algorithm == "level-set" or engine == FLOOD_FILL)
+                full_resolution = request.get_json().get("fullResolution", False)
+                size, size_error = get_working_size(request.get_json())
+                if algorithm not in SEGMENTATION_ALGORITHMS:
+                    status_code = 400
+                    response = create_error_message(
+                        "Please ensure algorithm is one of: " + ", ".join(SEGMENTATION_ALGORITHMS))
+                elif not is_valid_time_budget(time_budget):
+                    status_code = 400
+                    response = create_error_message("Please ensure timeBudget is a positive number of seconds")
+                elif threshold_mode not in THRESHOLD_SELECTIONS:
+                    status_code = 400
+                    response = create_error_message(
+                        "Please ensure thresholdSelection is one of: " + ", ".join(THRESHOLD_SELECTIONS))
+                elif engine not in REGION_GROWING_ENGINES:
+                    status_code = 400
+                    response = create_error_message(
+                        "Please ensure regionGrowingEngine is one of: " + ", ".join(REGION_GROWING_ENGINES))
+                elif not isinstance(roi, bool):
+                    status_code = 400
+                    response = create_error_message("Please ensure roi is either true or false")
+                elif not isinstance(full_resolution, bool):
+                    status_code = 400
+                    response = create_error_message("Please ensure fullResolution is either true or false")
+                elif size is None:
+                    status_code = 400
+                    response = create_error_message(size_error)
+                else:
+                    header = read_image_header(base64str)
+                    # the engines stop at the deadline and return the best result so far, flagged as partial
+                    deadline = Deadline(min(time_budget, app.config['MAX_TIME_BUDGET']))
+                    if header is None:
+                        status_code = 400
+                        response = create_error_message("Please ensure base64Image is an image")
+                    else:
+                        reduce, estimate, refusal = admit_request(base64str, header, algorithm, full_resolution,
+                                                                  size, deadline)
+                        if refusal is not None:
+                            response, status_code = refusal
+                        else:
+                            try:
+                                segmented_image, peak = run_segmentation(base64str, deadline, algorithm,
+                                                                         threshold_mode, engine, roi, full_resolution,
+                                                                         reduce, size)
+                            finally:
+                                release_request(estimate)
+                            status_code = 200
+                            response = {"segmentedImage": segmented_image, "partial": deadline.exceeded,
+                                        "downscaled": reduce > 1, "workingSize": size}
+                            if app.config['MEMORY_DEBUG']:
+                                response["memory"] = {"estimatedBytes": estimate, "peakBytes": peak}
             else:
                 status_code = 400
                 response = create_error_message("Please ensure your request includes a valid base64 string")
@@ -99,6 +252,275 @@ def segment():
     return response, status_code
 
 
+def admit_request(base64str, header, algorithm, full_resolution, size, deadline, state_bytes=0):
+    """
+    Admits a request under the memory budget: finds the largest image that fits it (full resolution results are
+    never downscaled) and waits until the request's estimated peak fits next to the requests already running.
+
+    Parameters:
+        state_bytes: bytes the request keeps after it ends (the state of a session), on top of its peak.
+
+    Returns:
+        Tuple of the factor the image is downscaled by, the estimated peak held in the budget, to be given back
+        with release_request, and None, or the refusal response and its status code if the request is not
+        admitted.
+    """
+    reduce = 1
+    if memory_budget.budget_bytes > 0:
+        reduce = fitting_reduction(memory_budget.budget_bytes - state_bytes, len(base64str), *header, algorithm,
+                                   full_resolution, size)
+        if full_resolution and reduce != 1:
+            reduce = None
+    if reduce is None:
+        return None, 0, (create_error_message("The image needs more memory than the server can give to a request, "
+                                              "please send a smaller image", 413), 413)
+    estimate = estimate_request_bytes(len(base64str), *header, algorithm, full_resolution, reduce, size) + state_bytes
+    if memory_budget.budget_bytes > 0 and not memory_budget.acquire(estimate, deadline.remaining()):
+        return None, 0, (create_error_message("The server is busy, please try again later", 503), 503)
+    return reduce, estimate, None
+
+
+def release_request(estimate):
+    if memory_budget.budget_bytes > 0:
+        memory_budget.release(estimate)
+
+
+def run_segmentation(base64str, deadline, algorithm, threshold_mode, engine, roi, full_resolution, reduce, size):
+    """
+    Runs the segmentation of a request, measuring its peak memory with tracemalloc in debug mode.
+
+    Returns:
+        Tuple of the base64 encoded segmented image and the peak number of bytes (None unless in debug mode).
+    """
+    if algorithm == "level-set":
+        args = (level_set.run_level_set_on_image, base64str, deadline, roi, app.config['LEVEL_SET_THREADS'],
+                full_resolution, get_worker_pool(), stage_graph, reduce, size)
+    else:
+        args = (region_growing.run_region_growing_on_image, base64str, deadline, threshold_mode, engine, roi,
+                full_resolution, get_worker_pool(), stage_graph, reduce, size)
+    if app.config['MEMORY_DEBUG']:
+        return measure_peak(*args)
+    return args[0](*args[1:]), None
+
+
+@app.route('/stats', methods=['GET'])
+def stats():
+    """
+    Number of runs, cache hits, runs coalesced with a concurrent request for the same image and parameters and
+    seconds spent in every stage of the segmentation requests so far.
+    """
+    return {"stages": stage_graph.timings}, 200
+
+
+@app.route('/sessions', methods=['POST'])
+def create_session():
+    """
+    Decodes and preprocesses an image, segments it and keeps the preprocessed image and the state of the
+    segmentation for follow-up requests to /sessions/<sessionId>/segment. Every parameter is checked before the
+    image is decoded, and the request is admitted under the memory budget like /segment, with the state the
+    session keeps.
+    """
+    body = request.get_json(silent=True)
+    if not isinstance(body, dict):
+        return create_error_message("Please ensure your request body includes a JSON object"), 400
+    size, size_error = get_working_size(body)
+    algorithm = body.get("algorithm", "region-growing")
+    params_error = check_session_params(body, algorithm == "level-set", size=size or WORKING_SIZE)
+    if 'base64Image' not in body:
+        status_code = 400
+        response = create_error_message("Please ensure your request body includes the base64Image attribute")
+    elif not is_base64(body['base64Image']):
+        status_code = 400
+        response = create_error_message("Please ensure your request includes a valid base64 string")
+    elif algorithm not in SEGMENTATION_ALGORITHMS:
+        status_code = 400
+        response = create_error_message("Please ensure algorithm is one of: " + ", ".join(SEGMENTATION_ALGORITHMS))
+    elif size is None:
+        status_code = 400
+        response = create_error_message(size_error)
+    elif params_error is not None:
+        status_code = 400
+        response = create_error_message(params_error)
+    else:
+        header = read_image_header(body['base64Image'])
+        deadline = Deadline(request_time_budget(body))
+        if header is None:
+            status_code = 400
+            response = create_error_message("Please ensure base64Image is an image")
+        else:
+            if algorithm == "level-set":
+                state_bytes = Level_Set_Session.state_bound(size, body.get("iterations"))
+            else:
+                state_bytes = Region_Growing_Session.state_bound(size)
+            reduce, estimate, refusal = admit_request(body['base64Image'], header, algorithm, False, size, deadline,
+                                                      state_bytes)
+            if refusal is not None:
+                response, status_code = refusal
+            else:
+                try:
+                    # the decode and preprocess stages are shared with /segment through the stage cache. The
+                    # session keeps the state of the segmentation for the follow-up requests, so it runs in the
+                    # server process
+                    pixels = stage_graph.by_content(stage_graph.run("decode", decode_pixels,
+                                                                    stage_graph.source(body['base64Image']),
+                                                                    reduce=reduce))
+                    preprocessed_image = stage_graph.run("preprocess", preprocess_pixels, pixels, size=size).value[0]
+                    if algorithm == "level-set":
+                        session = Level_Set_Session(preprocessed_image, app.config['LEVEL_SET_THREADS'], size=size)
+                    else:
+                        session = Region_Growing_Session(preprocessed_image, size=size)
+                    response, status_code = segment_session(session, body, deadline)
+                finally:
+                    release_request(estimate)
+                if status_code == 200:
+                    status_code = 201
+                    response["sessionId"] = sessions.add(session)
+                    response["expiresIn"] = sessions.ttl
+                    response["workingSize"] = size
+                    response["downscaled"] = reduce > 1
+    return response, status_code
+
+
+@app.route('/sessions/<session_id>/segment', methods=['POST'])
+def resegment_session(session_id):
+    """
+    Segments the image of a session again with other parameters, from the state kept in the session. The request
+    is admitted under the memory budget with the engine's peak and what the state of the session may grow by.
+    """
+    body = request.get_json(silent=True)
+    session = sessions.get(session_id)
+    if session is None:
+        status_code = 404
+        response = create_error_message("The session does not exist or has expired", status_code)
+    elif not isinstance(body, dict):
+        status_code = 400
+        response = create_error_message("Please ensure your request body includes a JSON object")
+    else:
+        level_set_session = isinstance(session, Level_Set_Session)
+        error = check_session_params(body, level_set_session, session.image.shape, session.size)
+        if error is not None:
+            return create_error_message(error), 400
+        deadline = Deadline(request_time_budget(body))
+        if level_set_session:
+            estimate = scale_area(ENGINE_BYTES["level-set"], session.size) + \
+                session.growth_bound(body.get("iterations"))
+        else:
+            estimate = scale_area(ENGINE_BYTES["region-growing"], session.size) + session.growth_bound()
+        if memory_budget.budget_bytes > 0 and not memory_budget.acquire(estimate, deadline.remaining()):
+            return create_error_message("The server is busy, please try again later", 503), 503
+        try:
+            response, status_code = segment_session(session, body, deadline)
+        finally:
+            # the grown state is held before the bound it grew within is given back
+            sessions.account(session_id)
+            release_request(estimate)
+    return response, status_code
+
+
+@app.route('/sessions/<session_id>', methods=['DELETE'])
+def delete_session(session_id):
+    if not sessions.remove(session_id):
+        return create_error_message("The session does not exist or has expired", 404), 404
+    return {"deleted": True}, 200
+
+
+def check_session_params(body, level_set_session, shape=None, size=WORKING_SIZE):
+    """
+    Validates the parameters of a session request.
+
+    Parameters:
+        body: JSON object of the request.
+        level_set_session: whether the session segments with the level set, region growing otherwise.
+        shape: shape of the preprocessed image of the session, the seed is only checked to be in it when given.
+        size: side of the working frame of the session, the number of iterations is capped for it.
+
+    Returns:
+        The error message, or None if the parameters are valid.
+    """
+    if not is_valid_time_budget(body.get("timeBudget", app.config['SEGMENT_TIME_BUDGET'])):
+        return "Please ensure timeBudget is a positive number of seconds"
+    if level_set_session:
+        if "iterations" in body and not (is_positive_integer(body["iterations"]) and
+                                         body["iterations"] <= max_iterations(size)):
+            return "Please ensure iterations is a positive integer of at most {}".format(max_iterations(size))
+        return None
+    threshold = body.get("threshold")
+    seed = body.get("seed", [1, 1])
+    if threshold is not None and not (is_number(threshold) and threshold >= 2.5):
+        return "Please ensure threshold is a number of at least 2.5"
+    if not is_positive_integer(body.get("maxIter", 6200)):
+        return "Please ensure maxIter is a positive integer"
+    if not (isinstance(seed, list) and len(seed) == 2 and all(is_integer(value) for value in seed) and
+            all(value >= 0 for value in seed)):
+        return "Please ensure seed is an [x, y] pixel of the preprocessed image"
+    if shape is not None and not (seed[0] < shape[1] and seed[1] < shape[0]):
+        return "Please ensure seed is an [x, y] pixel of the {}x{} preprocessed image".format(shape[1], shape[0])
+    if body.get("thresholdSelection", CASCADE) not in THRESHOLD_SELECTIONS:
+        return "Please ensure thresholdSelection is one of: " + ", ".join(THRESHOLD_SELECTIONS)
+    return None
+
+
+def segment_session(session, body, deadline=None):
+    """
+    Validates the parameters of a session request and segments the image of the session with them.
+
+    Parameters:
+        deadline: Deadline of the request, made from its timeBudget if None.
+
+    Returns:
+        Tuple of the response and its status code.
+    """
+    error = check_session_params(body, isinstance(session, Level_Set_Session), session.image.shape, session.size)
+    if error is not None:
+        return create_error_message(error), 400
+    if deadline is None:
+        deadline = Deadline(request_time_budget(body))
+    if isinstance(session, Level_Set_Session):
+        iterations = body.get("iterations", session.params['iter_outer'])
+        phi = session.segment(iterations, deadline)
+        segmented_image = level_set.render(session.image, phi)
+        response = {"iterations": iterations}
+    else:
+        threshold = body.get("threshold")
+        max_iter = body.get("maxIter", 6200)
+        seed = body.get("seed", [1, 1])
+        threshold_mode = body.get("thresholdSelection", CASCADE)
+        segmentation, threshold = session.segment(threshold, max_iter, seed, threshold_mode, deadline)
+        segmented_image = region_growing.render(session.image, segmentation)
+        response = {"threshold": threshold}
+    response.update({"segmentedImage": encode_base64_png(segmented_image), "partial": deadline.exceeded})
+    return response, 200
+
+
+def get_worker_pool():
+    """
+    Returns the Shared_Memory_Pool the segmentations run in, or None if they run in the server process. Every
+    worker is started and prewarmed before the first request is segmented. If the workers do not start within
+    WORKER_START_TIMEOUT seconds, or die while they start, the pool is closed and the segmentations run in the
+    server process from then on.
+    """
+    global worker_pool, worker_layout
+    with worker_pool_lock:
+        if worker_pool is None and worker_layout is not None:
+            pool = Shared_Memory_Pool(worker_layout.workers, threads=worker_layout.threads,
+                                      affinity=app.config['WORKER_AFFINITY'])
+            try:
+                started = pool.start(app.config['WORKER_START_TIMEOUT'])
+                error = "they did not start within {} seconds".format(app.config['WORKER_START_TIMEOUT'])
+            except BrokenProcessPool as broken:
+                started = False
+                error = "a worker died while it started ({})".format(broken)
+            if started:
+                worker_pool = pool
+                atexit.register(worker_pool.close)
+            else:
+                pool.close(wait=False)
+                worker_layout = None
+                print("segmentation workers failed, {}: segmentations run in the server process".format(error),
+                      flush=True)
+    return worker_pool
+
+
 def is_base64(sb):
     try:
         if isinstance(sb, str):
@@ -113,5 +535,53 @@ def is_base64(sb):
         return False
 
 
+def get_working_size(body):
+    """
+    Finds the side of the working frame a request asks for with workingSize or pixelBudget, WORKING_SIZE if it
+    gives neither.
+
+    Returns:
+        Tuple of the size and None, or of None and the error message if the request is not valid.
+    """
+    working_size = body.get("workingSize")
+    pixel_budget = body.get("pixelBudget")
+    if working_size is not None and pixel_budget is not None:
+        return None, "Please ensure only one of workingSize and pixelBudget is given"
+    if working_size is not None:
+        if not (is_integer(working_size) and working_size in RESOLUTIONS):
+            return None, "Please ensure workingSize is one of: " + ", ".join(str(size) for size in RESOLUTIONS)
+        return working_size, None
+    if pixel_budget is not None:
+        if not is_positive_integer(pixel_budget):
+            return None, "Please ensure pixelBudget is a positive integer"
+        return working_size_for_budget(pixel_budget), None
+    return WORKING_SIZE, None
+
+
+def request_time_budget(body):
+    """
+    Returns:
+        The seconds a request may run for: its timeBudget, SEGMENT_TIME_BUDGET if it has none, at most
+        MAX_TIME_BUDGET.
+    """
+    return min(body.get("timeBudget", app.config['SEGMENT_TIME_BUDGET']), app.config['MAX_TIME_BUDGET'])
+
+
+def is_valid_time_budget(time_budget):
+    return is_number(time_budget) and time_budget > 0
+
+
+def is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def is_integer(value):
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def is_positive_integer(value):
+    return is_integer(value) and value > 0
+
+
 if __name__ == '__main__':
     app.run(debug=False)
\ No newline at end of file
@@ -0,0 +1,22 @@
+"""
+Pectoral muscle segmentation package.
+
+Importing the package has no side effects and only loads numpy. Codec (PIL, OpenCV, pydicom),
+plotting (matplotlib) and scientific (scipy, scikit-image) libraries are imported by the functions
+that use them, which keeps API cold starts and process-pool worker start up fast.
+"""
+from .checkpoint import Checkpoint, image_hash
+from .deadline import Deadline
+from .dtypes import DEFAULT_POLICY, REFERENCE_POLICY, Dtype_Policy
+from .flood_fill import Flood_Fill
+from .image_io import decode_base64_image, encode_base64_png, read_image
+from .level_set import DOUBLE_WELL, SINGLE_WELL, Level_Set
+from .loader import Prefetching_Loader
+from .preprocessing import Preprocessed_Batch, left_align, perform_contrast, preprocess_batch, preprocess_image, \
+    preprocessing, remove_bar
+from .region_growing import CLASSIC, FLOOD_FILL, THRESHOLDS, Region_Growing, find_region, region_growing
+from .resolution import RESOLUTIONS, working_size_for_budget
+from .stage_graph import Stage_Graph, Stage_Result
+from .threshold_selection import CASCADE, PREDICTED, predict_threshold
+from .transform import WORKING_SIZE, Preprocessing_Transform, row_boundary, spans_to_mask
+from .worker_pool import Shared_Memory_Pool
@@ -0,0 +1,72 @@
+# ## Level set checkpoints
+# The state of a level set evolution after a number of outer iterations, stored as a small npz file so an
+# evolution can be resumed after an interruption, continued with more iterations or used as the starting
+# point of a run with other parameters.
+import hashlib
+import json
+import os
+
+import numpy as np
+
+# parameters of find_lsf a checkpoint can only be resumed (rather than warm started) with if they are unchanged
+EVOLUTION_PARAMS = ['timestep', 'iter_inner', 'lmda', 'alfa', 'epsilon', 'sigma', 'potential_function']
+
+
+def image_hash(img):
+    """
+    Parameters:
+        img: numpy array of the image.
+
+    Returns:
+        Hex digest identifying the shape, dtype and pixels of the image.
+    """
+    img = np.ascontiguousarray(img)
+    digest = hashlib.sha256("{}{}".format(img.shape, img.dtype.str).encode())
+    digest.update(img.data)
+    return digest.hexdigest()
+
+
+class Checkpoint:
+    """
+    State of a level set evolution after outer_iterations iterations of the outer loop of find_lsf (before the
+    refinement, which is always run again from it).
+
+    Parameters:
+        phi: level set function.
+        outer_iterations: number of outer iterations phi has been evolved for.
+        params: dictionary of the EVOLUTION_PARAMS the evolution was run with.
+        image_hash: image_hash of the image the evolution was run on.
+    """
+
+    def __init__(self, phi, outer_iterations, params, image_hash):
+        self.phi = phi
+        self.outer_iterations = outer_iterations
+        self.params = params
+        self.image_hash = image_hash
+
+    def save(self, path):
+        """
+        Writes the checkpoint to an npz file. The file is written next to path first and then renamed, so an
+        interrupted save leaves the previous checkpoint intact.
+        """
+        tmp_path = path + ".tmp.npz"
+        np.savez(tmp_path, phi=self.phi, outer_iterations=self.outer_iterations,
+                 params=json.dumps(self.params, sort_keys=True), image_hash=self.image_hash)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Reads a checkpoint written by save.
+        """
+        with np.load(path) as data:
+            return cls(data["phi"], int(data["outer_iterations"]), json.loads(str(data["params"])),
+                       str(data["image_hash"]))
+
+    def resumes(self, params):
+        """
+        Returns:
+            True if an evolution with the given find_lsf parameters continues this one, False if it only starts
+            from its phi.
+        """
+        return all(self.params.get(name) == params[name] for name in EVOLUTION_PARAMS)
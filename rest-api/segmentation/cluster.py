@@ -0,0 +1,500 @@
+# ## Coordinator and workers over HTTP
+# Spreads the segmentation of a set of images over several machines without a message broker. A coordinator
+# hands out image ids to workers and collects their results over plain HTTP with JSON bodies (only the standard
+# library on both sides). Workers send heartbeats while they work; the tasks leased by a worker that missed its
+# heartbeats are handed out again, and the first result committed for an image is the only one kept, so every
+# image gets exactly one result even when a worker comes back late or a commit is retried.
+#
+# Protocol (POST, JSON bodies):
+#     /register  {}                                    -> {"worker": id}
+#     /heartbeat {"worker"}                            -> {}
+#     /lease     {"worker"}                            -> {"task": {"lease", "image", "config"} or null, "finished"}
+#     /commit    {"worker", "lease", "image", "result" or "error"} -> {"committed"}
+#     /status    {}                                    -> {"tasks", "pending", "leased", "committed", "workers"}
+#
+# There is no authentication, the coordinator is meant for a trusted local network.
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import Counter, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# seconds between the heartbeats of a worker
+HEARTBEAT_INTERVAL = 2.0
+
+# seconds without a heartbeat (or any other request) after which a worker is considered dead
+HEARTBEAT_TIMEOUT = 10.0
+
+# seconds a worker waits before asking again when every remaining task is leased to another worker
+POLL_INTERVAL = 0.5
+
+# number of times an image is handed out before it is committed as failed, a worker dying counts as a failure
+MAX_ATTEMPTS = 3
+
+# seconds a worker waits for a reply of the coordinator
+REQUEST_TIMEOUT = 30.0
+
+# seconds between the checks of run_local on its worker processes
+PROCESS_CHECK_INTERVAL = 1.0
+
+
+class Coordinator:
+    """
+    Hands out the images to segment to workers and commits exactly one result per image.
+
+    Parameters:
+        tasks: dictionary of the configuration (JSON serializable) of every image by image id. The workers have
+               to be able to read the images from their ids, e.g. paths on shared storage.
+        host, port: address to listen on, port 0 picks a free port.
+        heartbeat_timeout: seconds without a request after which a worker is considered dead.
+        max_attempts: number of times an image is handed out before it is committed as failed.
+        results_path: optional JSON lines file every committed result is appended to. The images it already
+                      holds results for are not handed out again, so a coordinator that was stopped resumes.
+    """
+
+    def __init__(self, tasks, host="127.0.0.1", port=0, heartbeat_timeout=HEARTBEAT_TIMEOUT,
+                 max_attempts=MAX_ATTEMPTS, results_path=None):
+        self.tasks = dict(tasks)
+        self.heartbeat_timeout = heartbeat_timeout
+        self.max_attempts = max_attempts
+        self.results_path = results_path
+        self.results = {}
+        if results_path is not None and os.path.exists(results_path):
+            with open(results_path) as results_file:
+                for line in results_file:
+                    entry = json.loads(line)
+                    # the file may also hold the results of other image sets
+                    if entry['image'] in self.tasks:
+                        self.results[entry['image']] = entry['result']
+        self.pending = deque(image for image in self.tasks if image not in self.results)
+        # image and worker of every lease by lease id
+        self.leases = {}
+        # time of the last request of every worker by worker id
+        self.workers = {}
+        self.attempts = Counter()
+        self.next_worker = 0
+        self.next_lease = 0
+        self.lock = threading.Condition()
+        self.server = ThreadingHTTPServer((host, port), Request_Handler)
+        self.server.daemon_threads = True
+        self.server.coordinator = self
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return "http://{}:{}".format(host, port)
+
+    def start(self):
+        """
+        Serves the workers from a background thread.
+        """
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def close(self):
+        if self.thread is not None:
+            self.server.shutdown()
+            self.thread.join()
+            self.thread = None
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def finished(self):
+        return all(image in self.results for image in self.tasks)
+
+    def wait(self, timeout=None):
+        """
+        Waits until every image has a result, handing out the tasks of dead workers again meanwhile.
+
+        Returns:
+            True if every image has a result, False if the timeout ran out first.
+        """
+        end = None if timeout is None else time.monotonic() + timeout
+        with self.lock:
+            while not self.finished():
+                remaining = None if end is None else end - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                wait = self.heartbeat_timeout / 2
+                self.lock.wait(wait if remaining is None else min(wait, remaining))
+                self.reap()
+            return True
+
+    def live_workers(self):
+        """
+        Returns:
+            Number of workers that sent a heartbeat within the heartbeat timeout.
+        """
+        with self.lock:
+            self.reap()
+            return len(self.workers)
+
+    def reap(self):
+        """
+        Forgets the workers that missed their heartbeats and hands out their tasks again. Called with the lock
+        held.
+        """
+        now = time.monotonic()
+        dead = {worker for worker, seen in self.workers.items() if now - seen > self.heartbeat_timeout}
+        for worker in dead:
+            del self.workers[worker]
+        for lease, (image, worker) in list(self.leases.items()):
+            if worker in dead:
+                del self.leases[lease]
+                self.fail(image, "worker {} stopped sending heartbeats".format(worker))
+
+    def fail(self, image, error):
+        """
+        Hands an image out again after a failed attempt, or commits the error once it ran out of attempts.
+        Called with the lock held.
+        """
+        if image in self.results:
+            return
+        self.attempts[image] += 1
+        if self.attempts[image] >= self.max_attempts:
+            self.commit_result(image, {'error': error})
+        elif image not in self.pending and not any(leased == image for leased, _ in self.leases.values()):
+            # tasks handed out again go first, so a failing image is retried while its error is fresh
+            self.pending.appendleft(image)
+
+    def commit_result(self, image, result):
+        """
+        Keeps the result of an image and appends it to the results file. Called with the lock held.
+        """
+        self.results[image] = result
+        if image in self.pending:
+            self.pending.remove(image)
+        if self.results_path is not None:
+            with open(self.results_path, 'a') as results_file:
+                results_file.write(json.dumps({'image': image, 'result': result}) + '\n')
+                results_file.flush()
+                os.fsync(results_file.fileno())
+        self.lock.notify_all()
+
+    def seen(self, worker):
+        # any request of a worker counts as a heartbeat, a worker that was considered dead is taken back
+        self.workers[worker] = time.monotonic()
+
+    def register(self, body):
+        with self.lock:
+            worker = self.next_worker
+            self.next_worker += 1
+            self.seen(worker)
+            return {'worker': worker}
+
+    def heartbeat(self, body):
+        with self.lock:
+            self.seen(body['worker'])
+            return {}
+
+    def lease(self, body):
+        with self.lock:
+            self.seen(body['worker'])
+            self.reap()
+            if not self.pending:
+                return {'task': None, 'finished': self.finished()}
+            image = self.pending.popleft()
+            lease = self.next_lease
+            self.next_lease += 1
+            self.leases[lease] = (image, body['worker'])
+            return {'task': {'lease': lease, 'image': image, 'config': self.tasks[image]}, 'finished': False}
+
+    def commit(self, body):
+        """
+        Commits the result of a lease. Only the first result of an image is kept: a retried commit, or the late
+        result of a worker whose task was handed out again, is acknowledged without being committed. A commit of
+        an image that is not a task, or whose lease was never handed out for that image, is rejected.
+        """
+        with self.lock:
+            self.seen(body['worker'])
+            image = body['image']
+            if image not in self.tasks:
+                raise ValueError("{!r} is not an image of this coordinator".format(image))
+            if body['lease'] not in self.leases:
+                # a lease that was given up on (the worker missed its heartbeats) or already committed
+                if not 0 <= body['lease'] < self.next_lease:
+                    raise ValueError("lease {!r} was never handed out".format(body['lease']))
+                return {'committed': False}
+            if self.leases[body['lease']] != (image, body['worker']):
+                raise ValueError("lease {!r} is not for image {!r} of worker {!r}".format(
+                    body['lease'], image, body['worker']))
+            del self.leases[body['lease']]
+            if image in self.results:
+                return {'committed': False}
+            if 'error' in body:
+                self.fail(image, body['error'])
+                return {'committed': image in self.results}
+            self.commit_result(image, body['result'])
+            return {'committed': True}
+
+    def status(self, body):
+        with self.lock:
+            return {'tasks': len(self.tasks), 'pending': len(self.pending), 'leased': len(self.leases),
+                    'committed': len(self.results), 'workers': len(self.workers)}
+
+
+class Request_Handler(BaseHTTPRequestHandler):
+    """
+    Calls the coordinator method named by the path with the JSON body and replies with its JSON result.
+    """
+
+    routes = {'/register', '/heartbeat', '/lease', '/commit', '/status'}
+
+    def do_POST(self):
+        if self.path not in self.routes:
+            self.send_error(404)
+            return
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            body = json.loads(self.rfile.read(length) or b'{}')
+            if not isinstance(body, dict):
+                raise ValueError("the body must be a JSON object")
+            reply = json.dumps(getattr(self.server.coordinator, self.path[1:])(body)).encode()
+        except (ValueError, KeyError, TypeError) as error:
+            # malformed bodies, or fields of the wrong type such as an unhashable worker id
+            self.send_error(400, str(error))
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(reply)))
+        self.end_headers()
+        self.wfile.write(reply)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def post(url, path, body=None, timeout=REQUEST_TIMEOUT):
+    """
+    Sends a request of the protocol to the coordinator at url.
+
+    Returns:
+        Dictionary of the JSON reply.
+    """
+    request = urllib.request.Request(url + path, json.dumps(body or {}).encode(),
+                                     {'Content-Type': 'application/json'})
+    with urllib.request.urlopen(request, timeout=timeout) as reply:
+        return json.load(reply)
+
+
+def segment_task(image, config):
+    """
+    Default task of the workers: reads the image from its path, runs a segmentation configuration on it and
+    returns the result in the format of the golden output corpus.
+
+    Parameters:
+        image: path of the image.
+        config: keyword arguments of segmentation.golden.segment_mask, its size is also the side of the working
+                frame the image is preprocessed to.
+
+    Returns:
+        Dictionary with the hash, shape, area and encoded per-row boundary of the muscle mask, the time it took
+        and the hash of the decoded pixels of the image (input_hash).
+    """
+    import numpy as np
+
+    from .checkpoint import image_hash
+    from .golden import golden_output, segment_mask
+    from .image_io import read_image
+    from .preprocessing import preprocessing
+    from .transform import WORKING_SIZE
+
+    start = time.perf_counter()
+    decoded = read_image(image)[0]
+    mask = segment_mask(preprocessing(decoded, size=config.get('size', WORKING_SIZE)), **config)
+    return dict(golden_output(mask, time.perf_counter() - start), input_hash=image_hash(np.asarray(decoded)))
+
+
+def run_worker(url, task=segment_task, heartbeat_interval=HEARTBEAT_INTERVAL, poll_interval=POLL_INTERVAL):
+    """
+    Leases images from the coordinator at url and commits their results until every image has one or the
+    coordinator is gone. Heartbeats are sent from a background thread while a task runs.
+
+    Parameters:
+        url: address of the coordinator, e.g. "http://10.0.0.2:8765".
+        task: function taking the image id and its configuration and returning a JSON serializable result.
+              Exceptions are reported to the coordinator, which hands the image out again.
+
+    Returns:
+        Number of results this worker committed.
+    """
+    worker = post(url, "/register")['worker']
+    stopped = threading.Event()
+
+    def send_heartbeats():
+        while not stopped.wait(heartbeat_interval):
+            try:
+                post(url, "/heartbeat", {'worker': worker})
+            except OSError:
+                pass
+
+    threading.Thread(target=send_heartbeats, daemon=True).start()
+    committed = 0
+    try:
+        while True:
+            try:
+                reply = post(url, "/lease", {'worker': worker})
+            except urllib.error.URLError:
+                # the coordinator stops once every image has a result
+                return committed
+            if reply['task'] is None:
+                if reply['finished']:
+                    return committed
+                time.sleep(poll_interval)
+                continue
+            lease = reply['task']
+            try:
+                outcome = {'result': task(lease['image'], lease['config'])}
+            except Exception as error:
+                outcome = {'error': "{}: {}".format(type(error).__name__, error)}
+            reply = post(url, "/commit", dict(outcome, worker=worker, lease=lease['lease'], image=lease['image']))
+            committed += reply['committed']
+    finally:
+        stopped.set()
+
+
+def run_local_worker(url, layout, counter, task=segment_task):
+    """
+    Worker process of run_local: sets up its threads and cores like a worker of a pool, then runs run_worker.
+    """
+    from .topology import start_worker
+
+    start_worker(layout, counter)
+    run_worker(url, task)
+
+
+def run_local(tasks, workers=None, results_path=None, threads=None, affinity=False, task=segment_task,
+              **coordinator_args):
+    """
+    Runs a coordinator and worker processes on localhost until every image has a result. The tasks of a worker
+    process that dies are handed out again to the others once its heartbeats are missed.
+
+    Parameters:
+        workers, threads, affinity: layout of the worker processes over the cores, see
+                                    segmentation.topology.plan_workers.
+        task: function the workers run on every image, see run_worker.
+
+    Returns:
+        Dictionary of the result of every image by image id.
+
+    Raises:
+        RuntimeError: if every worker process exited before every image had a result.
+    """
+    from multiprocessing import Process, Value
+
+    from .topology import plan_workers
+
+    layout = plan_workers(workers, threads, affinity)
+    counter = Value('i', 0)
+    with Coordinator(tasks, results_path=results_path, **coordinator_args) as coordinator:
+        processes = [Process(target=run_local_worker, args=(coordinator.url, layout, counter, task))
+                     for _ in range(layout.workers)]
+        for process in processes:
+            process.start()
+        while not coordinator.wait(PROCESS_CHECK_INTERVAL):
+            # the last worker may have committed the last result just before it exited
+            if not any(process.is_alive() for process in processes) and not coordinator.wait(0):
+                raise RuntimeError("every worker process exited (exit codes {}) with {} of {} images left".format(
+                    ", ".join(str(process.exitcode) for process in processes),
+                    len(tasks) - len(coordinator.results), len(tasks)))
+        for process in processes:
+            process.join()
+        return coordinator.results
+
+
+def main():
+    from .golden import CONFIGS
+    from .resolution import RESOLUTIONS, working_size_for_budget
+    from .topology import plan_workers, start_worker
+    from .transform import WORKING_SIZE
+
+    parser = argparse.ArgumentParser(
+        prog="python -m segmentation.cluster",
+        description="Segments images with workers spread over several machines. Run from the rest-api directory:\n"
+                    "  coordinator: python -m segmentation.cluster coordinator images... --host 0.0.0.0 "
+                    "--port 8765 --results results.jsonl\n"
+                    "  workers:     python -m segmentation.cluster worker http://<coordinator>:8765\n"
+                    "  localhost:   python -m segmentation.cluster local images... --workers 4",
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+    for command in ["coordinator", "local"]:
+        subparser = commands.add_parser(command)
+        subparser.add_argument("images", nargs="+", help="paths of the images, readable by every worker")
+        subparser.add_argument("--config", default="flood-fill-predicted-roi", choices=sorted(CONFIGS),
+                               help="segmentation configuration")
+        subparser.add_argument("--results", help="JSON lines file the results are appended to")
+        subparser.add_argument("--store", help="results store (SQLite database) the results are inserted into")
+        resolution = subparser.add_mutually_exclusive_group()
+        resolution.add_argument("--working-size", type=int, choices=RESOLUTIONS, default=WORKING_SIZE,
+                                help="side of the working frame the images are segmented in")
+        resolution.add_argument("--pixel-budget", type=int,
+                                help="number of pixels of the working frame, the largest working size that fits")
+    commands.choices["coordinator"].add_argument("--host", default="127.0.0.1", help="address to listen on")
+    commands.choices["coordinator"].add_argument("--port", type=int, default=8765, help="port to listen on")
+    commands.choices["coordinator"].add_argument("--idle-timeout", type=float,
+                                                 help="seconds without any live worker after which to stop with "
+                                                      "the images left unsegmented, waits for workers by default")
+    commands.choices["local"].add_argument("--workers", type=int,
+                                           help="number of worker processes, one per available core by default")
+    commands.choices["local"].add_argument("--affinity", action="store_true",
+                                           help="pin every worker process to its own cores")
+    commands.add_parser("worker").add_argument("url", help="address of the coordinator")
+    for command in ["local", "worker"]:
+        commands.choices[command].add_argument("--threads", type=int,
+                                               help="native threads of each worker process, by default the "
+                                                    "available cores shared between the workers")
+    args = parser.parse_args()
+
+    if args.command == "worker":
+        layout = plan_workers(1, args.threads)
+        print("worker with {}".format(layout.describe()))
+        start_worker(layout)
+        print("committed {} results".format(run_worker(args.url)))
+        return
+    size = args.working_size if args.pixel_budget is None else working_size_for_budget(args.pixel_budget)
+    tasks = {path: dict(CONFIGS[args.config], size=size) for path in args.images}
+    start = time.perf_counter()
+    if args.command == "local":
+        layout = plan_workers(args.workers, args.threads, args.affinity)
+        print("segmenting {} images with {}".format(len(tasks), layout.describe()))
+        try:
+            results = run_local(tasks, layout.workers, args.results, layout.threads, args.affinity)
+        except RuntimeError as error:
+            sys.exit(str(error))
+    else:
+        with Coordinator(tasks, args.host, args.port, results_path=args.results) as coordinator:
+            print("coordinating {} images at {}".format(len(tasks), coordinator.url))
+            idle = time.monotonic()
+            while not coordinator.wait(HEARTBEAT_TIMEOUT / 2):
+                if coordinator.live_workers():
+                    idle = time.monotonic()
+                elif args.idle_timeout is not None and time.monotonic() - idle > args.idle_timeout:
+                    print("no live workers for {:.0f}s, stopping with {} of {} images left".format(
+                        args.idle_timeout, len(tasks) - len(coordinator.results), len(tasks)))
+                    break
+            results = dict(coordinator.results)
+    if args.store is not None:
+        from .results_store import Results_Store
+
+        with Results_Store(args.store) as store:
+            store.add({'image': image, 'config': tasks[image], 'result': result} for image, result in results.items())
+    failed = [image for image, result in results.items() if 'error' in result]
+    print("{} images in {:.2f}s, {} failed".format(len(results), time.perf_counter() - start, len(failed)))
+    for image in failed:
+        print("    {}: {}".format(image, results[image]['error']))
+
+
+if __name__ == "__main__":
+    main()
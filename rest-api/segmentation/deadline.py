@@ -0,0 +1,36 @@
+# ## Time budget
+import time
+
+
+class Deadline:
+    """
+    Time budget for a single segmentation request. The engines check it cooperatively inside their
+    main loops and stop early, keeping the best result found so far, once it has run out.
+
+    Parameters:
+        budget: number of seconds the request may run for. None means no limit.
+    """
+
+    def __init__(self, budget=None):
+        self.budget = budget
+        self.start = time.monotonic()
+        # set once an engine has observed the budget running out, the result is then partial
+        self.exceeded = False
+
+    def remaining(self):
+        """
+        Returns:
+            Number of seconds left in the budget (never negative), or None if there is no limit.
+        """
+        if self.budget is None:
+            return None
+        return max(0.0, self.budget - (time.monotonic() - self.start))
+
+    def expired(self):
+        """
+        Returns:
+            True if the budget has run out. The deadline is then marked as exceeded.
+        """
+        if self.budget is not None and not self.exceeded and time.monotonic() - self.start >= self.budget:
+            self.exceeded = True
+        return self.exceeded
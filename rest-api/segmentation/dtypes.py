@@ -0,0 +1,32 @@
+# ## Dtype policy
+# The data types used for the preprocessed image, the region growing state masks and the level set fields.
+import numpy as np
+
+
+class Dtype_Policy:
+    """
+    Parameters:
+        image: dtype of the preprocessed image.
+        mask: dtype of the region growing segmentation array (holds 0, 150 and 255).
+        field: dtype of the level set function and of the flood fill working image.
+    """
+
+    def __init__(self, image, mask, field):
+        self.image = np.dtype(image)
+        self.mask = np.dtype(mask)
+        self.field = np.dtype(field)
+
+    def to_image(self, img):
+        """
+        Converts an array to the image dtype, rounding to the nearest grey level for integer dtypes.
+        """
+        if np.issubdtype(self.image, np.integer):
+            img = np.rint(img)
+        return np.asarray(img, dtype=self.image)
+
+
+# uint8 images and masks with float32 level set fields, what the pipeline uses unless told otherwise
+DEFAULT_POLICY = Dtype_Policy(image=np.uint8, mask=np.uint8, field=np.float32)
+
+# float64 everywhere, reproduces the original pipeline and is used as the reference for comparisons
+REFERENCE_POLICY = Dtype_Policy(image=np.float64, mask=np.float64, field=np.float64)
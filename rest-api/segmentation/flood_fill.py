@@ -0,0 +1,102 @@
+# Flood Fill Algorithm
+# A whole-array version of region growing. Instead of adding the single contour pixel closest to the
+# region mean, every contour pixel within the threshold of the mean is added at once (one wavefront)
+# and the mean is updated in bulk for the whole wavefront.
+import numpy as np
+
+from .dtypes import DEFAULT_POLICY
+
+
+def shift(mask, orientation):
+    """
+    Shifts a boolean mask by the given orientation, filling the uncovered pixels with False.
+
+    Parameters:
+        mask: 2d boolean numpy array.
+        orientation: (row, column) offset.
+
+    Returns:
+        The shifted boolean mask.
+    """
+    shifted = np.zeros_like(mask)
+    d_row, d_col = orientation
+    rows, cols = mask.shape
+    shifted[max(d_row, 0):rows + min(d_row, 0), max(d_col, 0):cols + min(d_col, 0)] = \
+        mask[max(-d_row, 0):rows + min(-d_row, 0), max(-d_col, 0):cols + min(-d_col, 0)]
+    return shifted
+
+
+class Flood_Fill():
+    def __init__(self, img, max_iter, threshold, conn=4, deadline=None, dtype_policy=DEFAULT_POLICY):
+        self.img = np.asarray(img, dtype=dtype_policy.field)
+        self.segmentation = np.empty(shape=self.img.shape, dtype=dtype_policy.mask)
+        self.segmentation.fill(255)
+        self.max_iter_to_change_threshold = max_iter
+
+        self.threshold = threshold
+        self.deadline = deadline
+        self.seeds = [(1, 1)]
+        if conn == 4:
+            self.orientations = [(1, 0), (0, 1), (-1, 0), (0, -1)]
+        elif conn == 8:
+            self.orientations = [(1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1), (0, -1), (1, -1)]  # 8 connectivity
+        else:
+            raise ValueError("Connectivity type not known (4 or 8 available)!")
+
+    def segment(self):
+        """
+        Segment the image with the provided user seeds, one wavefront at a time.
+
+        Returns:
+            0 if the region grew past max_iter pixels, otherwise the segmentation array where the region is 0,
+            its contour 150 and the rest of the image 255.
+        """
+        region = np.zeros(self.img.shape, dtype=bool)
+        for seed in self.seeds:
+            if region[seed[1], seed[0]]:
+                continue  # pixel already explored
+            region[seed[1], seed[0]] = True
+            seg_size = 1
+            seg_sum = float(self.img[seed[1], seed[0]])
+            while True:
+                if self.deadline is not None and self.deadline.expired():
+                    break
+                contour = self.dilate(region) & ~region
+                # add every contour pixel close enough to the current mean in a single wavefront
+                wavefront = contour & (np.abs(self.img - seg_sum / seg_size) < self.threshold)
+                wavefront_size = np.count_nonzero(wavefront)
+                if wavefront_size == 0:
+                    break
+                region |= wavefront
+                seg_size += wavefront_size
+                seg_sum += float(self.img[wavefront].sum(dtype=np.float64))
+                if seg_size > self.max_iter_to_change_threshold + 1 and self.threshold != 2.5:
+                    # keep the leaked region so callers can see how far it grew
+                    self.mark_region(region)
+                    return 0
+        self.mark_region(region)
+        return self.segmentation
+
+    def display_and_resegment(self, name="Flood Fill"):
+        # Display original image where segmentation was not done
+        result = np.minimum(self.img, self.segmentation)
+        result = np.array(result, dtype=np.uint8)
+
+        # Display the result
+        return result
+
+    def mark_region(self, region):
+        """
+        Fills the segmentation array, the region is 0, its contour 150 and the rest of the image 255.
+        """
+        self.segmentation[self.dilate(region)] = 150
+        self.segmentation[region] = 0
+
+    def dilate(self, mask):
+        """
+        Grows a boolean mask by one pixel in every orientation of the connectivity.
+        """
+        dilated = mask.copy()
+        for orientation in self.orientations:
+            dilated |= shift(mask, orientation)
+        return dilated
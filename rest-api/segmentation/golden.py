@@ -0,0 +1,191 @@
+# ## Golden outputs
+# A corpus of reference outputs of the segmentation configurations on a set of images, kept as the hash of every
+# muscle mask plus its per-row boundary. Checking a configuration (or an optimised engine standing in for one)
+# against the corpus reports, per image, whether the mask is exactly the same, the Dice and IoU of the masks
+# filled up to the boundary, and the time it took next to the recorded time.
+import base64
+import hashlib
+import json
+import os
+import time
+
+import numpy as np
+
+from .dtypes import DEFAULT_POLICY, REFERENCE_POLICY
+from .level_set import DOUBLE_WELL, Level_Set
+from .loader import Prefetching_Loader
+from .region_growing import CLASSIC, FLOOD_FILL, find_region
+from .threshold_selection import CASCADE, PREDICTED
+from .transform import WORKING_SIZE, row_boundary, spans_to_mask
+
+REGION_GROWING = 'region-growing'
+LEVEL_SET = 'level-set'
+
+# dtype policies configurations can be run with, by name
+DTYPE_POLICIES = {'default': DEFAULT_POLICY, 'reference': REFERENCE_POLICY}
+
+# configurations the corpus holds reference outputs for
+CONFIGS = {
+    'classic-cascade': {'algorithm': REGION_GROWING, 'engine': CLASSIC, 'threshold_mode': CASCADE},
+    'classic-predicted': {'algorithm': REGION_GROWING, 'engine': CLASSIC, 'threshold_mode': PREDICTED},
+    'flood-fill-cascade': {'algorithm': REGION_GROWING, 'engine': FLOOD_FILL, 'threshold_mode': CASCADE},
+    'flood-fill-predicted-roi': {'algorithm': REGION_GROWING, 'engine': FLOOD_FILL, 'threshold_mode': PREDICTED,
+                                 'roi': True},
+    'level-set': {'algorithm': LEVEL_SET},
+    'level-set-roi': {'algorithm': LEVEL_SET, 'roi': True},
+}
+
+
+def segment_mask(preprocessed_image, algorithm, engine=CLASSIC, threshold_mode=CASCADE, roi=False, threads=1,
+                 dtype='default', size=WORKING_SIZE):
+    """
+    Runs a configuration on a preprocessed image.
+
+    Parameters:
+        preprocessed_image: numpy array of the preprocessed image.
+        algorithm: REGION_GROWING or LEVEL_SET.
+        engine, threshold_mode: region growing engine and threshold selection.
+        roi: whether to segment the estimated bounding box of the muscle first.
+        threads: number of threads of the level set evolution.
+        dtype: name of the dtype policy in DTYPE_POLICIES.
+        size: side of the working frame the image was preprocessed to.
+
+    Returns:
+        2d boolean numpy array of the muscle.
+    """
+    dtype_policy = DTYPE_POLICIES[dtype]
+    if algorithm == REGION_GROWING:
+        region = find_region(preprocessed_image, 6200, neighbours=4, threshold_mode=threshold_mode, engine=engine,
+                             roi=roi, dtype_policy=dtype_policy, size=size)
+        return region.segmentation == 0
+    elif algorithm == LEVEL_SET:
+        ls = Level_Set(DOUBLE_WELL, threads=threads, dtype_policy=dtype_policy)
+        boundary = np.zeros(preprocessed_image.shape[0], dtype=int)
+        record_array = ls.boundary(ls.find_image_lsf(preprocessed_image, roi=roi, size=size))
+        boundary[:len(record_array)] = record_array
+        return spans_to_mask(np.zeros_like(boundary), boundary, preprocessed_image.shape[1])
+    raise ValueError("Algorithm should be either REGION_GROWING or LEVEL_SET")
+
+
+def mask_hash(mask):
+    """
+    Returns:
+        Short hex digest of the shape and the pixels of a boolean mask.
+    """
+    digest = hashlib.sha256(str(mask.shape).encode())
+    digest.update(np.packbits(mask).tobytes())
+    return digest.hexdigest()[:16]
+
+
+def encode_boundary(boundary):
+    return base64.b64encode(np.asarray(boundary, dtype='<u2').tobytes()).decode('ascii')
+
+
+def decode_boundary(encoded):
+    return np.frombuffer(base64.b64decode(encoded), dtype='<u2').astype(int)
+
+
+def boundary_mask(boundary, width):
+    """
+    Returns:
+        Boolean mask of the region filled from the left edge up to the boundary of every row.
+    """
+    return spans_to_mask(np.zeros_like(boundary), boundary, width)
+
+
+def golden_output(mask, seconds):
+    """
+    Returns:
+        Corpus entry of a mask: its hash, shape, area, encoded per-row boundary and the time it took.
+    """
+    return {'hash': mask_hash(mask), 'shape': list(mask.shape), 'area': int(np.count_nonzero(mask)),
+            'boundary': encode_boundary(row_boundary(mask)), 'seconds': round(seconds, 4)}
+
+
+def image_name(path):
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def run_config(config, images):
+    """
+    Runs a configuration on every image.
+
+    Parameters:
+        config: keyword arguments of segment_mask.
+        images: dictionary of preprocessed images by name.
+
+    Returns:
+        Dictionary of (mask, seconds) tuples by image name.
+    """
+    outputs = {}
+    for name, preprocessed_image in images.items():
+        start = time.perf_counter()
+        mask = segment_mask(preprocessed_image, **config)
+        outputs[name] = (mask, time.perf_counter() - start)
+    return outputs
+
+
+def record_corpus(paths, configs=CONFIGS):
+    """
+    Returns:
+        Corpus of the outputs of the configurations on the images at the given paths.
+    """
+    images = {image_name(path): image for path, image in Prefetching_Loader(paths)}
+    outputs = {}
+    for config_name, config in configs.items():
+        outputs[config_name] = {name: golden_output(mask, seconds)
+                                for name, (mask, seconds) in run_config(config, images).items()}
+    return {'configs': configs, 'outputs': outputs}
+
+
+def save_corpus(corpus, path):
+    with open(path, 'w') as corpus_file:
+        json.dump(corpus, corpus_file, indent=1, sort_keys=True)
+        corpus_file.write('\n')
+
+
+def load_corpus(path):
+    with open(path) as corpus_file:
+        return json.load(corpus_file)
+
+
+def compare(mask, seconds, reference):
+    """
+    Compares a mask with a corpus entry.
+
+    Returns:
+        Dictionary with whether the mask is exactly the same, the Dice and IoU of both masks filled up to their
+        boundaries, the time it took and the recorded time.
+    """
+    width = reference['shape'][1]
+    boundary = boundary_mask(row_boundary(mask), width)
+    reference_boundary = boundary_mask(decode_boundary(reference['boundary']), width)
+    intersection = np.count_nonzero(boundary & reference_boundary)
+    union = np.count_nonzero(boundary | reference_boundary)
+    total = np.count_nonzero(boundary) + np.count_nonzero(reference_boundary)
+    return {
+        'exact': list(mask.shape) == reference['shape'] and mask_hash(mask) == reference['hash'],
+        'dice': 2 * intersection / total if total else 1.0,
+        'iou': intersection / union if union else 1.0,
+        'seconds': seconds,
+        'reference_seconds': reference['seconds'],
+    }
+
+
+def check_config(corpus, paths, config, reference_name):
+    """
+    Runs a configuration on the images and compares its outputs with the recorded outputs of another.
+
+    Parameters:
+        corpus: corpus as loaded by load_corpus.
+        paths: paths of the images, their names (without extension) have to be in the corpus.
+        config: keyword arguments of segment_mask, the configuration being checked.
+        reference_name: name of the configuration in the corpus it should reproduce.
+
+    Returns:
+        Dictionary of the comparison of every image by name.
+    """
+    references = corpus['outputs'][reference_name]
+    images = {image_name(path): image for path, image in Prefetching_Loader(paths)}
+    return {name: compare(mask, seconds, references[name])
+            for name, (mask, seconds) in run_config(config, images).items()}
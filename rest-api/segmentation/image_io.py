@@ -0,0 +1,109 @@
+# ## Image decoding and encoding
+# PIL, OpenCV and pydicom are imported inside the functions that use them so that importing
+# the package does not pay for codecs that a request never touches.
+import base64
+import os
+from io import BytesIO
+
+import numpy as np
+
+DICOM_IMAGE_EXT = '.dcm'
+PGM_IMAGE_EXT = '.pgm'
+OTHER_IMAGE_EXT = ['.jpg', '.png', '.jpeg']
+
+# bytes per pixel of the decoded image by PIL mode, other modes are assumed to take 4
+MODE_BYTES = {'1': 1, 'L': 1, 'P': 1, 'LA': 2, 'I;16': 2, 'RGB': 3, 'RGBA': 4, 'CMYK': 4, 'I': 4, 'F': 4}
+
+
+def read_image(image_path):
+    """
+    Reads an image from disk using the decoder that matches its file extension.
+
+    Parameters:
+        image_path: path to a DICOM, PGM, JPEG or PNG image.
+
+    Returns:
+        Tuple of the grey scale PIL image and the image path without its extension.
+    """
+    from PIL import Image
+
+    name, ext = os.path.splitext(image_path)
+    if ext == DICOM_IMAGE_EXT:
+        import pydicom
+
+        pixels = pydicom.dcmread(image_path).pixel_array
+        pixels = np.interp(pixels, [np.min(pixels), np.max(pixels)], [0, 255]).astype(np.uint8)
+        return Image.fromarray(pixels), name
+    elif ext == PGM_IMAGE_EXT:
+        return Image.open(image_path).convert("L"), name
+    elif ext in OTHER_IMAGE_EXT:
+        import cv2
+
+        return Image.fromarray(cv2.imread(image_path, 0)), name
+    else:
+        raise ValueError("Invalid Image Format. Supported Image Formats are: {}, {}, {}".format(
+            DICOM_IMAGE_EXT, PGM_IMAGE_EXT, OTHER_IMAGE_EXT))
+
+
+def decode_base64_image(image_base64, reduce=1):
+    """
+    Decodes a base64 encoded image into a grey scale PIL image.
+
+    Parameters:
+        image_base64: base64 encoded image as a string or bytes.
+        reduce: factor the image is downscaled by after it is decoded.
+
+    Returns:
+        PIL image in grey scale ("L") mode.
+    """
+    from PIL import Image
+
+    if isinstance(image_base64, str):
+        image_base64 = image_base64.encode('utf-8')
+    im_bytes = base64.b64decode(image_base64)  # im_bytes is a binary image
+    im_file = BytesIO(im_bytes)
+    image = Image.open(im_file)
+    image = image.convert("L")
+    if reduce > 1:
+        image = image.reduce(reduce)
+    return image
+
+
+def read_image_header(image_base64):
+    """
+    Reads the size and mode of a base64 encoded image from its header, without decoding the pixels.
+
+    Parameters:
+        image_base64: base64 encoded image as a string or bytes.
+
+    Returns:
+        Tuple (rows, columns, bytes per pixel of the decoded image), or None if the data is not an image.
+    """
+    from PIL import Image, UnidentifiedImageError
+
+    if isinstance(image_base64, str):
+        image_base64 = image_base64.encode('utf-8')
+    try:
+        with Image.open(BytesIO(base64.b64decode(image_base64))) as image:
+            return image.size[1], image.size[0], MODE_BYTES.get(image.mode, 4)
+    except (UnidentifiedImageError, ValueError):
+        return None
+
+
+def encode_base64_png(img):
+    """
+    Encodes a grey scale image array as a base64 PNG string.
+
+    Parameters:
+        img: numpy array of the image.
+
+    Returns:
+        base64 encoded PNG as a string.
+    """
+    from PIL import Image
+
+    pil = Image.fromarray(np.uint8(img)).convert('L')
+    buffered = BytesIO()
+    pil.save(buffered, format="PNG")
+    img_str = base64.b64encode(buffered.getvalue())
+    return img_str.decode('utf-8')
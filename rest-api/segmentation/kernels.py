@@ -0,0 +1,136 @@
+# ## Compiled kernels
+# The classic region growing engine adds one pixel at a time in interpreted Python. grow_region is the same loop
+# written over flat typed arrays, which Numba compiles to machine code when it is installed. Without Numba (or
+# with SEGMENTATION_JIT=0) Region_Growing keeps its pure Python loop, and both give identical results: the kernel
+# explores the neighbours in the same order, keeps the contour in the same order and does the same float64
+# arithmetic on the region mean.
+#
+# Compiling takes a few seconds, so servers and worker processes call warm_up when they start rather than paying
+# for it on their first request. The compiled code is cached on disk next to this module when it is writable.
+import os
+
+import numpy as np
+
+# set SEGMENTATION_JIT=0 to run the pure Python implementations even when Numba is installed
+JIT_ENABLED = os.environ.get('SEGMENTATION_JIT', '1') != '0'
+
+# grow_region returns one of these
+GROWN = 0  # the region stopped growing (distance at the threshold or no contour left)
+LEAKED = 1  # the region needed more than max_iter iterations
+PAUSED = 2  # the kernel ran its number of steps, call it again to continue
+
+# distance Region_Growing reports once the contour is empty
+NO_NEIGHBOUR = 1000.0
+
+# iterations grow_region runs between two checks of the deadline
+KERNEL_STEPS = 4096
+
+# compiled kernels by name, filled on the first use ({} if Numba is not installed)
+compiled_kernels = None
+
+
+def grow_region(pixels, segmentation, columns, row_offsets, column_offsets, contour, state, mean_and_distance,
+                threshold, max_iter, limited, steps):
+    """
+    Runs up to steps iterations of Region_Growing.segment for one seed.
+
+    Parameters:
+        pixels: flat float64 array of the image.
+        segmentation: flat segmentation array (255 unexplored, 150 contour, 0 region), updated in place.
+        columns: number of columns of the image.
+        row_offsets, column_offsets: int64 arrays of the neighbour orientations.
+        contour: int64 array the size of the image holding the flat indices of the contour pixels in its first
+                 state[1] entries.
+        state: int64 array [current pixel, contour length, region size, iterations], updated in place.
+        mean_and_distance: float64 array [region mean, distance of the current pixel], updated in place.
+        threshold: float threshold.
+        max_iter: number of iterations after which the threshold leaks.
+        limited: False for the last threshold of the cascade, which never leaks.
+        steps: number of iterations to run before returning PAUSED.
+
+    Returns:
+        GROWN, LEAKED or PAUSED.
+    """
+    rows = segmentation.size // columns
+    current, length, size, iterations = state[0], state[1], state[2], state[3]
+    mean, distance = mean_and_distance[0], mean_and_distance[1]
+    status = PAUSED
+    for _ in range(steps):
+        if not distance < threshold:
+            status = GROWN
+            break
+        if limited and iterations > max_iter:
+            status = LEAKED
+            break
+        segmentation[current] = 0
+        row = current // columns
+        column = current % columns
+        for k in range(row_offsets.size):
+            neighbour_row = row + row_offsets[k]
+            neighbour_column = column + column_offsets[k]
+            if 0 <= neighbour_row < rows and 0 <= neighbour_column < columns:
+                neighbour = neighbour_row * columns + neighbour_column
+                if segmentation[neighbour] == 255:
+                    contour[length] = neighbour
+                    length += 1
+                    segmentation[neighbour] = 150
+        if length == 0:
+            distance = NO_NEIGHBOUR
+            status = GROWN
+            break
+        # the first contour pixel closest to the mean, as list.index(min(...)) finds it
+        nearest = 0
+        distance = abs(pixels[contour[0]] - mean)
+        for i in range(1, length):
+            d = abs(pixels[contour[i]] - mean)
+            if d < distance:
+                nearest = i
+                distance = d
+        current = contour[nearest]
+        size += 1
+        mean = (mean * size + pixels[current]) / (size + 1)
+        iterations += 1
+        # delete the pixel from the contour keeping the order of the others, like del list[i]
+        for i in range(nearest, length - 1):
+            contour[i] = contour[i + 1]
+        length -= 1
+    state[0], state[1], state[2], state[3] = current, length, size, iterations
+    mean_and_distance[0], mean_and_distance[1] = mean, distance
+    return status
+
+
+def get_kernel(name):
+    """
+    Returns:
+        The compiled kernel of that name, or None if the JIT is disabled or Numba is not installed.
+    """
+    global compiled_kernels
+    if not JIT_ENABLED:
+        return None
+    if compiled_kernels is None:
+        try:
+            import numba
+        except ImportError:
+            compiled_kernels = {}
+        else:
+            compiled_kernels = {'grow_region': numba.njit(cache=True, nogil=True)(grow_region)}
+    return compiled_kernels.get(name)
+
+
+def warm_up():
+    """
+    Compiles the kernels for the dtypes of both dtype policies by running them on a small image, so the first
+    request does not pay for it. Does nothing without the JIT.
+
+    Returns:
+        True if the kernels were compiled.
+    """
+    from .dtypes import DEFAULT_POLICY, REFERENCE_POLICY
+    from .region_growing import Region_Growing
+
+    if get_kernel('grow_region') is None:
+        return False
+    image = np.arange(64, dtype=np.uint8).reshape(8, 8)
+    for dtype_policy in [DEFAULT_POLICY, REFERENCE_POLICY]:
+        Region_Growing(dtype_policy.to_image(image), 10, threshold=5, dtype_policy=dtype_policy).segment()
+    return True
@@ -0,0 +1,418 @@
+# Level Set Algorithm (distance regularized level set evolution, DRLSE)
+import numpy as np
+
+from .checkpoint import Checkpoint, image_hash
+from .dtypes import DEFAULT_POLICY
+from .resolution import scale_factor, scale_length
+from .roi import estimate_roi, touches_roi_edge
+from .transform import WORKING_SIZE, spans_to_mask
+
+# pixels next to the edge of the region of interest the contour has to stay away from
+ROI_GUARD = 2
+
+# rows of the neighbouring strips every strip is evolved with, the stencils reach two rows away
+HALO = 2
+
+# strips are not made smaller than this so the halo rows stay a small part of the work
+MIN_STRIP_ROWS = 16
+
+# outer iterations of the evolution in the 256 px working frame, they scale with the side of the frame
+ITER_OUTER = 20
+
+# use single well potential p1(s)=0.5*(s-1)^2, which is good for region-based model
+DOUBLE_WELL = 'double-well'
+
+# use double-well potential in Eq. (16), which is good for both edge and region based models
+SINGLE_WELL = 'single-well'
+
+class Level_Set: 
+
+    def __init__(self, potential_function, threads=1, dtype_policy=DEFAULT_POLICY) -> None:
+        """
+        Parameters:
+            potential_function: SINGLE_WELL or DOUBLE_WELL.
+            threads: number of threads evolving horizontal strips of the level set function in parallel.
+            dtype_policy: Dtype_Policy, the level set function is evolved in its field dtype.
+        """
+        self.pf = potential_function
+        self.threads = threads
+        self.dtype_policy = dtype_policy
+        self.pool = None
+
+    def initialise_params(self, image, size=WORKING_SIZE):
+        """
+        Parametes:
+            preprocessed_img: Input image that has been preprocessed. It will be passed as a parameter 
+            to the level set algorithm
+            size: side of the working frame the image was preprocessed to, the initial region and the number of
+            outer iterations scale with it.
+        
+        Returns:
+            a dictionary containing all the parameters needed for the algorithm.
+        """
+        # initialize LSF as binary step function
+        c0 = 2
+        initial_lsf = c0 * np.ones(image.shape, dtype=self.dtype_policy.field)
+        # generate the initial region R0 as two rectangles
+        corner = scale_length(10, size)
+        initial_lsf[0:corner, 0:corner] = -c0 # top left corner
+
+        # parameters
+        return {
+            'img': image,
+            'initial_lsf': initial_lsf,
+            'timestep': 7,  # time step
+            'iter_inner': 10,
+            'iter_outer': scale_length(ITER_OUTER, size),
+            # coefficient of the weighted length term L(phi). The contours of a smaller frame are more curved, so
+            # the weight shrinks with it to keep the small initial region from collapsing. Larger frames keep 5,
+            # a larger weight makes the evolution unstable with this time step.
+            'lmda': 5 * min(1, scale_factor(size)),
+            'alfa': -3,  # coefficient of the weighted area term A(phi)
+            'epsilon': 1.2,  # parameter that specifies the width of the DiracDelta function
+            'sigma': 0.8,  # scale parameter in Gaussian kernel
+            'potential_function': self.pf,
+        }
+
+    def find_lsf(self, img: np.ndarray, initial_lsf: np.ndarray, timestep=1, iter_inner=10, iter_outer=30, lmda=5,
+                alfa=-3, epsilon=1.5, sigma=0.8, potential_function=DOUBLE_WELL, deadline=None, checkpoint=None,
+                checkpoint_path=None, checkpoints=None):
+        """
+        Parameters:
+            img: Input image as a grey scale uint8 array (0-255).
+            initial_lsf: Array as same size as the img that contains the seed points for the LSF.
+            timestep: Time Step.
+            iter_inner: How many iterations to run drlse before showing the output.
+            iter_outer: How many iterations to run the iter_inner.
+            lmda: coefficient of the weighted length term L(phi).
+            alfa: coefficient of the weighted area term A(phi).
+            epsilon: parameter that specifies the width of the DiracDelta function.
+            sigma: scale parameter in Gaussian kernal.
+            potential_function: The potential function to use in drlse algorithm. Should be SINGLE_WELL or DOUBLE_WELL.
+            deadline: optional Deadline. Once it runs out the evolution stops and the current phi is returned.
+            checkpoint: optional Checkpoint of an earlier evolution on the same image to start from instead of
+                        initial_lsf. If it was run with the same parameters the evolution resumes after its outer
+                        iterations (up to iter_outer in total), otherwise its phi warm starts a new evolution of
+                        iter_outer outer iterations.
+            checkpoint_path: optional path of an npz file the Checkpoint is written to after every outer iteration.
+            checkpoints: optional list the Checkpoint of every outer iteration is appended to.
+            
+        Returns:
+            Phi value that indicates the boundary drawn. Will be used to segment the image.
+        """
+        if len(img.shape) != 2:
+            raise Exception("Input image should be a gray scale one")
+
+        if len(img.shape) != len(initial_lsf.shape):
+            raise Exception("Input image and the initial LSF should be in the same shape")
+
+        if potential_function != SINGLE_WELL and potential_function != DOUBLE_WELL:
+            raise Exception("Potential function should be either SINGLE-WELL or DOUBLE-WELL")
+
+        # parameters
+        mu = 0.2 / timestep  # coefficient of the distance regularization term R(phi)
+
+        img_smooth = np.array(img, dtype='float32')
+
+        [Iy, Ix] = np.gradient(img_smooth)
+        f = np.square(Ix) + np.square(Iy)
+        g = 1 / (1 + f)  # edge indicator function.
+
+        # initialize LSF as binary step function
+        phi = initial_lsf.copy()
+        params = {'timestep': timestep, 'iter_inner': iter_inner, 'lmda': lmda, 'alfa': alfa, 'epsilon': epsilon,
+                  'sigma': sigma, 'potential_function': potential_function}
+        first_iteration = 0
+        if checkpoint is not None or checkpoint_path is not None or checkpoints is not None:
+            img_hash = image_hash(img)
+        if checkpoint is not None:
+            if checkpoint.image_hash != img_hash:
+                raise ValueError("The checkpoint was saved for a different image")
+            if checkpoint.resumes(params):
+                if checkpoint.outer_iterations > iter_outer:
+                    raise ValueError("The checkpoint has already been evolved for more than iter_outer iterations")
+                first_iteration = checkpoint.outer_iterations
+            phi = checkpoint.phi.astype(initial_lsf.dtype)
+
+        if potential_function != SINGLE_WELL:
+            potential_function = DOUBLE_WELL  # default choice of potential function
+
+        # start level set evolution
+        for n in range(first_iteration, iter_outer):
+            phi = self.drlse_edge(phi, g, lmda, mu, alfa, epsilon, timestep, iter_inner, potential_function, deadline)
+            if deadline is not None and deadline.expired():
+                return phi
+            if checkpoint_path is not None:
+                Checkpoint(phi, n + 1, params, img_hash).save(checkpoint_path)
+            if checkpoints is not None:
+                checkpoints.append(Checkpoint(phi, n + 1, params, img_hash))
+
+        # refine the zero level contour by further level set evolution with alfa=0
+        alfa = 0
+        iter_refine = 10
+        phi = self.drlse_edge(phi, g, lmda, mu, alfa, epsilon, timestep, iter_refine, potential_function, deadline)
+        return phi
+
+    def drlse_edge(self, phi_0, g, lmda, mu, alfa, epsilon, timestep, iters, potential_function, deadline=None):  # Updated Level Set Function
+        """
+        Parameters:
+            phi_0: level set function to be updated by level set evolution.
+            g: edge indicator function.
+            lmda: weight of the weighted length term.
+            mu: weight of distance regularization term.
+            alfa: weight of the weighted area term.
+            epsilon: width of Dirac Delta function.
+            timestep: time step.
+            iters: number of iterations.
+            potential_function: choice of potential function in distance regularization term.
+                                As mentioned in the above paper, two choices are provided: potentialFunction='single-well' or
+                                potentialFunction='double-well', which correspond to the potential functions p1 (single-well)
+                                and p2 (double-well), respectively.
+            deadline: optional Deadline checked before every iteration.
+        
+        Returns:
+            An updated level set function.
+                    
+        """
+        phi = phi_0.copy()
+        [vy, vx] = np.gradient(g)
+        strips = self.strips(phi.shape[0])
+        for k in range(iters):
+            if deadline is not None and deadline.expired():
+                break
+            phi = self.neumann_bound_cond(phi)
+            if len(strips) == 1:
+                phi += self.drlse_step(phi, g, vx, vy, lmda, mu, alfa, epsilon, timestep, potential_function)
+            else:
+                phi += self.drlse_step_tiled(phi, g, vx, vy, lmda, mu, alfa, epsilon, timestep, potential_function,
+                                             strips)
+        return phi
+
+
+    def drlse_step(self, phi, g, vx, vy, lmda, mu, alfa, epsilon, timestep, potential_function):
+        """
+        Computes the change of the level set function over one iteration of drlse_edge.
+
+        Parameters:
+            phi: level set function, after the Neumann boundary condition has been applied.
+            g: edge indicator function.
+            vx, vy: gradient of the edge indicator function.
+            the other parameters are the same as drlse_edge.
+
+        Returns:
+            The change to add to phi.
+        """
+        from scipy.ndimage import laplace
+
+        [phi_y, phi_x] = np.gradient(phi)
+        s = np.sqrt(np.square(phi_x) + np.square(phi_y))
+        delta = 1e-10
+        n_x = phi_x / (s + delta)  # add a small positive number to avoid division by zero
+        n_y = phi_y / (s + delta)
+        curvature = self.div(n_x, n_y)
+
+        if potential_function == SINGLE_WELL:
+            dist_reg_term = laplace(phi, mode='nearest') - curvature  # compute distance regularization term in equation (13) with the single-well potential p1.
+        elif potential_function == DOUBLE_WELL:
+            dist_reg_term = self.dist_reg_p2(phi)  # compute the distance regularization term in eqaution (13) with the double-well potential p2.
+        else:
+            raise Exception('Error: Wrong choice of potential function. Please input the string "single-well" or "double-well" in the drlse_edge function.')
+        dirac_phi = self.dirac(phi, epsilon)
+        area_term = dirac_phi * g  # balloon/pressure force
+        edge_term = dirac_phi * (vx * n_x + vy * n_y) + dirac_phi * g * curvature
+        return timestep * (mu * dist_reg_term + lmda * edge_term + alfa * area_term)
+
+    def drlse_step_tiled(self, phi, g, vx, vy, lmda, mu, alfa, epsilon, timestep, potential_function, strips):
+        """
+        Computes the same change as drlse_step, one horizontal strip at a time on the thread pool. Each strip is
+        evolved together with HALO rows of its neighbours, read from the phi of the current iteration, which is
+        enough for the stencils to give the same values as on the whole image.
+
+        Parameters:
+            strips: list of (first row, last row + 1) tuples covering the image.
+            the other parameters are the same as drlse_step.
+
+        Returns:
+            The change to add to phi.
+        """
+        rows = phi.shape[0]
+        change = np.empty_like(phi)
+
+        def evolve_strip(strip):
+            start, end = strip
+            top, bottom = max(start - HALO, 0), min(end + HALO, rows)
+            strip_change = self.drlse_step(phi[top:bottom], g[top:bottom], vx[top:bottom], vy[top:bottom], lmda, mu,
+                                           alfa, epsilon, timestep, potential_function)
+            change[start:end] = strip_change[start - top:end - top]
+
+        # the numpy and scipy stencils release the GIL, so the strips are evolved in parallel
+        list(self.get_pool().map(evolve_strip, strips))
+        return change
+
+    def strips(self, rows):
+        """
+        Splits the rows of the image into one strip per thread, each at least MIN_STRIP_ROWS high.
+
+        Returns:
+            list of (first row, last row + 1) tuples.
+        """
+        n_strips = max(1, min(self.threads, rows // MIN_STRIP_ROWS))
+        bounds = np.linspace(0, rows, n_strips + 1).astype(int)
+        return list(zip(bounds[:-1], bounds[1:]))
+
+    def get_pool(self):
+        if self.pool is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            self.pool = ThreadPoolExecutor(max_workers=self.threads)
+        return self.pool
+
+    def dist_reg_p2(self, phi):
+        """
+        Compute the distance regularization term with the DOUBLE WELL potential p2 in equation (16).
+        
+        Parameter:
+            phi: level set function to be updated by level set evolution.
+            
+        Returns
+            Distance regression term in equation (13).
+        
+        """
+        [phi_y, phi_x] = np.gradient(phi)
+        s = np.sqrt(np.square(phi_x) + np.square(phi_y))
+        a = (s >= 0) & (s <= 1)
+        b = (s > 1)
+        ps = a * np.sin(2 * np.pi * s) / (2 * np.pi) + b * (s - 1)  # compute first order derivative of the double-well potential p2 in equation (16)
+        dps = ((ps != 0) * ps + (ps == 0)) / ((s != 0) * s + (s == 0))  # compute d_p(s)=p'(s)/s in equation (10). As s-->0, we have d_p(s)-->1 according to equation (18)
+        from scipy.ndimage import laplace
+
+        return self.div(dps * phi_x - phi_x, dps * phi_y - phi_y) + laplace(phi, mode='nearest')
+
+
+    def div(self, nx: np.ndarray, ny: np.ndarray) -> np.ndarray:
+        """
+        Compute the curvature to the level set function.
+        Returns:
+            The curvature of the level set function. 
+        """
+        [_, nxx] = np.gradient(nx)
+        [nyy, _] = np.gradient(ny)
+        return nxx + nyy
+
+
+    def dirac(self, x: np.ndarray, sigma: np.ndarray) -> np.ndarray:
+        """
+        Parameters:
+            x: level set function to be updated by level set evolution.
+            sigma: Width of Dirac Delta function.
+            
+        Returns:
+            Updated function that will be used to calculate the area and the edge term.
+        """
+        f = (1 / 2 / sigma) * (1 + np.cos(np.pi * x / sigma))
+        b = (x <= sigma) & (x >= -sigma)
+        return f * b
+
+
+    def neumann_bound_cond(self, f):
+        """
+        Make a function satisfy Neumann boundary condition.
+        
+        Parameter: 
+            f: level set function to be updated by level set evolution.
+        Return:
+            A level set function that satisfy neumann boundary condition.
+        """
+        g = f.copy()
+
+        g[np.ix_([0, -1], [0, -1])] = g[np.ix_([2, -3], [2, -3])]
+        g[np.ix_([0, -1]), 1:-1] = g[np.ix_([2, -3]), 1:-1]
+        g[1:-1, np.ix_([0, -1])] = g[1:-1, np.ix_([2, -3])]
+        return g
+
+    def segment_image(self, phi: np.ndarray, img: np.ndarray):
+        """
+        Assign the pixel within the boundary to be black. Save the output image. Return the segmented and original image for 
+        visualisation purpose.
+        
+        Parameters:
+            phi: finalised level set function (provide the boundary drawn).
+            img: img to be segmented.
+            filename: file name used to save the image.
+        
+        Returns:
+            Tuple that contains the numpy arrays for the original image and the segmented image
+        """
+        record_array = np.array(self.boundary(phi), dtype=int)
+        # blank every row up to its boundary at once rather than pixel by pixel
+        img[:len(record_array)][spans_to_mask(np.zeros_like(record_array), record_array, img.shape[1])] = 0
+        return img
+
+    def boundary(self, phi: np.ndarray):
+        """
+        Finds the boundary of the muscle along the first zero level contour of phi.
+
+        Parameters:
+            phi: finalised level set function.
+
+        Returns:
+            List with, for every row down to the lowest point of the contour, the column of its rightmost point.
+            segment_image blanks the pixels to the left of it.
+        """
+        from skimage import measure
+
+        contours = measure.find_contours(phi, 0)
+        max_of_y = int(np.round(max(contours[0], key=lambda x: x[0]))[0])
+        # contains the rightmost pixel at that particular y 
+        record_array = [0] * (max_of_y + 1)
+        for contour in contours[0]:
+            x, y = int(contour[1]), round(contour[0]) 
+            if record_array[y] < x:
+                record_array[y] = x
+        return record_array
+
+    def find_lsf_in_roi(self, image, deadline=None, size=WORKING_SIZE):
+        """
+        Evolves the level set function on the estimated bounding box of the pectoral muscle only. If the
+        contour gets close to the edge of the box the evolution is run again on the full image.
+
+        Parameters:
+            image: preprocessed image.
+            deadline: optional Deadline.
+            size: side of the working frame the image was preprocessed to.
+
+        Returns:
+            Phi value for the full image, positive outside the bounding box.
+        """
+        rows, columns = estimate_roi(image, size)
+        if (rows, columns) == image.shape:
+            return self.find_lsf(**self.initialise_params(image, size), deadline=deadline)
+        phi_roi = self.find_lsf(**self.initialise_params(image[:rows, :columns], size), deadline=deadline)
+        if touches_roi_edge(phi_roi <= 0, image.shape, guard=ROI_GUARD) and not (
+                deadline is not None and deadline.exceeded):
+            return self.find_lsf(**self.initialise_params(image, size), deadline=deadline)
+        phi = np.full(image.shape, np.max(phi_roi), dtype=phi_roi.dtype)
+        phi[:rows, :columns] = phi_roi
+        return phi
+
+    def find_image_lsf(self, image, deadline=None, roi=False, size=WORKING_SIZE):
+        """
+        Evolves the level set function on a preprocessed image with the default parameters.
+
+        Parameters:
+            image: preprocessed image.
+            deadline: optional Deadline.
+            roi: whether to evolve it on the estimated bounding box of the muscle first.
+            size: side of the working frame the image was preprocessed to.
+
+        Returns:
+            Phi value for the full image.
+        """
+        if roi:
+            return self.find_lsf_in_roi(image, deadline=deadline, size=size)
+        params = self.initialise_params(image, size)
+        return self.find_lsf(**params, deadline=deadline)
+
+    def run_level_set(self, image, deadline=None, roi=False, size=WORKING_SIZE):
+        phi = self.find_image_lsf(image, deadline=deadline, roi=roi, size=size)
+        return self.segment_image(phi, image)
@@ -0,0 +1,89 @@
+# ## Prefetching loader
+# Batch runs read, decode and preprocess an image and then segment it, one after the other, leaving the CPU idle
+# during disk reads and decoding. Prefetching_Loader loads the next images on a thread pool while the current one
+# is segmented and hands them out in the order they were given. Reading files and decoding with PIL release the
+# GIL, so the loads overlap the segmentation even though both run in the same process.
+from collections import deque
+from itertools import islice
+
+from .dtypes import DEFAULT_POLICY
+
+# number of images loaded ahead of the one being segmented
+PREFETCH_DEPTH = 4
+
+
+def load_preprocessed(path, dtype_policy=DEFAULT_POLICY):
+    """
+    Default load of the loader: reads and preprocesses an image.
+
+    Returns:
+        numpy array of the preprocessed image.
+    """
+    from .image_io import read_image
+    from .preprocessing import preprocessing
+
+    return preprocessing(read_image(path)[0], dtype_policy)
+
+
+class Prefetching_Loader:
+    """
+    Iterator over (path, loaded image) tuples, in the order of the paths, whose next images are loaded on
+    background threads. At most depth images are loaded or waiting to be taken at once, which bounds the memory
+    held by images that were loaded ahead.
+
+    A load that raised raises again when its image is reached, so the iteration stops at the same image as a
+    plain loop would.
+
+    Parameters:
+        paths: iterable of image paths (or any argument of load), read lazily.
+        load: function loading one image, read and preprocessed by default.
+        depth: number of images loaded ahead.
+        workers: number of loading threads, at most depth.
+
+    Usage:
+        with Prefetching_Loader(paths) as loader:
+            for path, preprocessed_image in loader:
+                ...
+    """
+
+    def __init__(self, paths, load=load_preprocessed, depth=PREFETCH_DEPTH, workers=2):
+        from concurrent.futures import ThreadPoolExecutor
+
+        self.paths = iter(paths)
+        self.load = load
+        self.executor = ThreadPoolExecutor(max_workers=max(1, min(workers, depth)))
+        # loads in the order of the paths, started but not taken yet
+        self.loading = deque()
+        for _ in range(max(1, depth)):
+            self.prefetch()
+
+    def prefetch(self):
+        for path in islice(self.paths, 1):
+            self.loading.append((path, self.executor.submit(self.load, path)))
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if not self.loading:
+            self.close()
+            raise StopIteration
+        path, future = self.loading.popleft()
+        # the slot of the image handed out starts the load of the next one
+        self.prefetch()
+        return path, future.result()
+
+    def close(self):
+        """
+        Cancels the loads that did not start and waits for the running ones.
+        """
+        for _, future in self.loading:
+            future.cancel()
+        self.loading.clear()
+        self.executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,137 @@
+# ## Memory accounting
+# The memory a segmentation request needs is dominated by the decoded image and the copies of it made before it
+# is resized to the working frame (and, for full resolution output, after), plus a roughly constant amount for the
+# engine on the working frame. estimate_request_bytes predicts the peak from the image header alone, so the server
+# can queue, downscale or reject a request before decoding it. measure_peak measures the peak with tracemalloc.
+import threading
+import tracemalloc
+
+from .resolution import scale_area
+from .transform import WORKING_SIZE
+
+# bytes per pixel of the image copies made before the resize: the PIL image in grey scale mode, the degenerate
+# image and the result of the contrast adjustment, and the numpy array of the decoded image
+DECODE_COPIES = 4
+
+# bytes per pixel of the full resolution output: the muscle mask, the blanked image and the PNG being encoded
+FULL_RESOLUTION_COPIES = 3
+
+# peak bytes of the engines on the 256 px working frame (level set without ROI and float32 fields), measured with
+# tracemalloc and rounded up, they scale with the area of the frame
+ENGINE_BYTES = {'region-growing': 2 * 1024 * 1024, 'level-set': 8 * 1024 * 1024}
+
+
+def estimate_request_bytes(encoded_size, rows, columns, bytes_per_pixel, algorithm, full_resolution=False, reduce=1,
+                           size=WORKING_SIZE):
+    """
+    Estimates the peak memory of a segmentation request.
+
+    Parameters:
+        encoded_size: length of the base64 encoded image.
+        rows, columns: size of the image, from its header.
+        bytes_per_pixel: number of bytes per pixel of the decoded image (1 for grey scale, 3 for RGB).
+        algorithm: "region-growing" or "level-set".
+        full_resolution: whether the result is rendered on the original image.
+        reduce: factor the image is downscaled by right after it is decoded.
+        size: side of the working frame.
+
+    Returns:
+        Estimated peak number of bytes.
+    """
+    pixels = rows * columns
+    reduced_pixels = -(-rows // reduce) * -(-columns // reduce)
+    # the base64 string and the compressed bytes decoded from it
+    total = encoded_size + encoded_size * 3 // 4
+    # the image is decoded at full size in its own mode and converted to grey scale before it is reduced
+    total += pixels * bytes_per_pixel + (pixels if bytes_per_pixel != 1 else 0)
+    total += reduced_pixels * DECODE_COPIES
+    if full_resolution:
+        total += reduced_pixels * FULL_RESOLUTION_COPIES
+    return total + scale_area(ENGINE_BYTES[algorithm], size)
+
+
+def fitting_reduction(budget_bytes, encoded_size, rows, columns, bytes_per_pixel, algorithm, full_resolution=False,
+                      size=WORKING_SIZE):
+    """
+    Finds how much an image has to be downscaled for the estimated peak of its request to fit a budget. Images
+    are never made smaller than the working frame.
+
+    Returns:
+        The smallest reduce factor (1 if the image fits as it is) or None if the request does not fit at all.
+    """
+    reduce = 1
+    while estimate_request_bytes(encoded_size, rows, columns, bytes_per_pixel, algorithm, full_resolution,
+                                 reduce, size) > budget_bytes:
+        reduce += 1
+        if min(rows, columns) // reduce < size:
+            return None
+    return reduce
+
+
+def measure_peak(function, *args, **kwargs):
+    """
+    Runs function and measures the peak memory allocated while it ran with tracemalloc. Only the memory allocated
+    through Python and numpy is traced (the pixel buffers of PIL images are not), and other threads allocating
+    at the same time are counted too, so this is meant for debugging single requests.
+
+    Returns:
+        Tuple of the result of function and the peak number of bytes.
+    """
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    try:
+        result = function(*args, **kwargs)
+        return result, tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        if started:
+            tracemalloc.stop()
+
+
+class Memory_Budget:
+    """
+    Memory shared by the requests a server runs at once. Every request holds its estimated peak while it runs,
+    requests that do not fit wait for others to finish.
+
+    Parameters:
+        budget_bytes: total number of bytes the requests may use at once.
+    """
+
+    def __init__(self, budget_bytes):
+        self.budget_bytes = budget_bytes
+        self.in_use = 0
+        self.condition = threading.Condition()
+
+    def acquire(self, nbytes, timeout=None):
+        """
+        Waits until nbytes fit next to the requests already running.
+
+        Parameters:
+            nbytes: estimated peak of the request, at most budget_bytes.
+            timeout: number of seconds to wait for, None waits for as long as it takes.
+
+        Returns:
+            True if the bytes were acquired, False if the timeout ran out first.
+        """
+        with self.condition:
+            if not self.condition.wait_for(lambda: self.in_use + nbytes <= self.budget_bytes, timeout):
+                return False
+            self.in_use += nbytes
+            return True
+
+    def release(self, nbytes):
+        with self.condition:
+            self.in_use -= nbytes
+            self.condition.notify_all()
+
+    def charge(self, nbytes):
+        """
+        Counts nbytes that are already allocated (state kept between requests) without waiting, a negative
+        number gives them back.
+        """
+        with self.condition:
+            self.in_use += nbytes
+            if nbytes < 0:
+                self.condition.notify_all()
@@ -0,0 +1,238 @@
+# ## Preprocessing
+# 1. Left align
+# 2. Perform contrast
+# 3. Remove bar
+#
+# preprocess_batch runs the same steps on a stack of images of the same size, keeping the results stacked: the
+# bar crop of every image is recorded as an offset and a valid width instead of slicing each image to its own
+# width.
+from collections import namedtuple
+
+import numpy as np
+
+from .dtypes import DEFAULT_POLICY
+from .transform import WORKING_SIZE, Preprocessing_Transform
+
+
+def left_align(img):
+    """
+    Determines whether the breast is aligned to the right or left side of the image
+    by measuring the mean gray level of either half. Flips the image to the left if it
+    is right-aligned.
+
+    Parameters:
+        img: The numpy array representing the image.
+
+    Assumptions:
+        - The half of the image on which the majority of the breast region lies has a higher mean than the othe half
+        - The input image is LCC view
+
+    Returns:
+        numpy array with the left aligned image.
+    """
+    pixels = np.asarray(img)
+    if is_right_aligned(pixels):
+        return pixels[:, ::-1]
+    return pixels
+
+
+def is_right_aligned(pixels):
+    """
+    Returns:
+        True if the mean grey level of the right half of the resized image is higher than that of the left half.
+    """
+    half = pixels.shape[1] // 2
+    return np.mean(pixels[:, 0:half]) < np.mean(pixels[:, half:])
+
+
+def perform_contrast(img):
+    """
+    Adjusts the contrast of the given image by a specific factor.
+
+    Parameters:
+        img: PIL image to be adjusted
+    Assumptions:
+        None
+    Returns:
+        PIL image with the contrast adjusted.
+    """
+    from PIL import ImageEnhance
+
+    enhancer = ImageEnhance.Contrast(img)
+    factor = 1.3  # increase contrast
+    img = enhancer.enhance(factor)
+    return img
+
+
+def remove_bar(img):
+    """
+    Finds the width of the black bar on the left of the image by checking iteratively until a pixel whose value is greater than
+    the mean of the grey values of the image is found. Then crops the image to remove the bar.
+
+    Parameters:
+        img: numpy array of the image to be adjusted
+    Assumptions:
+        - There is no blank space at the top of the image (not even 1px)
+        - The image is left-aligned
+        - The black bar is darker than the mean grey level of the image, and the pectoral muscle region is brighter.
+    Returns:
+        Numpy array of the cropped image
+    """
+    return img[:, bar_width(img):]
+
+
+def bar_width(img):
+    """
+    Returns:
+        The number of columns of the black bar remove_bar crops from the left of the image.
+    """
+    width = 0
+    mean = np.mean(img)
+    while img[1, width] <= mean:
+        width += 1
+    return width
+
+
+def preprocess_image(img, dtype_policy=DEFAULT_POLICY, return_transform=False, size=WORKING_SIZE):
+    """
+    Combines all of the above preprocessing steps together on a given image.
+
+    Parameters:
+        img: PIL image to be adjusted
+        dtype_policy: Dtype_Policy giving the dtype of the returned image.
+        return_transform: whether to also return the Preprocessing_Transform mapping the result back to img.
+        size: side of the square working frame the image is resized to (see segmentation.resolution).
+    Assumptions:
+        - There is no blank space at the top of the image (not even 1px).
+        - We want to optimize for speed over precision.
+        - The input image is LCC view.
+        - The half of the image on which the majority of the breast region lies has a higher mean than the other half.
+
+    Returns:
+        numpy array ready for the segmentation algorithms, and the Preprocessing_Transform if return_transform is set.
+    """
+    original_shape = (img.size[1], img.size[0])
+    img = np.asarray(img.resize((size, size)))
+    flipped = is_right_aligned(img)
+    if flipped:
+        img = img[:, ::-1]
+    bar = bar_width(img)
+    img = img[:, bar:size]
+    img = dtype_policy.to_image(np.interp(img, [np.min(img), np.max(img)], [0, 255]))
+    if return_transform:
+        return img, Preprocessing_Transform(original_shape, flipped, bar, size)
+    return img
+
+
+def preprocessing(image, dtype_policy=DEFAULT_POLICY, return_transform=False, size=WORKING_SIZE):
+    """
+    Runs the contrast adjustment followed by the preprocessing steps on a decoded image.
+
+    Parameters:
+        image: PIL image in grey scale ("L") mode.
+        dtype_policy: Dtype_Policy giving the dtype of the returned image.
+        return_transform: whether to also return the Preprocessing_Transform mapping the result back to image.
+        size: side of the square working frame.
+
+    Returns:
+        numpy array of the preprocessed image, and the Preprocessing_Transform if return_transform is set.
+    """
+    contrasted_img = perform_contrast(image)
+    return preprocess_image(contrasted_img, dtype_policy, return_transform, size)
+
+
+class Preprocessed_Batch(namedtuple('Preprocessed_Batch', ['images', 'offsets', 'widths', 'flipped',
+                                                           'original_shape'])):
+    """
+    Stack of preprocessed images.
+
+    Fields:
+        images: (N, size, size) array. The preprocessed image i is images[i, :, :widths[i]],
+                the columns after it are 0.
+        offsets: 1d array of the number of columns of the bar cropped from the left of every image.
+        widths: 1d array of the number of valid columns of every image, size - offsets.
+        flipped: 1d boolean array of whether every image was flipped to the left.
+        original_shape: (rows, columns) of the images before preprocessing.
+    """
+
+    def image(self, index):
+        """
+        Returns:
+            The preprocessed image, the same as preprocessing returns for it.
+        """
+        return self.images[index, :, :self.widths[index]]
+
+    def transform(self, index):
+        """
+        Returns:
+            The Preprocessing_Transform mapping the preprocessed image back to the original one.
+        """
+        return Preprocessing_Transform(self.original_shape, bool(self.flipped[index]), int(self.offsets[index]),
+                                       self.images.shape[1])
+
+    def valid(self):
+        """
+        Returns:
+            (N, 1, size) boolean array of the valid columns of every image.
+        """
+        return (np.arange(self.images.shape[2]) < self.widths[:, None])[:, None, :]
+
+
+def preprocess_batch(stack, dtype_policy=DEFAULT_POLICY, size=WORKING_SIZE):
+    """
+    Runs preprocessing on a stack of images. The contrast adjustment and the resize run per image in PIL, whose
+    C loops are faster than the same arithmetic over the stack in numpy; the flip, the bar crop and the rescale
+    to the full grey level range run over the whole stack at once, with no loop over the images. Every image comes
+    out the same as preprocessing(image) gives it.
+
+    Parameters:
+        stack: (N, rows, columns) uint8 array of grey scale images.
+        dtype_policy: Dtype_Policy giving the dtype of the preprocessed images.
+        size: side of the square working frame.
+
+    Returns:
+        Preprocessed_Batch.
+    """
+    from PIL import Image
+
+    stack = np.asarray(stack)
+    if stack.ndim != 3:
+        raise ValueError("Images should be stacked along the first axis of a 3d array")
+    resized = np.stack([np.asarray(perform_contrast(Image.fromarray(pixels)).resize((size, size)))
+                        for pixels in stack])
+
+    # the flip and bar decisions of left_align and remove_bar for every image at once; the sums of the grey levels
+    # are exact, so comparing them gives the same answers as comparing np.mean
+    count = len(stack)
+    half = size // 2
+    flipped = resized[:, :, :half].sum(axis=(1, 2), dtype=np.int64) < \
+        resized[:, :, half:].sum(axis=(1, 2), dtype=np.int64)
+    means = resized.reshape(count, -1).sum(axis=1, dtype=np.int64) / resized[0].size
+    second_rows = np.where(flipped[:, None], resized[:, 1, ::-1], resized[:, 1, :])
+    brighter = second_rows > means[:, None]
+    if not brighter.any(axis=1).all():
+        raise ValueError("The second row of an image has no pixel brighter than the mean of the image")
+    offsets = np.argmax(brighter, axis=1)
+    widths = size - offsets
+
+    # shifts every image left past its bar through a view of the left aligned images padded with size zero
+    # columns: the shifted image i is the window of size columns starting at column offsets[i]
+    padded = np.zeros((count, size, 2 * size), dtype=resized.dtype)
+    padded[:, :, :size] = resized
+    padded[flipped, :, :size] = resized[flipped, :, ::-1]
+    shifted = np.lib.stride_tricks.sliding_window_view(padded, size, axis=2)[np.arange(count), :, offsets]
+
+    # rescales every image to the full grey level range with a table of its 256 grey levels, the same arithmetic
+    # as np.interp(img, [min, max], [0, 255]) on its valid columns. The tables are looked up in one flat array,
+    # grey level g of image i at i * 256 + g
+    valid = np.arange(size)[None, :] < widths[:, None]
+    low = np.where(valid, shifted.min(axis=1), 255).min(axis=1).astype(np.float64)[:, None]
+    high = np.where(valid, shifted.max(axis=1), 0).max(axis=1).astype(np.float64)[:, None]
+    levels = np.arange(256, dtype=np.float64)[None, :]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        tables = dtype_policy.to_image(np.where(levels >= high, 255.0, 255.0 / (high - low) * (levels - low)))
+    indices = shifted.astype(np.intp)
+    indices += np.arange(0, count * 256, 256)[:, None, None]
+    images = np.take(tables.ravel(), indices)
+    images *= valid[:, None, :]
+    return Preprocessed_Batch(images, offsets, widths, flipped, stack.shape[1:])
@@ -0,0 +1,219 @@
+# Region Growing Algorithm
+import sys
+
+import numpy as np
+
+from .dtypes import DEFAULT_POLICY
+from .flood_fill import Flood_Fill
+from .kernels import GROWN, KERNEL_STEPS, LEAKED, get_kernel
+from .resolution import scale_area
+from .roi import estimate_roi, map_to_frame, touches_roi_edge
+from .threshold_selection import CASCADE, PREDICTED, predict_threshold
+from .transform import WORKING_SIZE
+
+# thresholds tried in order until the region stops growing before max_iter is reached
+THRESHOLDS = [60, 40, 30, 20, 10, 5, 2.5]
+
+# grow the region one pixel at a time, always adding the contour pixel closest to the region mean
+CLASSIC = 'classic'
+
+# grow the region one wavefront at a time with whole-array operations
+FLOOD_FILL = 'flood-fill'
+
+
+def is_pixel_inside_image(pixel, img_shape):
+    return 0 <= pixel[0] < img_shape[0] and 0 <= pixel[1] < img_shape[1]
+
+
+class Region_Growing():
+    def __init__(self, img, max_iter, threshold, conn=4, deadline=None, dtype_policy=DEFAULT_POLICY):
+        self.img = img
+        # grey levels as python numbers, numpy scalar arithmetic (on uint8 in particular) is slow pixel by pixel
+        self.pixels = np.asarray(img).tolist()
+        self.segmentation = np.empty(shape=img.shape, dtype=dtype_policy.mask)
+        self.segmentation.fill(255)
+        self.max_iter_to_change_threshold = max_iter
+
+        self.threshold = threshold
+        self.deadline = deadline
+        self.seeds = [(1, 1)]
+        if conn == 4:
+            self.orientations = [(1, 0), (0, 1), (-1, 0), (0, -1)]
+        elif conn == 8:
+            self.orientations = [(1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1), (0, -1), (1, -1)]  # 8 connectivity
+        else:
+            raise ValueError("(%s) Connectivity type not known (4 or 8 available)!" % sys._getframe().f_code.co_name)
+
+    def segment(self):
+        """
+        Segment the image with the provided user seeds using region growing. If the deadline runs out
+        the region grown so far is returned and the deadline is marked as exceeded.
+        """
+        kernel = get_kernel('grow_region')
+        if kernel is not None:
+            return self.__segment_compiled(kernel)
+        for seed in self.seeds:
+            curr_pixel = [seed[1], seed[0]]
+            if self.segmentation[curr_pixel[0], curr_pixel[1]] == 0:
+                continue  # pixel already explored
+            contour = []
+            seg_size = 1
+            mean_seg_value = float(self.pixels[curr_pixel[0]][curr_pixel[1]])
+            dist = 0
+            iterations = 0
+            while dist < self.threshold:
+                if iterations > self.max_iter_to_change_threshold and self.threshold != 2.5:
+                    return 0
+                if self.deadline is not None and self.deadline.expired():
+                    return self.segmentation
+                # Include current pixel in segmentation
+                self.segmentation[curr_pixel[0], curr_pixel[1]] = 0
+                # Explore neighbours of current pixel
+                contour = self.__explore_neighbours(contour, curr_pixel)
+                # Get the nearest neighbour
+                nearest_neighbour_idx, dist = self.__get_nearest_neighbour(contour, mean_seg_value)
+                # If no more neighbours to grow, move to the next seed
+                if nearest_neighbour_idx == -1: break
+                # Update Current pixel to the nearest neighbour and increment size
+                curr_pixel = contour[nearest_neighbour_idx]
+                seg_size += 1
+                # Update Mean pixel value for segmentation
+                mean_seg_value = (mean_seg_value * seg_size + float(self.pixels[curr_pixel[0]][curr_pixel[1]])) / (
+                        seg_size + 1)
+                # Delete from contour once the nearest neighbour as chosen as the current node for expansion
+                iterations += 1
+                del contour[nearest_neighbour_idx]
+        return self.segmentation
+
+    def __segment_compiled(self, kernel):
+        """
+        segment with the compiled grow_region kernel, which checks the deadline every KERNEL_STEPS iterations.
+        """
+        columns = self.img.shape[1]
+        pixels = np.asarray(self.img, dtype=np.float64).ravel()
+        segmentation = self.segmentation.reshape(-1)
+        row_offsets = np.array([orientation[0] for orientation in self.orientations], dtype=np.int64)
+        column_offsets = np.array([orientation[1] for orientation in self.orientations], dtype=np.int64)
+        contour = np.empty(pixels.size, dtype=np.int64)
+        for seed in self.seeds:
+            current = seed[1] * columns + seed[0]
+            if segmentation[current] == 0:
+                continue  # pixel already explored
+            # current pixel, contour length, region size, iterations
+            state = np.array([current, 0, 1, 0], dtype=np.int64)
+            mean_and_distance = np.array([pixels[current], 0.0])
+            status = None
+            while status != GROWN:
+                if self.deadline is not None and self.deadline.expired():
+                    return self.segmentation
+                status = kernel(pixels, segmentation, columns, row_offsets, column_offsets, contour, state,
+                                mean_and_distance, float(self.threshold), self.max_iter_to_change_threshold,
+                                self.threshold != 2.5, KERNEL_STEPS)
+                if status == LEAKED:
+                    return 0
+        return self.segmentation
+
+    def display_and_resegment(self, name="Region Growing"):
+        # Display original image where segmentation was not done
+        result = np.minimum(self.img, self.segmentation)
+        result = np.array(result, dtype=np.uint8)
+
+        # Display the result
+        return result
+
+    def __explore_neighbours(self, contour, current_pixel):
+        for orientation in self.orientations:
+            neighbour = self.__get_neighbouring_pixel(current_pixel, orientation, self.img.shape)
+            if neighbour is None:
+                continue
+            if self.segmentation[neighbour[0], neighbour[1]] == 255:
+                contour.append(neighbour)
+                self.segmentation[neighbour[0], neighbour[1]] = 150
+        return contour
+
+    def __get_neighbouring_pixel(self, current_pixel, orient, img_shape):
+        neighbour = (current_pixel[0] + orient[0], current_pixel[1] + orient[1])
+        if is_pixel_inside_image(pixel=neighbour, img_shape=img_shape):
+            return neighbour
+        else:
+            return None
+
+    def __get_nearest_neighbour(self, contour, mean_seg_value):
+        dist_list = [abs(self.pixels[pixel[0]][pixel[1]] - mean_seg_value) for pixel in contour]
+        if len(dist_list) == 0: return -1, 1000
+        min_dist = min(dist_list)
+        index = dist_list.index(min_dist)
+        return index, min_dist
+
+
+ENGINES = {CLASSIC: Region_Growing, FLOOD_FILL: Flood_Fill}
+
+
+def find_region(image_data, max_iter, neighbours, deadline=None, threshold_mode=CASCADE, engine=CLASSIC, roi=False,
+                dtype_policy=DEFAULT_POLICY, size=WORKING_SIZE):
+    """
+    Runs region growing with decreasing thresholds until the region stops growing within max_iter iterations.
+    In PREDICTED mode the cascade starts at the threshold predicted from the image histogram, so the region
+    is usually grown only once. If the deadline runs out, the region grown so far with the threshold being
+    tried is kept instead and deadline.exceeded is set.
+
+    With roi each threshold is first tried on the estimated bounding box of the muscle. If the region reaches
+    the edge of the box the threshold is tried again on the full image, so the result is the same as without
+    roi.
+
+    Parameters:
+        image_data: numpy array of the preprocessed image.
+        max_iter: number of iterations after which a threshold is considered to have leaked into the breast, in
+                  the 256 px working frame. It is scaled with the area of the frame of the given size.
+        neighbours: connectivity used when growing the region (4 or 8).
+        deadline: optional Deadline shared with the caller.
+        threshold_mode: CASCADE or PREDICTED.
+        engine: CLASSIC (pixel at a time) or FLOOD_FILL (one wavefront at a time).
+        roi: whether to grow the region on the estimated bounding box of the muscle first.
+        dtype_policy: Dtype_Policy of the segmentation array.
+        size: side of the working frame the image was preprocessed to.
+
+    Returns:
+        The engine (Region_Growing or Flood_Fill) that segmented the image. Its segmentation array is 0 inside
+        the region.
+    """
+    if engine not in ENGINES:
+        raise ValueError("Engine should be either CLASSIC or FLOOD_FILL")
+    if threshold_mode == CASCADE:
+        thresholds = THRESHOLDS
+    elif threshold_mode == PREDICTED:
+        thresholds = THRESHOLDS[THRESHOLDS.index(predict_threshold(image_data, THRESHOLDS, size)):]
+    else:
+        raise ValueError("Threshold mode should be either CASCADE or PREDICTED")
+    max_iter = scale_area(max_iter, size)
+    rows, columns = estimate_roi(image_data, size) if roi else image_data.shape
+    for i in thresholds:
+        region_growing = ENGINES[engine](image_data[:rows, :columns], max_iter, threshold=i, conn=neighbours,
+                                         deadline=deadline, dtype_policy=dtype_policy)
+        result = region_growing.segment()
+        if (rows, columns) != image_data.shape:
+            if touches_roi_edge(region_growing.segmentation == 0, image_data.shape) and not (
+                    deadline is not None and deadline.exceeded):
+                # the region may have grown differently without the edge of the ROI, grow it on the full image
+                region_growing = ENGINES[engine](image_data, max_iter, threshold=i, conn=neighbours,
+                                                 deadline=deadline, dtype_policy=dtype_policy)
+                result = region_growing.segment()
+            else:
+                region_growing = map_to_frame(region_growing, image_data)
+        if isinstance(result, int):
+            continue
+        else:
+            return region_growing
+
+
+def region_growing(image_data, max_iter, neighbours, segmentation_name="Region Growing", deadline=None,
+                   threshold_mode=CASCADE, engine=CLASSIC, roi=False, dtype_policy=DEFAULT_POLICY, size=WORKING_SIZE):
+    """
+    Segments the pectoral muscle with region growing, see find_region for the parameters.
+
+    Returns:
+        numpy array of the segmented image.
+    """
+    region = find_region(image_data, max_iter, neighbours, deadline=deadline, threshold_mode=threshold_mode,
+                         engine=engine, roi=roi, dtype_policy=dtype_policy, size=size)
+    return region.display_and_resegment(name=segmentation_name)
@@ -0,0 +1,48 @@
+# ## Working resolution
+# The engines were tuned on the 256 px working frame (WORKING_SIZE). A smaller frame is faster and a larger one
+# follows the muscle boundary more closely. The parameters given for the 256 px frame are scaled to the frame
+# the image was preprocessed to:
+# - lengths in pixels (windows, margins, the initial level set region) with the side of the frame,
+# - iteration caps that bound the number of pixels of a region (max_iter) with its area,
+# - the level set's outer iterations with its side, since the contour moves a bounded number of pixels per
+#   iteration, and the weight of its length term with the side of smaller frames, whose contours are more
+#   curved. The time step is a property of the unit pixel grid and stays the same.
+# The grey level thresholds do not depend on the size of the frame.
+from .transform import WORKING_SIZE
+
+# sides of the working frame the API and the command line tools accept
+RESOLUTIONS = [128, 256, 512]
+
+
+def working_size_for_budget(pixels):
+    """
+    Returns:
+        The largest of RESOLUTIONS whose frame has at most that many pixels, the smallest one if none does.
+    """
+    fitting = [size for size in RESOLUTIONS if size * size <= pixels]
+    return fitting[-1] if fitting else RESOLUTIONS[0]
+
+
+def scale_factor(size):
+    """
+    Returns:
+        Ratio of the side of a working frame to that of the 256 px frame.
+    """
+    return size / WORKING_SIZE
+
+
+def scale_length(length, size):
+    """
+    Returns:
+        A number of pixels along a side of the 256 px frame scaled to a frame of that size, at least 1.
+    """
+    return max(1, int(round(length * scale_factor(size))))
+
+
+def scale_area(count, size):
+    """
+    Returns:
+        A number of pixels of the 256 px frame (or of iterations adding one pixel each) scaled to the area of a
+        frame of that size, at least 1.
+    """
+    return max(1, int(round(count * scale_factor(size) ** 2)))
@@ -0,0 +1,379 @@
+# ## Results store
+# Segmentation results kept in an SQLite database instead of flat CSV files that every analysis reads and scans
+# in full. A row holds the result of one configuration on one image, in the format of the golden corpus (mask
+# hash, shape, area, per-row boundary and seconds), with what is needed to look it up again and to report on it:
+# the hash of the decoded input pixels, the engine, the parameters, the version of the engine code, the stage
+# timings and the radiologist's label.
+#
+# Results are inserted in bulk, one transaction per batch. The columns queries filter on are indexed: a cache
+# lookup by input hash, parameters and version reads one index entry instead of the whole table, and the reports
+# group by engine and parameters.
+#
+# The version is a hash of the sources of the segmentation package, so results recorded before the engines
+# changed are never returned by lookups. Only the standard library is used.
+import argparse
+import csv
+import hashlib
+import inspect
+import json
+import os
+import sqlite3
+import threading
+import time
+
+import numpy as np
+
+from .golden import CONFIGS, LEVEL_SET, decode_boundary, encode_boundary, image_name, segment_mask
+from .resolution import RESOLUTIONS
+from .transform import WORKING_SIZE
+
+SCHEMA = [
+    """CREATE TABLE IF NOT EXISTS results (
+        id INTEGER PRIMARY KEY,
+        image TEXT NOT NULL,
+        input_hash TEXT,
+        engine TEXT NOT NULL,
+        params TEXT NOT NULL,
+        params_hash TEXT NOT NULL,
+        version TEXT NOT NULL,
+        mask_hash TEXT,
+        height INTEGER,
+        width INTEGER,
+        area INTEGER,
+        boundary BLOB,
+        seconds REAL,
+        timings TEXT,
+        label INTEGER,
+        error TEXT,
+        created REAL NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS results_image ON results (image, params_hash)",
+    "CREATE INDEX IF NOT EXISTS results_lookup ON results (input_hash, params_hash, version)",
+    "CREATE INDEX IF NOT EXISTS results_config ON results (engine, params_hash)",
+    "CREATE INDEX IF NOT EXISTS results_mask ON results (mask_hash)",
+    "CREATE INDEX IF NOT EXISTS results_label ON results (label)",
+]
+
+# radiologist labels of the evaluation CSV files
+ANOMALY = -1
+UNACCEPTABLE = 0
+ACCEPTABLE = 1
+
+# defaults of the keyword arguments of segment_mask, filled into the parameters of every result
+DEFAULT_PARAMS = {name: parameter.default for name, parameter in inspect.signature(segment_mask).parameters.items()
+                  if parameter.default is not inspect.Parameter.empty}
+
+# hash of the sources of the segmentation package, computed on first use
+code_version = None
+
+
+def engine_version():
+    """
+    Returns:
+        Short hex digest of the sources of the segmentation package, which changes whenever an engine does.
+    """
+    global code_version
+    if code_version is None:
+        directory = os.path.dirname(os.path.abspath(__file__))
+        digest = hashlib.sha256()
+        for name in sorted(os.listdir(directory)):
+            if name.endswith(".py"):
+                with open(os.path.join(directory, name), 'rb') as source:
+                    digest.update(name.encode() + source.read())
+        code_version = digest.hexdigest()[:16]
+    return code_version
+
+
+def canonical_params(config):
+    """
+    Parameters:
+        config: keyword arguments of segmentation.golden.segment_mask.
+
+    Returns:
+        The configuration with the defaults of segment_mask filled in and without the number of threads, which
+        does not change the result, so equal configurations have equal parameters.
+    """
+    params = dict(DEFAULT_PARAMS, **config)
+    params.pop('threads', None)
+    if params['algorithm'] == LEVEL_SET:
+        # the region growing parameters do not apply
+        params.pop('engine')
+        params.pop('threshold_mode')
+    return params
+
+
+def params_key(config):
+    """
+    Returns:
+        Tuple of the engine, the canonical parameters as JSON and their hash.
+    """
+    params = canonical_params(config)
+    text = json.dumps(params, sort_keys=True)
+    return params.get('engine', params['algorithm']), text, hashlib.sha256(text.encode()).hexdigest()[:16]
+
+
+def percentile(values, fraction):
+    """
+    Returns:
+        The value at that fraction of the sorted values (nearest rank).
+    """
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+class Results_Store:
+    """
+    Segmentation results in an SQLite database.
+
+    Parameters:
+        path: path of the database file, created if it does not exist, or ":memory:".
+    """
+
+    def __init__(self, path=":memory:"):
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.row_factory = sqlite3.Row
+        self.lock = threading.Lock()
+        with self.lock, self.connection:
+            if path != ":memory:":
+                # readers do not block the batch inserts
+                self.connection.execute("PRAGMA journal_mode=WAL")
+            for statement in SCHEMA:
+                self.connection.execute(statement)
+
+    def add(self, entries):
+        """
+        Inserts results in a single transaction.
+
+        Parameters:
+            entries: iterable of dictionaries with the 'image' (path or name, stored as the file name without
+                     extension like in the golden corpus), the 'config' (keyword arguments of segment_mask) and
+                     the 'result' in the format of the golden corpus (or {'error': message}), and optionally the
+                     'input_hash' (taken from the result otherwise), the stage 'timings' and the 'label'.
+
+        Returns:
+            Number of results inserted.
+        """
+        version = engine_version()
+        now = time.time()
+        rows = []
+        # the entries of a batch share a few configurations
+        keys = {}
+        for entry in entries:
+            result = entry['result']
+            config = json.dumps(entry['config'], sort_keys=True)
+            if config not in keys:
+                keys[config] = params_key(entry['config'])
+            engine, params, params_hash = keys[config]
+            shape = result.get('shape', [None, None])
+            boundary = result.get('boundary')
+            timings = entry.get('timings')
+            rows.append((image_name(str(entry['image'])), entry.get('input_hash', result.get('input_hash')), engine,
+                         params, params_hash, version, result.get('hash'), shape[0], shape[1], result.get('area'),
+                         decode_boundary(boundary).astype('<u2').tobytes() if boundary is not None else None,
+                         result.get('seconds'), json.dumps(timings) if timings is not None else None,
+                         entry.get('label'), result.get('error'), now))
+        with self.lock, self.connection:
+            self.connection.executemany(
+                "INSERT INTO results (image, input_hash, engine, params, params_hash, version, mask_hash, height, "
+                "width, area, boundary, seconds, timings, label, error, created) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        return len(rows)
+
+    def entry(self, row):
+        """
+        Returns:
+            Dictionary of a row, its result in the format of the golden corpus.
+        """
+        if row['error'] is not None:
+            result = {'error': row['error']}
+        else:
+            result = {'hash': row['mask_hash'], 'shape': [row['height'], row['width']], 'area': row['area'],
+                      'boundary': encode_boundary(np.frombuffer(row['boundary'], dtype='<u2')),
+                      'seconds': row['seconds']}
+        return {'image': row['image'], 'input_hash': row['input_hash'], 'engine': row['engine'],
+                'config': json.loads(row['params']), 'version': row['version'], 'result': result,
+                'timings': json.loads(row['timings']) if row['timings'] is not None else None,
+                'label': row['label']}
+
+    def lookup(self, input_hash, config):
+        """
+        Returns:
+            The latest successful result of the configuration on the image with those pixels, recorded by the
+            current version of the engines, in the format of the golden corpus, or None.
+        """
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT * FROM results WHERE input_hash = ? AND params_hash = ? AND version = ? "
+                "AND error IS NULL ORDER BY id DESC LIMIT 1",
+                (input_hash, params_key(config)[2], engine_version())).fetchone()
+        return self.entry(row)['result'] if row is not None else None
+
+    def query(self, image=None, config=None, current=False):
+        """
+        Parameters:
+            image: only the results of this image (path or name).
+            config: only the results of this configuration.
+            current: only the results of the current version of the engines.
+
+        Returns:
+            List of the matching results as dictionaries (see entry), in the order they were inserted.
+        """
+        conditions, values = [], []
+        if image is not None:
+            conditions.append("image = ?")
+            values.append(image_name(str(image)))
+        if config is not None:
+            conditions.append("params_hash = ?")
+            values.append(params_key(config)[2])
+        if current:
+            conditions.append("version = ?")
+            values.append(engine_version())
+        where = " WHERE " + " AND ".join(conditions) if conditions else ""
+        with self.lock:
+            rows = self.connection.execute("SELECT * FROM results" + where + " ORDER BY id", values).fetchall()
+        return [self.entry(row) for row in rows]
+
+    def set_labels(self, labels, config=None):
+        """
+        Records the radiologist's labels of the results of the images.
+
+        Parameters:
+            labels: dictionary of the label (ANOMALY, UNACCEPTABLE or ACCEPTABLE) by image name.
+            config: only label the results of this configuration.
+
+        Returns:
+            Number of results labelled.
+        """
+        if config is None:
+            statement = "UPDATE results SET label = ? WHERE image = ?"
+            rows = [(label, image) for image, label in labels.items()]
+        else:
+            params_hash = params_key(config)[2]
+            statement = "UPDATE results SET label = ? WHERE image = ? AND params_hash = ?"
+            rows = [(label, image, params_hash) for image, label in labels.items()]
+        with self.lock, self.connection:
+            return self.connection.executemany(statement, rows).rowcount
+
+    def latency_report(self):
+        """
+        Returns:
+            Dictionary by parameters (as JSON) of the engine, the number of results, the number of failures and
+            the mean, median and 95th percentile of the seconds of the successful ones.
+        """
+        report = {}
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT engine, params, seconds, error FROM results ORDER BY engine, params, seconds").fetchall()
+        for engine, params, seconds, error in rows:
+            group = report.setdefault(params, {'engine': engine, 'count': 0, 'failed': 0, 'seconds': []})
+            group['count'] += 1
+            if error is not None:
+                group['failed'] += 1
+            elif seconds is not None:
+                group['seconds'].append(seconds)
+        for group in report.values():
+            seconds = group.pop('seconds')
+            group.update({'mean': sum(seconds) / len(seconds), 'median': percentile(seconds, 0.5),
+                          'p95': percentile(seconds, 0.95)} if seconds else {'mean': None, 'median': None,
+                                                                              'p95': None})
+        return report
+
+    def accuracy_report(self):
+        """
+        Returns:
+            Dictionary by parameters (as JSON) of the engine, the number of labelled results and the fraction of
+            them with every label.
+        """
+        report = {}
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT engine, params, label, COUNT(*) FROM results WHERE label IS NOT NULL "
+                "GROUP BY engine, params, label").fetchall()
+        for engine, params, label, count in rows:
+            group = report.setdefault(params, {'engine': engine, 'labelled': 0, 'labels': {}})
+            group['labelled'] += count
+            group['labels'][label] = count
+        for group in report.values():
+            group['labels'] = {label: count / group['labelled'] for label, count in sorted(group['labels'].items())}
+        return report
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def read_evaluations(path, column='radiologist_evaluation'):
+    """
+    Reads the labels of an evaluation CSV file like level-set/level_set_results.csv.
+
+    Returns:
+        Dictionary of the label by image name ("mdb001" for image_no 1).
+    """
+    with open(path, newline='') as evaluations:
+        return {"mdb{:03d}".format(int(row['image_no'])): int(row[column]) for row in csv.DictReader(evaluations)}
+
+
+def read_results(path):
+    """
+    Returns:
+        List of the entries of a JSON lines results file written by segmentation.cluster.
+    """
+    with open(path) as results_file:
+        return [json.loads(line) for line in results_file if line.strip()]
+
+
+def print_reports(store):
+    for name, report, columns in [
+        ("latency", store.latency_report(), ['count', 'failed', 'mean', 'median', 'p95']),
+        ("accuracy", store.accuracy_report(), ['labelled', 'labels']),
+    ]:
+        print(name)
+        for params, group in sorted(report.items()):
+            print("    {} {}".format(group['engine'], params))
+            print("        " + ", ".join("{}: {}".format(column, round(group[column], 4)
+                                                         if isinstance(group[column], float) else group[column])
+                                         for column in columns))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m segmentation.results_store",
+        description="Loads segmentation results and labels into a results store and reports on them. Run from "
+                    "the rest-api directory:\n"
+                    "  python -m segmentation.results_store import results.db results.jsonl --config level-set\n"
+                    "  python -m segmentation.results_store label results.db "
+                    "../level-set/level_set_results.csv --config level-set\n"
+                    "  python -m segmentation.results_store report results.db",
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+    for command, help_text in [("import", "JSON lines results file of segmentation.cluster"),
+                               ("label", "evaluation CSV file with image_no and radiologist_evaluation columns"),
+                               ("report", None)]:
+        subparser = commands.add_parser(command)
+        subparser.add_argument("store", help="path of the database")
+        if help_text is not None:
+            subparser.add_argument("path", help=help_text)
+            subparser.add_argument("--config", required=command == "import", choices=sorted(CONFIGS),
+                                   help="segmentation configuration of the results")
+            subparser.add_argument("--working-size", type=int, choices=RESOLUTIONS, default=WORKING_SIZE,
+                                   help="side of the working frame the results were segmented in")
+    args = parser.parse_args()
+
+    with Results_Store(args.store) as store:
+        if args.command == "import":
+            config = dict(CONFIGS[args.config], size=args.working_size)
+            entries = [dict(entry, config=config) for entry in read_results(args.path)]
+            print("inserted {} results".format(store.add(entries)))
+        elif args.command == "label":
+            config = dict(CONFIGS[args.config], size=args.working_size) if args.config is not None else None
+            print("labelled {} results".format(store.set_labels(read_evaluations(args.path), config)))
+        else:
+            print_reports(store)
+
+
+if __name__ == "__main__":
+    main()
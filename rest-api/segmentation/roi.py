@@ -0,0 +1,112 @@
+# ## Region of interest
+# The pectoral muscle of a left aligned image is a wedge in the top left corner. The engines only need
+# to run on a conservative bounding box of that wedge, estimated from the intensity profiles along the
+# top rows and the left columns of the preprocessed image.
+#
+# The lengths below are given for the 256 px working frame and scaled to the frame the image was preprocessed to.
+import numpy as np
+
+from .resolution import scale_length
+from .threshold_selection import BACKGROUND_LEVEL, SEED_WINDOW, histogram_median
+from .transform import WORKING_SIZE
+
+# number of rows (columns) averaged into the top (left) intensity profile
+PROFILE_WIDTH = 16
+
+# pixels at the start of a profile skipped because of what is left of the bar
+PROFILE_SKIP = 8
+
+# the muscle ends where the profile drops this fraction of the muscle/tissue contrast below the muscle level
+ROI_LEVEL = 0.75
+
+# the estimated muscle extent is scaled by ROI_MARGIN and padded by ROI_PADDING pixels
+ROI_MARGIN = 1.5
+ROI_PADDING = 16
+
+
+def profile_end(profile, level, skip=PROFILE_SKIP):
+    """
+    Finds where an intensity profile first drops below the given level.
+
+    Parameters:
+        profile: 1d numpy array of mean grey levels.
+        level: grey level at which the muscle is considered to end.
+        skip: number of pixels at the start of the profile to skip.
+
+    Returns:
+        Index of the first pixel (after skip) below the level, or the profile length if there is none.
+    """
+    below = np.nonzero(profile[skip:] < level)[0]
+    if below.size == 0:
+        return profile.size
+    return skip + int(below[0])
+
+
+def estimate_roi(image_data, size=WORKING_SIZE):
+    """
+    Estimates a conservative bounding box of the pectoral muscle.
+
+    Parameters:
+        image_data: numpy array of the preprocessed (left aligned) image.
+        size: side of the working frame the image was preprocessed to.
+
+    Assumptions:
+        - The pectoral muscle is a bright wedge in the top left corner of the image.
+
+    Returns:
+        Tuple (rows, columns), the muscle lies within image_data[:rows, :columns].
+    """
+    height, width = image_data.shape
+    window = scale_length(SEED_WINDOW, size)
+    muscle_level = histogram_median(image_data[0:window, 0:window])
+    band = image_data[height // 8:height // 2, :]
+    tissue = band[band > BACKGROUND_LEVEL]
+    tissue_level = histogram_median(tissue) if tissue.size else 0
+    level = muscle_level - ROI_LEVEL * (muscle_level - tissue_level)
+
+    profile_width = scale_length(PROFILE_WIDTH, size)
+    skip = scale_length(PROFILE_SKIP, size)
+    muscle_width = profile_end(np.mean(image_data[0:profile_width, :], axis=0), level, skip)
+    muscle_height = profile_end(np.mean(image_data[:, 0:profile_width], axis=1), level, skip)
+    rows = min(height, int(muscle_height * ROI_MARGIN) + scale_length(ROI_PADDING, size))
+    columns = min(width, int(muscle_width * ROI_MARGIN) + scale_length(ROI_PADDING, size))
+    return rows, columns
+
+
+def touches_roi_edge(mask, image_shape, guard=0):
+    """
+    Checks whether a mask computed on the ROI reaches an edge of the ROI that lies inside the image. Growth on
+    the ROI is only the same as growth on the full image if it never got there.
+
+    Parameters:
+        mask: boolean numpy array with the shape of the ROI.
+        image_shape: shape of the full image.
+        guard: number of extra pixels next to the edge that also count as touching it.
+
+    Returns:
+        A boolean value stating if the mask touches the bottom or right edge of the ROI.
+    """
+    rows, columns = mask.shape
+    if rows < image_shape[0] and mask[rows - 1 - guard:, :].any():
+        return True
+    return columns < image_shape[1] and mask[:, columns - 1 - guard:].any()
+
+
+def map_to_frame(region, image_data):
+    """
+    Maps a region grown on the ROI back onto the full preprocessed image.
+
+    Parameters:
+        region: Region_Growing or Flood_Fill engine that segmented image_data[:rows, :columns].
+        image_data: numpy array of the full preprocessed image.
+
+    Returns:
+        The same engine, with the full image and a full-frame segmentation array.
+    """
+    segmentation = np.empty(shape=image_data.shape, dtype=region.segmentation.dtype)
+    segmentation.fill(255)
+    rows, columns = region.segmentation.shape
+    segmentation[:rows, :columns] = region.segmentation
+    region.segmentation = segmentation
+    region.img = image_data
+    return region
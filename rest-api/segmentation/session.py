@@ -0,0 +1,457 @@
+# ## Interactive sessions
+# Keeps the state of a segmentation between requests so that follow-up requests with other parameters are
+# answered from it instead of segmenting the image again.
+#
+# The classic region growing engine always adds the contour pixel closest to the region mean, and neither that
+# choice nor the mean depends on the threshold, which only decides when to stop. Growth_Trace records the order
+# the pixels join the region in and the distance of the next pixel after each one, so the region of any threshold
+# is the prefix of the trace up to the first distance at or above it, and a threshold leaks if that prefix is
+# longer than max_iter. The trace is extended lazily when a larger prefix is needed.
+#
+# The level set session keeps the level set function after every CHECKPOINT_INTERVAL-th outer iteration and after
+# the last one, so a request with fewer iterations continues from the closest checkpoint before them and one with
+# more continues from the last one.
+#
+# The state a session keeps is bounded (at most MAX_ITERATIONS outer iterations, MAX_TRACES seeds) and, with a
+# Memory_Budget, held in the budget for as long as the session is kept.
+import secrets
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from .dtypes import DEFAULT_POLICY
+from .level_set import DOUBLE_WELL, ITER_OUTER, Level_Set
+from .region_growing import THRESHOLDS
+from .resolution import scale_area, scale_length
+from .threshold_selection import CASCADE, PREDICTED, predict_threshold
+from .transform import WORKING_SIZE
+
+# seconds a session is kept after it was last used
+SESSION_TTL = 600
+
+# number of sessions kept at once, the least recently used one is dropped first
+SESSION_CAPACITY = 32
+
+# neighbours of a pixel by connectivity, in the order Region_Growing explores them
+ORIENTATIONS = {
+    4: [(1, 0), (0, 1), (-1, 0), (0, -1)],
+    8: [(1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1), (0, -1), (1, -1)],
+}
+
+# distance Region_Growing reports once the contour is empty, it stops any threshold
+NO_NEIGHBOUR = 1000
+
+# outer iterations a level set session may be asked for in the 256 px working frame, five times ITER_OUTER
+MAX_ITERATIONS = 5 * ITER_OUTER
+
+# a level set session keeps the level set function of every CHECKPOINT_INTERVAL-th outer iteration and of the last
+CHECKPOINT_INTERVAL = 5
+
+# growth traces a region growing session keeps, the least recently used seed is dropped first
+MAX_TRACES = 4
+
+# estimated bytes of a growth trace per pixel of the image (the python lists of its grey levels and of the explored
+# pixels) and per pixel of its order (the tuple, its list slots, the distance and the contour entry)
+TRACE_BYTES_PER_PIXEL = 16
+ORDER_BYTES = 120
+
+
+def max_iterations(size):
+    """
+    Returns:
+        The outer iterations a level set session in a working frame of that size may be asked for.
+    """
+    return scale_length(MAX_ITERATIONS, size)
+
+
+def kept_checkpoints(iterations):
+    """
+    Returns:
+        The number of checkpoints a level set session keeps after that many outer iterations.
+    """
+    return iterations // CHECKPOINT_INTERVAL + (1 if iterations % CHECKPOINT_INTERVAL else 0)
+
+
+def trace_bytes(pixels, traced):
+    """
+    Returns:
+        Estimated bytes of a growth trace of an image of that many pixels, with traced pixels in its order.
+    """
+    return TRACE_BYTES_PER_PIXEL * pixels + ORDER_BYTES * traced
+
+
+def dilate(mask, orientations):
+    """
+    Returns:
+        The mask grown by one pixel towards every orientation, within the frame of the mask.
+    """
+    rows, columns = mask.shape
+    dilated = mask.copy()
+    for row, column in orientations:
+        dilated[max(row, 0):rows + min(row, 0), max(column, 0):columns + min(column, 0)] |= \
+            mask[max(-row, 0):rows + min(-row, 0), max(-column, 0):columns + min(-column, 0)]
+    return dilated
+
+
+class Growth_Trace:
+    """
+    Order in which the classic region growing engine adds the pixels of an image to the region grown from a
+    seed, independently of the threshold.
+
+    Parameters:
+        img: numpy array of the preprocessed image.
+        seed: (x, y) pixel the region is grown from, as in Region_Growing.seeds.
+        conn: connectivity (4 or 8).
+    """
+
+    def __init__(self, img, seed=(1, 1), conn=4):
+        if conn not in ORIENTATIONS:
+            raise ValueError("Connectivity should be either 4 or 8")
+        self.shape = img.shape
+        self.orientations = ORIENTATIONS[conn]
+        self.pixels = np.asarray(img).tolist()
+        # pixels in the region or on its contour
+        self.explored = [[False] * self.shape[1] for _ in range(self.shape[0])]
+        # pixels in the order they joined the region, and the distance of the next one after each of them
+        self.order = []
+        self.distances = []
+        self.contour = []
+        self.current = (seed[1], seed[0])
+        self.explored[seed[1]][seed[0]] = True
+        self.mean = float(self.pixels[seed[1]][seed[0]])
+        self.size = 1
+
+    def grow(self, steps, deadline=None):
+        """
+        Adds up to steps pixels to the trace, exactly as Region_Growing.segment adds them.
+
+        Returns:
+            False if the deadline ran out first, True otherwise.
+        """
+        rows, columns = self.shape
+        for _ in range(steps):
+            if self.distances and self.distances[-1] == NO_NEIGHBOUR:
+                return True
+            if deadline is not None and deadline.expired():
+                return False
+            row, column = self.current
+            self.order.append(self.current)
+            for row_offset, column_offset in self.orientations:
+                neighbour = (row + row_offset, column + column_offset)
+                if 0 <= neighbour[0] < rows and 0 <= neighbour[1] < columns and \
+                        not self.explored[neighbour[0]][neighbour[1]]:
+                    self.explored[neighbour[0]][neighbour[1]] = True
+                    self.contour.append(neighbour)
+            if not self.contour:
+                self.distances.append(NO_NEIGHBOUR)
+                return True
+            distances = [abs(self.pixels[pixel[0]][pixel[1]] - self.mean) for pixel in self.contour]
+            distance = min(distances)
+            self.distances.append(distance)
+            self.current = self.contour.pop(distances.index(distance))
+            self.size += 1
+            self.mean = (self.mean * self.size + float(self.pixels[self.current[0]][self.current[1]])) / (
+                    self.size + 1)
+        return True
+
+    def region_size(self, threshold, max_iter, deadline=None):
+        """
+        Finds the number of pixels Region_Growing adds with a threshold, growing the trace as far as needed.
+
+        Returns:
+            Tuple of the number of pixels of the region (of the trace so far if the deadline ran out) and whether
+            the threshold leaked, i.e. the region needed more than max_iter iterations. The smallest threshold
+            of the cascade, 2.5, never leaks.
+        """
+        limit = None if threshold == 2.5 else max_iter + 1
+        index = 0
+        expired = False
+        while True:
+            end = len(self.distances) if limit is None else min(limit, len(self.distances))
+            for index in range(index, end):
+                if self.distances[index] >= threshold:
+                    return index + 1, False
+            index = end
+            if limit is not None and index >= limit:
+                return limit, True
+            if expired:
+                return len(self.order), False
+            # doubling the trace keeps the number of calls small for long regions, but never past the limit
+            steps = max(1024, len(self.distances))
+            if limit is not None:
+                steps = min(steps, limit - len(self.distances))
+            expired = not self.grow(steps, deadline)
+
+    def segmentation(self, size, dtype=DEFAULT_POLICY.mask):
+        """
+        Returns:
+            Segmentation array of the region made of the first size pixels of the trace, as Region_Growing
+            leaves it: 0 inside the region, 150 on its contour and 255 elsewhere.
+        """
+        region = np.zeros(self.shape, dtype=bool)
+        if size:
+            rows, columns = zip(*self.order[:size])
+            region[list(rows), list(columns)] = True
+        segmentation = np.full(self.shape, 255, dtype=dtype)
+        segmentation[dilate(region, self.orientations)] = 150
+        segmentation[region] = 0
+        return segmentation
+
+
+class Region_Growing_Session:
+    """
+    Classic region growing on one preprocessed image, answered from the growth traces of the seeds it was asked
+    for.
+
+    Parameters:
+        image: numpy array of the preprocessed image.
+        neighbours: connectivity (4 or 8).
+        dtype_policy: Dtype_Policy of the segmentation arrays.
+        size: side of the working frame the image was preprocessed to.
+    """
+
+    def __init__(self, image, neighbours=4, dtype_policy=DEFAULT_POLICY, size=WORKING_SIZE):
+        self.image = image
+        self.neighbours = neighbours
+        self.dtype_policy = dtype_policy
+        self.size = size
+        # growth trace by seed, least recently used first
+        self.traces = OrderedDict()
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def state_bound(size):
+        """
+        Returns:
+            Upper bound of the bytes a new session in a working frame of that size keeps after its first request.
+        """
+        return size * size + trace_bytes(size * size, size * size)
+
+    def nbytes(self):
+        """
+        Returns:
+            Estimated bytes of the state of the session.
+        """
+        with self.lock:
+            traced = [len(trace.order) for trace in self.traces.values()]
+        return self.image.nbytes + sum(trace_bytes(self.image.size, length) for length in traced)
+
+    def growth_bound(self):
+        """
+        Returns:
+            Upper bound of the bytes the state of the session grows by in one request: a new trace, or one grown
+            over the whole image.
+        """
+        return trace_bytes(self.image.size, self.image.size)
+
+    def segment(self, threshold=None, max_iter=6200, seed=(1, 1), threshold_mode=CASCADE, deadline=None):
+        """
+        Segments the image like find_region with the classic engine and without ROI.
+
+        Parameters:
+            threshold: threshold to start the cascade at, the lower thresholds of THRESHOLDS are tried after it
+                       if it leaks. None starts at the first threshold of the threshold_mode.
+            max_iter: number of iterations after which a threshold is considered to have leaked, in the 256 px
+                      working frame.
+            seed: (x, y) pixel the region is grown from.
+            threshold_mode: CASCADE or PREDICTED, used when threshold is None.
+            deadline: optional Deadline, the region of the trace grown so far is returned once it runs out.
+
+        Returns:
+            Tuple of the segmentation array (0 inside the region) and the threshold it was grown with, or
+            (None, None) if every threshold leaked, which only happens when threshold is below 2.5.
+        """
+        if threshold is not None:
+            thresholds = [threshold] + [t for t in THRESHOLDS if t < threshold]
+        elif threshold_mode == CASCADE:
+            thresholds = THRESHOLDS
+        elif threshold_mode == PREDICTED:
+            thresholds = THRESHOLDS[THRESHOLDS.index(predict_threshold(self.image, THRESHOLDS, self.size)):]
+        else:
+            raise ValueError("Threshold mode should be either CASCADE or PREDICTED")
+        max_iter = scale_area(max_iter, self.size)
+        seed = tuple(seed)
+        with self.lock:
+            if seed not in self.traces:
+                while len(self.traces) >= MAX_TRACES:
+                    self.traces.popitem(last=False)
+                self.traces[seed] = Growth_Trace(self.image, seed, self.neighbours)
+            self.traces.move_to_end(seed)
+            trace = self.traces[seed]
+            for t in thresholds:
+                size, leaked = trace.region_size(t, max_iter, deadline)
+                if not leaked:
+                    return trace.segmentation(size, self.dtype_policy.mask), t
+        return None, None
+
+
+class Level_Set_Session:
+    """
+    Level set evolution on one preprocessed image (without ROI), answered from the level set functions kept
+    after every outer iteration.
+
+    Parameters:
+        image: numpy array of the preprocessed image.
+        threads: number of threads of the evolution.
+        dtype_policy: Dtype_Policy of the level set function.
+        size: side of the working frame the image was preprocessed to.
+    """
+
+    def __init__(self, image, threads=1, dtype_policy=DEFAULT_POLICY, size=WORKING_SIZE):
+        self.image = image
+        self.size = size
+        self.level_set = Level_Set(DOUBLE_WELL, threads=threads, dtype_policy=dtype_policy)
+        self.params = self.level_set.initialise_params(image, size)
+        # checkpoints kept, by increasing outer iterations
+        self.checkpoints = []
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def state_bound(size, iterations=None, dtype_policy=DEFAULT_POLICY):
+        """
+        Returns:
+            Upper bound of the bytes a new session in a working frame of that size keeps after a first request
+            with that many outer iterations (the default parameters' one if None).
+        """
+        iterations = iterations if iterations is not None else scale_length(ITER_OUTER, size)
+        return size * size * (1 + kept_checkpoints(iterations) * np.dtype(dtype_policy.field).itemsize)
+
+    def nbytes(self):
+        """
+        Returns:
+            Bytes of the state of the session.
+        """
+        with self.lock:
+            return self.image.nbytes + sum(checkpoint.phi.nbytes for checkpoint in self.checkpoints)
+
+    def growth_bound(self, iterations=None):
+        """
+        Returns:
+            Upper bound of the bytes the state of the session grows by in a request with that many outer
+            iterations.
+        """
+        iterations = iterations if iterations is not None else self.params['iter_outer']
+        return kept_checkpoints(iterations) * self.image.size * np.dtype(self.level_set.dtype_policy.field).itemsize
+
+    def segment(self, iterations=None, deadline=None):
+        """
+        Parameters:
+            iterations: number of outer iterations, the default parameters' one if None, at most
+                        max_iterations(size).
+            deadline: optional Deadline.
+
+        Returns:
+            The level set function after the outer iterations and the refinement.
+        """
+        iterations = iterations if iterations is not None else self.params['iter_outer']
+        if iterations > max_iterations(self.size):
+            raise ValueError("A session evolves at most {} outer iterations".format(max_iterations(self.size)))
+        with self.lock:
+            earlier = [checkpoint for checkpoint in self.checkpoints if checkpoint.outer_iterations <= iterations]
+            checkpoints = []
+            phi = self.level_set.find_lsf(**dict(self.params, iter_outer=iterations), deadline=deadline,
+                                          checkpoint=earlier[-1] if earlier else None, checkpoints=checkpoints)
+            self.keep(checkpoints)
+            return phi
+
+    def keep(self, checkpoints):
+        """
+        Adds the checkpoints of an evolution to those kept, keeping every CHECKPOINT_INTERVAL-th and the last one.
+        Called with the lock held.
+        """
+        kept = {checkpoint.outer_iterations: checkpoint for checkpoint in self.checkpoints + checkpoints}
+        last = max(kept, default=0)
+        self.checkpoints = [kept[n] for n in sorted(kept) if n % CHECKPOINT_INTERVAL == 0 or n == last]
+
+
+class Session_Store:
+    """
+    Sessions by id, dropped once they have not been used for ttl seconds or, beyond capacity or the memory budget,
+    least recently used first.
+
+    Parameters:
+        ttl: seconds a session is kept after it was last used.
+        capacity: number of sessions kept at once.
+        budget: optional Memory_Budget the state of the sessions is held in for as long as they are kept.
+    """
+
+    def __init__(self, ttl=SESSION_TTL, capacity=SESSION_CAPACITY, budget=None):
+        self.ttl = ttl
+        self.capacity = capacity
+        self.budget = budget
+        # session and expiry time by id, least recently used first
+        self.sessions = OrderedDict()
+        # bytes held in the budget by id
+        self.held = {}
+        self.lock = threading.Lock()
+
+    def drop(self, session_id):
+        # called with the lock held
+        del self.sessions[session_id]
+        held = self.held.pop(session_id, 0)
+        if self.budget is not None and held:
+            self.budget.charge(-held)
+
+    def expire(self):
+        # called with the lock held
+        now = time.monotonic()
+        for session_id in [session_id for session_id, (_, expires) in self.sessions.items() if expires <= now]:
+            self.drop(session_id)
+
+    def add(self, session):
+        """
+        Returns:
+            The id of the new session.
+        """
+        session_id = secrets.token_hex(16)
+        nbytes = session.nbytes() if self.budget is not None else 0
+        with self.lock:
+            self.expire()
+            while self.sessions and len(self.sessions) >= self.capacity:
+                self.drop(next(iter(self.sessions)))
+            while self.sessions and nbytes and self.budget.in_use + nbytes > self.budget.budget_bytes:
+                self.drop(next(iter(self.sessions)))
+            self.sessions[session_id] = (session, time.monotonic() + self.ttl)
+            if nbytes:
+                self.held[session_id] = nbytes
+                self.budget.charge(nbytes)
+        return session_id
+
+    def account(self, session_id):
+        """
+        Holds the current state of a session in the budget, after a request grew it.
+        """
+        if self.budget is None:
+            return
+        with self.lock:
+            if session_id not in self.sessions:
+                return
+            nbytes = self.sessions[session_id][0].nbytes()
+            self.budget.charge(nbytes - self.held.get(session_id, 0))
+            self.held[session_id] = nbytes
+
+    def get(self, session_id):
+        """
+        Returns:
+            The session, whose ttl starts again, or None if there is no such session or it expired.
+        """
+        with self.lock:
+            self.expire()
+            if session_id not in self.sessions:
+                return None
+            session = self.sessions.pop(session_id)[0]
+            self.sessions[session_id] = (session, time.monotonic() + self.ttl)
+            return session
+
+    def remove(self, session_id):
+        """
+        Returns:
+            True if the session existed.
+        """
+        with self.lock:
+            if session_id not in self.sessions:
+                return False
+            self.drop(session_id)
+            return True
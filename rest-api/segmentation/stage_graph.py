@@ -0,0 +1,220 @@
+# ## Stage graph
+# A segmentation request runs a chain of stages: decode, preprocess, segment, render and encode. Every stage's
+# output is cached under a key made of the keys of its inputs and its parameters, so a request that only changes
+# the parameters of a later stage (another engine or threshold mode on the same upload) reuses the outputs of
+# the stages before it. The cache is a least recently used cache with a memory budget in bytes.
+#
+# Requests running a stage with the same key at the same time (the same image submitted twice, or a client
+# retrying a request still in flight) are coalesced: the first one computes the output and the others wait for
+# it and share it. The decoded image is keyed by the hash of its pixels, so the same image sent in another
+# encoding shares the stages after the decode too.
+import hashlib
+import sys
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+
+from .checkpoint import image_hash
+from .image_io import decode_base64_image
+from .preprocessing import preprocessing
+from .transform import WORKING_SIZE
+
+# memory budget of the cache in bytes
+CACHE_BYTES = 64 * 1024 * 1024
+
+
+class Stage_Result(namedtuple('Stage_Result', ['key', 'value'])):
+    """
+    Output of a stage and the key it is cached under.
+    """
+
+    def item(self, index):
+        """
+        Returns:
+            Stage_Result of one item of a stage returning a tuple.
+        """
+        return Stage_Result(None if self.key is None else "{}/{}".format(self.key, index), self.value[index])
+
+
+def decode_pixels(image_base64, reduce=1):
+    """
+    Decode stage, base64 encoded image to the numpy array of the grey scale image, downscaled by reduce.
+    """
+    return np.asarray(decode_base64_image(image_base64, reduce))
+
+
+def preprocess_pixels(pixels, size=WORKING_SIZE):
+    """
+    Preprocess stage, grey scale image array to the tuple of the preprocessed image and its Preprocessing_Transform
+    in a working frame of the given size.
+    """
+    from PIL import Image
+
+    return preprocessing(Image.fromarray(pixels), return_transform=True, size=size)
+
+
+class In_Flight:
+    """
+    Output of a stage being computed for one request, which the requests running the stage with the same key
+    at the same time wait for.
+    """
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        # set once the output is complete, partial outputs and errors are not shared
+        self.shared = False
+
+
+def value_size(value):
+    """
+    Returns:
+        Approximate number of bytes held by a stage output.
+    """
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (str, bytes)):
+        return len(value)
+    if isinstance(value, (tuple, list)):
+        return sys.getsizeof(value) + sum(value_size(item) for item in value)
+    return sys.getsizeof(value)
+
+
+def freeze(value):
+    """
+    Makes the numpy arrays of a cached output read only, so a caller can not change what the next request gets.
+    """
+    if isinstance(value, np.ndarray):
+        value.flags.writeable = False
+    elif isinstance(value, tuple):
+        for item in value:
+            freeze(item)
+    return value
+
+
+class Stage_Graph:
+    """
+    Runs the stages of a request, caching their outputs.
+
+    Parameters:
+        cache_bytes: memory budget of the cache in bytes, 0 disables caching.
+    """
+
+    def __init__(self, cache_bytes=CACHE_BYTES):
+        self.cache_bytes = cache_bytes
+        self.cache = OrderedDict()
+        self.cached_bytes = 0
+        self.lock = threading.Lock()
+        # In_Flight of the outputs being computed, by key
+        self.in_flight = {}
+        # per stage number of runs, number of cache hits, number of runs coalesced with a concurrent run of the
+        # same key and seconds spent running it
+        self.timings = {}
+
+    def source(self, data):
+        """
+        Parameters:
+            data: input of the first stage, as bytes or a string.
+
+        Returns:
+            Stage_Result keyed by the hash of the data.
+        """
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        return Stage_Result(hashlib.sha256(data).hexdigest(), data)
+
+    def by_content(self, result):
+        """
+        Parameters:
+            result: Stage_Result whose value is an array.
+
+        Returns:
+            Stage_Result of the same array keyed by the hash of its pixels rather than by the stages it was
+            computed from, so the stages run on it are shared by every input giving the same pixels.
+        """
+        if result.key is None:
+            return result
+        return Stage_Result(image_hash(result.value), result.value)
+
+    def run(self, stage, function, *inputs, deadline=None, pool=None, **params):
+        """
+        Runs function(*input values, **params), or returns its cached output. If the same stage with the same
+        inputs and params is already running for another request, waits for its output instead.
+
+        Parameters:
+            stage: name of the stage.
+            function: function computing the output of the stage.
+            inputs: Stage_Result of the stages it depends on.
+            deadline: optional Deadline passed on to function. Outputs computed after it has been exceeded are
+                      partial, they are not cached or shared and neither is anything computed from them. A
+                      request waits for the output of another one until its deadline runs out.
+            pool: optional Shared_Memory_Pool to run function in, the value of the first input has to be an array.
+            params: parameters of the stage, their repr is part of the key.
+
+        Returns:
+            Stage_Result of the stage, its key is None if the output is partial.
+        """
+        key = None
+        if all(result.key is not None for result in inputs):
+            key = hashlib.sha256(repr((stage, [result.key for result in inputs], sorted(params.items()))).encode())
+            key = key.hexdigest()
+        flight = leader = None
+        with self.lock:
+            stats = self.timings.setdefault(stage, {'runs': 0, 'hits': 0, 'coalesced': 0, 'seconds': 0.0})
+            if key in self.cache:
+                self.cache.move_to_end(key)
+                stats['hits'] += 1
+                return Stage_Result(key, self.cache[key])
+            if key is not None:
+                flight = self.in_flight.get(key)
+                if flight is None:
+                    leader = self.in_flight[key] = In_Flight()
+                    leader_key = key
+        if flight is not None:
+            flight.done.wait(None if deadline is None else deadline.remaining())
+            if flight.shared:
+                with self.lock:
+                    stats['coalesced'] += 1
+                return Stage_Result(key, flight.value)
+            # the other request's output is partial, failed or late, compute it for this request
+
+        start = time.perf_counter()
+        values = [result.value for result in inputs]
+        if deadline is not None:
+            params = dict(params, deadline=deadline)
+        try:
+            if pool is not None:
+                value = pool.run(function, *values, **params)
+            else:
+                value = function(*values, **params)
+            with self.lock:
+                stats['runs'] += 1
+                stats['seconds'] += time.perf_counter() - start
+            if deadline is not None and deadline.exceeded:
+                key = None
+            if key is not None:
+                self.store(key, value)
+                if leader is not None:
+                    leader.value = freeze(value)
+                    leader.shared = True
+        finally:
+            if leader is not None:
+                with self.lock:
+                    del self.in_flight[leader_key]
+                leader.done.set()
+        return Stage_Result(key, value)
+
+    def store(self, key, value):
+        size = value_size(value)
+        if size > self.cache_bytes:
+            return
+        with self.lock:
+            if key in self.cache:
+                return
+            self.cache[key] = freeze(value)
+            self.cached_bytes += size
+            while self.cached_bytes > self.cache_bytes:
+                _, evicted = self.cache.popitem(last=False)
+                self.cached_bytes -= value_size(evicted)
@@ -0,0 +1,80 @@
+# ## Threshold selection for region growing
+# Predicts the region growing threshold from the contrast between the pectoral muscle around the
+# seed (1, 1) and the breast tissue, so the region only has to be grown once.
+import numpy as np
+
+from .resolution import scale_length
+from .transform import WORKING_SIZE
+
+# try the thresholds one after the other until one stops growing before max_iter
+CASCADE = 'cascade'
+
+# grow once with the predicted threshold, continue down the cascade only if it leaks
+PREDICTED = 'predicted'
+
+# size of the top left window around the seed (1, 1) used to measure the muscle intensity, in the 256 px frame
+SEED_WINDOW = 32
+
+# pixels darker than this are background rather than breast tissue
+BACKGROUND_LEVEL = 0.1 * 255
+
+# largest usable threshold as a fraction of the muscle/tissue contrast, calibrated on the testing images
+CONTRAST_RATIO = 0.64
+
+
+def histogram_median(values):
+    """
+    Finds the median grey level of the given pixels from their 256 bin intensity histogram.
+
+    Parameters:
+        values: numpy array of grey levels in the range [0, 255].
+
+    Returns:
+        The grey level of the bin containing the median pixel.
+    """
+    histogram = np.bincount(np.clip(values, 0, 255).astype(np.uint8).ravel(), minlength=256)
+    return int(np.searchsorted(np.cumsum(histogram), (values.size + 1) / 2))
+
+
+def muscle_tissue_contrast(image_data, size=WORKING_SIZE):
+    """
+    Measures the contrast between the pectoral muscle and the breast tissue.
+
+    Parameters:
+        image_data: numpy array of the preprocessed (left aligned) image.
+        size: side of the working frame the image was preprocessed to.
+
+    Assumptions:
+        - The pectoral muscle covers the top left window around the seed (1, 1).
+        - The upper half of the image below the first rows mostly contains breast tissue and background.
+
+    Returns:
+        The median grey level of the muscle window minus the median grey level of the breast tissue.
+    """
+    height = image_data.shape[0]
+    window = scale_length(SEED_WINDOW, size)
+    muscle_level = histogram_median(image_data[0:window, 0:window])
+    band = image_data[height // 8:height // 2, :]
+    tissue = band[band > BACKGROUND_LEVEL]
+    if tissue.size == 0:
+        return muscle_level
+    return muscle_level - histogram_median(tissue)
+
+
+def predict_threshold(image_data, thresholds, size=WORKING_SIZE):
+    """
+    Predicts the largest threshold that separates the muscle from the breast tissue.
+
+    Parameters:
+        image_data: numpy array of the preprocessed image.
+        thresholds: the thresholds of the cascade, in decreasing order.
+        size: side of the working frame the image was preprocessed to.
+
+    Returns:
+        The threshold of the cascade to grow the region with first.
+    """
+    usable = CONTRAST_RATIO * muscle_tissue_contrast(image_data, size)
+    for threshold in thresholds:
+        if threshold <= usable:
+            return threshold
+    return thresholds[-1]
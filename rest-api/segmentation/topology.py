@@ -0,0 +1,163 @@
+# ## Worker layout
+# Every worker process of a pool also starts the thread pools of the native libraries it uses (OpenCV, the BLAS
+# numpy is built against, OpenMP in scipy), each sized to the whole machine by default. With one worker per core
+# that is cores x cores threads competing for the same cores. A Worker_Layout splits the cores the process may
+# run on between the workers: each worker gets a number of native threads, and optionally its own cores to run
+# on, so the threads of the workers add up to the cores.
+#
+# The thread limits are set when a worker starts, through the environment variables the libraries read when they
+# are loaded and, for libraries that are already loaded, through cv2.setNumThreads and threadpoolctl when they
+# are installed. numpy loads its BLAS on import, before a forked worker can set the variables, so only
+# threadpoolctl limits it there.
+import os
+from collections import namedtuple
+
+# environment variables the native thread pools are sized from when their library is loaded
+THREAD_VARIABLES = ['OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS', 'NUMEXPR_NUM_THREADS',
+                    'VECLIB_MAXIMUM_THREADS']
+
+# side of the synthetic image the workers segment when they start
+PREWARM_SIZE = 64
+
+# index of the worker process in its pool and the native threads it was given, set when it starts
+worker_index = None
+worker_threads = None
+
+
+def available_cores():
+    """
+    Returns:
+        Sorted list of the ids of the cores this process may run on, which is fewer than os.cpu_count() in a
+        container or under taskset.
+    """
+    if hasattr(os, 'sched_getaffinity'):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+class Worker_Layout(namedtuple('Worker_Layout', ['workers', 'threads', 'cores'])):
+    """
+    How the cores are split between the workers of a pool.
+
+    Attributes:
+        workers: number of worker processes.
+        threads: number of native threads of each worker.
+        cores: tuple of the cores each worker is pinned to, by worker index, or None if they are not pinned.
+    """
+
+    def describe(self):
+        """
+        Returns:
+            One line description of the layout for the start up logs.
+        """
+        description = "{} worker{} x {} native thread{}".format(self.workers, "s" if self.workers != 1 else "",
+                                                                self.threads, "s" if self.threads != 1 else "")
+        if self.cores is not None:
+            description += ", pinned to cores " + " ".join(",".join(map(str, cores)) for cores in self.cores)
+        return description
+
+
+def plan_workers(workers=None, threads=None, affinity=False, cores=None):
+    """
+    Splits the cores between the workers of a pool.
+
+    Parameters:
+        workers: number of worker processes, as many as there are cores for their threads if None.
+        threads: number of native threads of each worker, the cores shared evenly between the workers (at least
+                 one each) if None.
+        affinity: whether every worker is pinned to its own cores. Workers share cores round robin when there
+                  are more threads than cores.
+        cores: ids of the cores to use, the ones this process may run on if None.
+
+    Returns:
+        Worker_Layout.
+    """
+    cores = cores if cores is not None else available_cores()
+    if workers is None:
+        workers = max(1, len(cores) // (threads or 1))
+    if threads is None:
+        threads = max(1, len(cores) // workers)
+    pinned = None
+    if affinity:
+        pinned = tuple(tuple(sorted({cores[(index * threads + i) % len(cores)] for i in range(threads)}))
+                       for index in range(workers))
+    return Worker_Layout(workers, threads, pinned)
+
+
+def limit_native_threads(threads):
+    """
+    Sizes the thread pools of the native libraries of this process to that many threads.
+    """
+    for variable in THREAD_VARIABLES:
+        os.environ[variable] = str(threads)
+    try:
+        import cv2
+    except ImportError:
+        pass
+    else:
+        cv2.setNumThreads(threads)
+    try:
+        from threadpoolctl import threadpool_limits
+    except ImportError:
+        pass
+    else:
+        # the limits stay in place until they are restored, which the workers never do
+        threadpool_limits(threads)
+
+
+def prewarm():
+    """
+    Imports the engines and their libraries and runs a small segmentation with each of them, so the first task
+    of a worker does not pay for the imports, the JIT compilation or the first allocations.
+    """
+    import numpy as np
+    from PIL import Image
+
+    from .kernels import warm_up
+    from .level_set import DOUBLE_WELL, Level_Set
+    from .preprocessing import preprocessing
+    from .region_growing import ENGINES, find_region
+    from .resolution import RESOLUTIONS
+
+    warm_up()
+    # a brighter muscle triangle in the top left corner of a breast on a dark background
+    rows, columns = np.indices((PREWARM_SIZE, PREWARM_SIZE))
+    pixels = np.where(rows + columns < PREWARM_SIZE // 2, 220, np.where(columns < PREWARM_SIZE * 3 // 4, 150, 10))
+    image = preprocessing(Image.fromarray(pixels.astype(np.uint8)), size=RESOLUTIONS[0])
+    for engine in ENGINES:
+        find_region(image, 6200, neighbours=4, engine=engine, size=RESOLUTIONS[0])
+    level_set = Level_Set(DOUBLE_WELL)
+    phi = level_set.find_lsf(**dict(level_set.initialise_params(image, RESOLUTIONS[0]), iter_outer=1))
+    level_set.boundary(phi)
+
+
+def start_worker(layout, counter=None, started=None, warm=True):
+    """
+    Initializer of the worker processes of a pool: limits their native threads, pins them to their cores and
+    prewarms them.
+
+    Parameters:
+        layout: Worker_Layout of the pool.
+        counter: shared multiprocessing.Value the workers take their index from, needed to pin them.
+        started: shared multiprocessing.Value incremented once the worker is ready.
+        warm: whether to run prewarm.
+    """
+    global worker_index, worker_threads
+
+    if counter is not None:
+        with counter.get_lock():
+            worker_index = counter.value % layout.workers
+            counter.value += 1
+    worker_threads = layout.threads
+    limit_native_threads(layout.threads)
+    if layout.cores is not None and worker_index is not None and hasattr(os, 'sched_setaffinity'):
+        os.sched_setaffinity(0, layout.cores[worker_index])
+    if warm:
+        prewarm()
+    else:
+        from .kernels import warm_up
+
+        warm_up()
+    if started is not None:
+        with started.get_lock():
+            started.value += 1
@@ -0,0 +1,116 @@
+# ## Preprocessing transform
+# preprocess_image resizes the image to a small square working frame, flips it if the breast is on the right
+# and crops the black bar on the left. Recording these steps lets a mask or a per-row boundary found in the
+# working frame be mapped back onto the original image, so full size output never needs a full size segmentation.
+import numpy as np
+
+# side of the square working frame the images are resized to
+WORKING_SIZE = 256
+
+
+def row_boundary(mask):
+    """
+    Parameters:
+        mask: 2d boolean numpy array of a region anchored at the left edge.
+
+    Returns:
+        1d numpy array with, for every row, the column after the rightmost pixel of the region (0 if the row is empty).
+    """
+    last = mask.shape[1] - np.argmax(mask[:, ::-1], axis=1)
+    return np.where(mask.any(axis=1), last, 0)
+
+
+def spans_to_mask(start, end, width):
+    """
+    Parameters:
+        start, end: 1d numpy arrays of the first and last + 1 column of the region in every row.
+        width: number of columns of the mask.
+
+    Returns:
+        2d boolean numpy array that is True between start and end in every row.
+    """
+    columns = np.arange(width)
+    return (columns >= start[:, None]) & (columns < end[:, None])
+
+
+class Preprocessing_Transform:
+    """
+    Parameters:
+        original_shape: (rows, columns) of the image before preprocessing.
+        flipped: whether left_align flipped the image.
+        bar_width: number of columns remove_bar cropped from the left of the resized, left aligned image.
+        size: side of the square working frame.
+    """
+
+    def __init__(self, original_shape, flipped, bar_width, size=WORKING_SIZE):
+        self.original_shape = tuple(original_shape)
+        self.flipped = flipped
+        self.bar_width = bar_width
+        self.size = size
+
+    @property
+    def working_shape(self):
+        return self.size, self.size - self.bar_width
+
+    def working_rows(self):
+        """
+        Returns:
+            1d numpy array with the working frame row the centre of every original row falls in.
+        """
+        rows = self.original_shape[0]
+        return ((np.arange(rows) + 0.5) * self.size / rows).astype(int)
+
+    def working_columns(self):
+        """
+        Returns:
+            1d numpy array with the working frame column the centre of every original column falls in, negative
+            for the columns of the cropped bar.
+        """
+        columns = self.original_shape[1]
+        resized = ((np.arange(columns) + 0.5) * self.size / columns).astype(int)
+        if self.flipped:
+            resized = self.size - 1 - resized
+        return resized - self.bar_width
+
+    def mask_to_original(self, mask):
+        """
+        Maps a mask of the working frame onto the original image, every original pixel takes the value of the
+        working pixel its centre falls in.
+
+        Parameters:
+            mask: 2d boolean numpy array with the working shape.
+
+        Returns:
+            2d boolean numpy array with the original shape, False on the cropped bar.
+        """
+        columns = self.working_columns()
+        original = mask[self.working_rows()[:, None], np.maximum(columns, 0)[None, :]]
+        original[:, columns < 0] = False
+        return original
+
+    def boundary_to_original(self, boundary):
+        """
+        Maps a per-row boundary of the working frame (see row_boundary and Level_Set.boundary) onto the original
+        image. The result is the same as mapping the mask of the region with mask_to_original.
+
+        Parameters:
+            boundary: sequence with, for the first working rows, the number of region pixels from the left edge.
+                      Missing rows are empty.
+
+        Returns:
+            Tuple (start, end) of 1d numpy arrays with the first and last + 1 original column of the region in every
+            original row.
+        """
+        boundary = np.asarray(boundary, dtype=int)
+        padded = np.zeros(self.size, dtype=int)
+        padded[:min(boundary.size, self.size)] = boundary[:self.size]
+        width = padded[self.working_rows()]
+        # resized columns first and last + 1 of the region
+        low, high = np.full(width.shape, self.bar_width), self.bar_width + width
+        if self.flipped:
+            low, high = self.size - high, self.size - low
+        columns = self.original_shape[1]
+        # original column c lies in resized column floor((c + 0.5) * size / columns)
+        start = np.ceil(low * columns / self.size - 0.5).astype(int)
+        end = np.ceil(high * columns / self.size - 0.5).astype(int)
+        return start, np.maximum(start, end)
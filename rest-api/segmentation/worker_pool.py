@@ -0,0 +1,200 @@
+# ## Worker pool over shared memory
+# Segmenting in worker processes normally pickles the input image into the worker and the result back. Here both
+# live in a pool of shared memory buffers that are created once and reused, and only small descriptors (buffer
+# name, shape and dtype) cross the process boundary.
+#
+# The API runs only the segmentation stage in the workers: the stage graph decodes, preprocesses and renders in
+# the server process, where it caches their outputs. A task therefore reads the preprocessed image of the
+# working frame and writes a mask of the same size or a float32 level set function, at most 1 MB in the 512 px
+# frame, and the buffers are sized for that. Larger arrays are pickled instead.
+#
+# The workers are laid out over the cores (see segmentation.topology): by default there is one per core, each
+# with one native thread, and they are prewarmed when they start.
+import os
+import queue
+import time
+from collections import namedtuple
+
+import numpy as np
+
+from .deadline import Deadline
+from .resolution import RESOLUTIONS
+from .topology import plan_workers, start_worker
+
+# size in bytes of each pooled buffer, the float32 level set function of the largest working frame
+BUFFER_SIZE = max(RESOLUTIONS) ** 2 * np.dtype(np.float32).itemsize
+
+# what is sent to a worker instead of an array
+Shared_Array = namedtuple('Shared_Array', ['buffer', 'shape', 'dtype'])
+
+# shared memory blocks a process has attached to, by name
+attached_buffers = {}
+
+
+def attach(name):
+    """
+    Attaches to a shared memory block once per process and keeps it open for the next tasks.
+    """
+    if name not in attached_buffers:
+        from multiprocessing import shared_memory
+
+        attached_buffers[name] = shared_memory.SharedMemory(name=name)
+    return attached_buffers[name]
+
+
+def shared_view(descriptor, buffer=None):
+    """
+    Parameters:
+        descriptor: Shared_Array.
+        buffer: the SharedMemory block if the process owns it, attached by name otherwise.
+
+    Returns:
+        numpy array backed by the shared memory block, no data is copied.
+    """
+    buffer = buffer if buffer is not None else attach(descriptor.buffer)
+    return np.ndarray(descriptor.shape, dtype=descriptor.dtype, buffer=buffer.buf)
+
+
+def run_task(function, image, output_buffer, output_size, budget, args, kwargs):
+    """
+    Runs in the worker process. Calls function on the image in shared memory and writes its result into the
+    output buffer.
+
+    Parameters:
+        function: module level function taking the image array (and a deadline keyword) and returning an array.
+        image: Shared_Array of the input image, or the image itself if it did not fit a buffer.
+        output_buffer: name of the shared memory block the result is written to.
+        output_size: size of the output buffer in bytes.
+        budget: remaining time budget of the request in seconds, or None.
+        args, kwargs: further arguments of function.
+
+    Returns:
+        Tuple of the Shared_Array of the result (or the result itself if it does not fit the output buffer) and
+        whether the deadline was exceeded.
+    """
+    deadline = Deadline(budget)
+    if isinstance(image, Shared_Array):
+        image = shared_view(image)
+    result = np.ascontiguousarray(function(image, *args, deadline=deadline, **kwargs))
+    if result.nbytes > output_size:
+        return result, deadline.exceeded
+    descriptor = Shared_Array(output_buffer, result.shape, result.dtype.str)
+    shared_view(descriptor)[...] = result
+    return descriptor, deadline.exceeded
+
+
+class Shared_Memory_Pool:
+    """
+    Process pool whose tasks read their input image from, and write their result to, reusable shared memory
+    buffers.
+
+    Parameters:
+        workers: number of worker processes, one per available core (for its threads) if None.
+        slots: number of requests that can be in flight at once, each holds an input and an output buffer.
+               Defaults to twice the number of workers.
+        buffer_size: size in bytes of each buffer.
+        threads: number of native threads of each worker, the cores shared evenly between the workers if None.
+        affinity: whether every worker is pinned to its own cores.
+        warm: whether the workers run a small segmentation when they start, they only compile the JIT kernels
+              otherwise.
+    """
+
+    def __init__(self, workers=None, slots=None, buffer_size=BUFFER_SIZE, threads=None, affinity=False, warm=True):
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+        from multiprocessing import shared_memory
+
+        self.layout = plan_workers(workers, threads, affinity)
+        self.workers = self.layout.workers
+        self.buffer_size = buffer_size
+        # worker indices handed out and workers that finished starting
+        self.counter = multiprocessing.Value('i', 0)
+        self.started = multiprocessing.Value('i', 0)
+        self.executor = ProcessPoolExecutor(max_workers=self.workers, initializer=start_worker,
+                                            initargs=(self.layout, self.counter, self.started, warm))
+        self.buffers = []
+        self.free_slots = queue.Queue()
+        for _ in range(slots or 2 * self.workers):
+            slot = (shared_memory.SharedMemory(create=True, size=buffer_size),
+                    shared_memory.SharedMemory(create=True, size=buffer_size))
+            self.buffers.extend(slot)
+            self.free_slots.put(slot)
+
+    def start(self, timeout=None):
+        """
+        Starts every worker process and waits until they have all been set up, so that no request pays for it.
+
+        Returns:
+            True if every worker was ready before the timeout (in seconds), False otherwise.
+
+        Raises:
+            BrokenProcessPool if a worker process died while it started.
+        """
+        from concurrent.futures import TimeoutError
+
+        end = time.monotonic() + timeout if timeout is not None else None
+        try:
+            for future in [self.executor.submit(os.getpid) for _ in range(self.workers)]:
+                future.result(max(0, end - time.monotonic()) if end is not None else None)
+        except TimeoutError:
+            return False
+        while self.started.value < self.workers:
+            if end is not None and time.monotonic() >= end:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def run(self, function, image, *args, deadline=None, **kwargs):
+        """
+        Runs function(image, *args, deadline=..., **kwargs) in a worker process, like a direct call.
+
+        Parameters:
+            function: module level function returning a numpy array.
+            image: numpy array of the input image. Images larger than the buffers are pickled instead.
+            deadline: optional Deadline. The worker gets its remaining budget and deadline.exceeded is set when
+                      the worker's deadline ran out.
+
+        Returns:
+            numpy array of the result.
+        """
+        image = np.ascontiguousarray(image)
+        input_buffer, output_buffer = slot = self.free_slots.get()
+        try:
+            if image.nbytes <= self.buffer_size:
+                descriptor = Shared_Array(input_buffer.name, image.shape, image.dtype.str)
+                shared_view(descriptor, input_buffer)[...] = image
+                image = descriptor
+            budget = deadline.remaining() if deadline is not None else None
+            result, exceeded = self.executor.submit(run_task, function, image, output_buffer.name,
+                                                    self.buffer_size, budget, args, kwargs).result()
+            if exceeded and deadline is not None:
+                deadline.exceeded = True
+            if isinstance(result, Shared_Array):
+                result = shared_view(result, output_buffer).copy()
+            return result
+        finally:
+            self.free_slots.put(slot)
+
+    def close(self, wait=True):
+        """
+        Stops the workers and frees the shared memory.
+
+        Parameters:
+            wait: whether to wait for the tasks already submitted, the worker processes are terminated otherwise
+                  (a pool that failed to start).
+        """
+        if not wait:
+            # ProcessPoolExecutor only joins its processes, a worker stuck in its initializer has to be terminated
+            for process in list(self.executor._processes.values()):
+                process.terminate()
+        self.executor.shutdown(wait=wait, cancel_futures=not wait)
+        for buffer in self.buffers:
+            buffer.close()
+            buffer.unlink()
+        self.buffers = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+from segmentation import REFERENCE_POLICY, WORKING_SIZE, preprocess_batch, preprocessing, read_image
+
+IMAGES = ["testing_images/mdb00{}.pgm".format(i) for i in range(1, 5)]
+
+
+def stacked(paths):
+    images = [read_image(path)[0] for path in paths]
+    return images, np.stack([np.asarray(image) for image in images])
+
+
+class TestClass:
+
+    def test_batch_matches_preprocessing(self):
+        images, stack = stacked(IMAGES)
+        for kwargs in [{}, {'dtype_policy': REFERENCE_POLICY}]:
+            batch = preprocess_batch(stack, **kwargs)
+            assert batch.images.shape == (len(IMAGES), WORKING_SIZE, WORKING_SIZE)
+            for i, image in enumerate(images):
+                expected, transform = preprocessing(image, return_transform=True, **kwargs)
+                assert np.array_equal(batch.image(i), expected)
+                assert batch.image(i).dtype == expected.dtype
+                assert vars(batch.transform(i)) == vars(transform)
+
+    def test_padding_is_zero(self):
+        _, stack = stacked(IMAGES)
+        batch = preprocess_batch(stack)
+        assert batch.flipped.any() and not batch.flipped.all()
+        assert np.array_equal(batch.widths, WORKING_SIZE - batch.offsets)
+        assert not batch.images[np.broadcast_to(~batch.valid(), batch.images.shape)].any()
+
+    def test_rejects_single_image(self):
+        _, stack = stacked(IMAGES[:1])
+        with pytest.raises(ValueError):
+            preprocess_batch(stack[0])
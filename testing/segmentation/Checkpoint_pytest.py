@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+from segmentation import DOUBLE_WELL, Checkpoint, Level_Set, image_hash, preprocessing, read_image
+from segmentation.checkpoint import EVOLUTION_PARAMS
+
+
+def level_set_params(iter_outer):
+    preprocessed_image = preprocessing(read_image("testing_images/mdb003.pgm")[0])
+    ls = Level_Set(DOUBLE_WELL)
+    params = ls.initialise_params(preprocessed_image)
+    params['iter_outer'] = iter_outer
+    return ls, params
+
+
+class TestClass:
+
+    def test_image_hash(self):
+        img = np.zeros((4, 4), dtype=np.uint8)
+        assert image_hash(img) == image_hash(img.copy())
+        assert image_hash(img) != image_hash(img.astype(np.float32))
+        img2 = img.copy()
+        img2[3, 3] = 1
+        assert image_hash(img) != image_hash(img2)
+
+    def test_save_and_load(self, tmp_path):
+        path = str(tmp_path / "phi.npz")
+        phi = np.arange(12, dtype=np.float32).reshape(3, 4)
+        Checkpoint(phi, 3, {'alfa': -3, 'epsilon': 1.2}, "abc").save(path)
+        checkpoint = Checkpoint.load(path)
+        assert checkpoint.phi.dtype == np.float32
+        assert np.array_equal(checkpoint.phi, phi)
+        assert checkpoint.outer_iterations == 3
+        assert checkpoint.params == {'alfa': -3, 'epsilon': 1.2}
+        assert checkpoint.image_hash == "abc"
+
+    def test_resume_matches_uninterrupted_run(self, tmp_path):
+        path = str(tmp_path / "phi.npz")
+        ls, params = level_set_params(4)
+        ls.find_lsf(**params, checkpoint_path=path)
+        assert Checkpoint.load(path).outer_iterations == 4
+
+        ls, params = level_set_params(6)
+        resumed_phi = ls.find_lsf(**params, checkpoint=Checkpoint.load(path), checkpoint_path=path)
+        assert Checkpoint.load(path).outer_iterations == 6
+        assert np.array_equal(resumed_phi, ls.find_lsf(**params))
+
+    def test_warm_start_with_other_parameters(self, tmp_path):
+        path = str(tmp_path / "phi.npz")
+        ls, params = level_set_params(2)
+        ls.find_lsf(**params, checkpoint_path=path)
+        checkpoint = Checkpoint.load(path)
+
+        params['alfa'] = -2
+        assert checkpoint.resumes(params) == False
+        warm_phi = ls.find_lsf(**params, checkpoint=checkpoint, checkpoint_path=path)
+        assert Checkpoint.load(path).outer_iterations == 2
+        assert not np.array_equal(warm_phi, ls.find_lsf(**params))
+
+    def test_checkpoint_of_other_image(self):
+        ls, params = level_set_params(1)
+        checkpoint = Checkpoint(params['initial_lsf'], 0, {}, image_hash(np.zeros((2, 2))))
+        with pytest.raises(ValueError):
+            ls.find_lsf(**params, checkpoint=checkpoint)
+
+    def test_checkpoint_past_iter_outer(self):
+        ls, params = level_set_params(1)
+        evolution_params = {name: params[name] for name in EVOLUTION_PARAMS}
+        checkpoint = Checkpoint(params['initial_lsf'], 5, evolution_params, image_hash(params['img']))
+        with pytest.raises(ValueError):
+            ls.find_lsf(**params, checkpoint=checkpoint)
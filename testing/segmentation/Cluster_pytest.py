@@ -0,0 +1,137 @@
+import json
+import os
+import threading
+import time
+import urllib.error
+
+import pytest
+
+from segmentation.cluster import Coordinator, post, run_local, run_worker
+from segmentation.golden import CONFIGS, load_corpus
+
+CORPUS_PATH = "../testing/segmentation/golden_outputs.json"
+
+IMAGES = ["testing_images/mdb00{}.pgm".format(i) for i in range(1, 4)]
+
+
+def square(image, config):
+    return {'value': image * image}
+
+
+def slow_square(image, config):
+    time.sleep(0.5)
+    return square(image, config)
+
+
+def fail_odd(image, config):
+    if image % 2:
+        raise ValueError("odd image")
+    return {'value': image}
+
+
+def exit_worker(image, config):
+    # a worker process killed while segmenting
+    os._exit(1)
+
+
+class TestClass:
+
+    def test_workers_commit_every_image(self):
+        with Coordinator({i: {} for i in range(20)}) as coordinator:
+            workers = [threading.Thread(target=run_worker, args=(coordinator.url, square),
+                                        kwargs={'poll_interval': 0.01}) for _ in range(3)]
+            for worker in workers:
+                worker.start()
+            assert coordinator.wait(timeout=10)
+            for worker in workers:
+                worker.join()
+            assert coordinator.results == {i: {'value': i * i} for i in range(20)}
+            assert post(coordinator.url, "/status") == {'tasks': 20, 'pending': 0, 'leased': 0, 'committed': 20,
+                                                        'workers': 3}
+
+    def test_dead_worker_tasks_are_handed_out_again(self):
+        with Coordinator({i: {} for i in range(4)}, heartbeat_timeout=0.2) as coordinator:
+            # a worker that leases an image and dies without sending heartbeats
+            dead = post(coordinator.url, "/register")['worker']
+            task = post(coordinator.url, "/lease", {'worker': dead})['task']
+            committed = run_worker(coordinator.url, square, heartbeat_interval=0.05, poll_interval=0.05)
+            assert committed == 4
+            assert coordinator.wait(timeout=1)
+            # the late result of the dead worker is not committed a second time
+            reply = post(coordinator.url, "/commit", {'worker': dead, 'lease': task['lease'], 'image': task['image'],
+                                                      'result': {'value': -1}})
+            assert reply == {'committed': False}
+            assert coordinator.results[task['image']] == {'value': task['image'] ** 2}
+
+    def test_heartbeats_keep_slow_workers_alive(self):
+        with Coordinator({0: {}}, heartbeat_timeout=0.2) as coordinator:
+            assert run_worker(coordinator.url, slow_square, heartbeat_interval=0.05) == 1
+            assert coordinator.attempts[0] == 0
+
+    def test_commits_are_exactly_once(self, tmp_path):
+        results_path = str(tmp_path / "results.jsonl")
+        with Coordinator({'a': {}}, results_path=results_path) as coordinator:
+            worker = post(coordinator.url, "/register")['worker']
+            task = post(coordinator.url, "/lease", {'worker': worker})['task']
+            commit = {'worker': worker, 'lease': task['lease'], 'image': 'a', 'result': {'value': 1}}
+            assert post(coordinator.url, "/commit", commit) == {'committed': True}
+            # a retried commit
+            assert post(coordinator.url, "/commit", commit) == {'committed': False}
+            assert post(coordinator.url, "/lease", {'worker': worker}) == {'task': None, 'finished': True}
+        with open(results_path) as results_file:
+            assert [json.loads(line) for line in results_file] == [{'image': 'a', 'result': {'value': 1}}]
+        # a coordinator started again on the same results file does not hand the image out again
+        resumed = Coordinator({'a': {}, 'b': {}}, results_path=results_path)
+        assert list(resumed.pending) == ['b']
+        resumed.close()
+
+    def test_results_of_other_images_are_not_loaded(self, tmp_path):
+        results_path = tmp_path / "results.jsonl"
+        results_path.write_text("".join(json.dumps({'image': image, 'result': {'value': 1}}) + "\n"
+                                        for image in ['c', 'd']))
+        coordinator = Coordinator({'a': {}, 'b': {}}, results_path=str(results_path))
+        assert coordinator.results == {}
+        assert not coordinator.finished()
+        assert list(coordinator.pending) == ['a', 'b']
+        coordinator.close()
+
+    def test_foreign_commits_are_rejected(self):
+        with Coordinator({'a': {}, 'b': {}}) as coordinator:
+            worker = post(coordinator.url, "/register")['worker']
+            other = post(coordinator.url, "/register")['worker']
+            task = post(coordinator.url, "/lease", {'worker': worker})['task']
+            commit = {'worker': worker, 'lease': task['lease'], 'image': task['image'], 'result': {'value': 1}}
+            for foreign in [dict(commit, image='c'), dict(commit, lease=task['lease'] + 1), dict(commit, lease='x'),
+                            dict(commit, image='b'), dict(commit, worker=other)]:
+                with pytest.raises(urllib.error.HTTPError) as error:
+                    post(coordinator.url, "/commit", foreign)
+                assert error.value.code == 400
+            assert coordinator.results == {}
+            assert post(coordinator.url, "/commit", commit) == {'committed': True}
+
+    def test_failing_images_are_retried_then_committed_as_failed(self):
+        with Coordinator({i: {} for i in range(4)}, max_attempts=2) as coordinator:
+            run_worker(coordinator.url, fail_odd, poll_interval=0.01)
+            assert coordinator.wait(timeout=1)
+            assert coordinator.results[0] == {'value': 0}
+            assert coordinator.results[1] == {'error': "ValueError: odd image"}
+            assert coordinator.attempts[1] == 2
+
+    def test_bodies_that_are_not_objects_are_rejected(self):
+        with Coordinator({0: {}}) as coordinator:
+            for body in [[0], 1, {'worker': []}]:
+                with pytest.raises(urllib.error.HTTPError) as error:
+                    post(coordinator.url, "/heartbeat", body)
+                assert error.value.code == 400
+
+    def test_local_run_fails_when_every_worker_exits(self):
+        with pytest.raises(RuntimeError, match="every worker process exited"):
+            run_local({i: {} for i in range(4)}, workers=2, task=exit_worker)
+
+    def test_local_worker_processes_reproduce_corpus(self):
+        config = 'flood-fill-predicted-roi'
+        results = run_local({path: CONFIGS[config] for path in IMAGES}, workers=2)
+        references = load_corpus(CORPUS_PATH)['outputs'][config]
+        for path in IMAGES:
+            name = path.split("/")[-1].split(".")[0]
+            assert results[path]['hash'] == references[name]['hash']
@@ -0,0 +1,39 @@
+import numpy as np
+from segmentation import DOUBLE_WELL, Deadline, Level_Set, Region_Growing, read_image, preprocessing, region_growing
+
+
+class TestClass:
+
+    def test_deadline_without_budget_never_expires(self):
+        deadline = Deadline()
+        assert deadline.remaining() is None
+        assert deadline.expired() == False
+        assert deadline.exceeded == False
+
+    def test_deadline_expired(self):
+        deadline = Deadline(0)
+        assert deadline.remaining() == 0
+        assert deadline.expired() == True
+        assert deadline.exceeded == True
+
+    def test_region_growing_returns_partial_region(self):
+        image, _ = read_image("testing_images/mdb001.pgm")
+        preprocessed_image = preprocessing(image)
+        deadline = Deadline(0)
+        result = region_growing(preprocessed_image, 6200, neighbours=4, deadline=deadline)
+        assert deadline.exceeded == True
+        assert np.array_equal(result, np.array(preprocessed_image, dtype=np.uint8))
+
+    def test_region_growing_within_budget_is_not_partial(self):
+        sample_image = np.array([[10, 10, 200], [10, 10, 200], [200, 200, 200]])
+        deadline = Deadline(60)
+        rg = Region_Growing(sample_image, 6200, threshold=40, conn=4, deadline=deadline)
+        rg.segment()
+        assert deadline.exceeded == False
+        assert rg.segmentation[1, 1] == 0
+
+    def test_level_set_returns_current_phi(self):
+        ls = Level_Set(DOUBLE_WELL)
+        params = ls.initialise_params(np.full((20, 20), 100.0))
+        phi = ls.find_lsf(**params, deadline=Deadline(0))
+        assert np.array_equal(phi, params['initial_lsf'])
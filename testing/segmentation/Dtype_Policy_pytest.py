@@ -0,0 +1,34 @@
+import numpy as np
+from segmentation import (CLASSIC, DEFAULT_POLICY, DOUBLE_WELL, REFERENCE_POLICY, Level_Set, find_region,
+                          preprocessing, read_image, region_growing)
+
+
+class TestClass:
+
+    def test_to_image_rounds_for_integer_dtypes(self):
+        img = np.array([[0.4, 0.6, 254.5, 255.0]])
+        assert DEFAULT_POLICY.to_image(img).tolist() == [[0, 1, 254, 255]]
+        assert REFERENCE_POLICY.to_image(img).tolist() == img.tolist()
+
+    def test_default_policy_dtypes(self):
+        preprocessed_image = preprocessing(read_image("testing_images/mdb004.pgm")[0])
+        assert preprocessed_image.dtype == np.uint8
+        region = find_region(preprocessed_image, 6200, neighbours=4)
+        assert region.segmentation.dtype == np.uint8
+        ls = Level_Set(DOUBLE_WELL)
+        assert ls.initialise_params(preprocessed_image)["initial_lsf"].dtype == np.float32
+
+    def test_reference_policy_dtypes(self):
+        preprocessed_image = preprocessing(read_image("testing_images/mdb004.pgm")[0], REFERENCE_POLICY)
+        assert preprocessed_image.dtype == np.float64
+        region = find_region(preprocessed_image, 6200, neighbours=4, dtype_policy=REFERENCE_POLICY)
+        assert region.segmentation.dtype == np.float64
+        ls = Level_Set(DOUBLE_WELL, dtype_policy=REFERENCE_POLICY)
+        assert ls.initialise_params(preprocessed_image)["initial_lsf"].dtype == np.float64
+
+    def test_region_growing_same_for_both_policies(self):
+        image, _ = read_image("testing_images/mdb004.pgm")
+        default_result = region_growing(preprocessing(image), 6200, neighbours=4, engine=CLASSIC)
+        reference_result = region_growing(preprocessing(image, REFERENCE_POLICY), 6200, neighbours=4, engine=CLASSIC,
+                                          dtype_policy=REFERENCE_POLICY)
+        assert np.array_equal(default_result, reference_result)
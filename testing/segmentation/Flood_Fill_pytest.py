@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+from segmentation import CLASSIC, FLOOD_FILL, Flood_Fill, find_region, preprocessing, read_image, region_growing
+from segmentation.flood_fill import shift
+
+
+class TestClass:
+
+    def test_shift(self):
+        mask = np.array([[True, False], [False, False]])
+        assert np.array_equal(shift(mask, (1, 0)), [[False, False], [True, False]])
+        assert np.array_equal(shift(mask, (0, -1)), [[False, False], [False, False]])
+
+    def test_segment_stops_at_edge(self):
+        sample_image = np.array([[10, 12, 200], [11, 10, 200], [200, 200, 200]])
+        ff = Flood_Fill(sample_image, 6200, threshold=40, conn=4)
+        segmentation = ff.segment()
+        assert np.array_equal(segmentation, [[0, 0, 150], [0, 0, 150], [150, 150, 255]])
+
+    def test_segment_leaks_past_max_iter(self):
+        ff = Flood_Fill(np.full((10, 10), 100), 20, threshold=40, conn=4)
+        assert ff.segment() == 0
+
+    def test_conn_not_known(self):
+        with pytest.raises(ValueError):
+            Flood_Fill(np.zeros((3, 3)), 6200, threshold=40, conn=6)
+
+    def test_matches_classic_engine(self):
+        image, _ = read_image("testing_images/mdb004.pgm")
+        preprocessed_image = preprocessing(image)
+        classic_result = region_growing(preprocessed_image, 6200, neighbours=4, engine=CLASSIC)
+        flood_fill_result = region_growing(preprocessed_image, 6200, neighbours=4, engine=FLOOD_FILL)
+        assert np.array_equal(classic_result, flood_fill_result)
+
+    def test_find_region_returns_engine(self):
+        image, _ = read_image("testing_images/mdb001.pgm")
+        region = find_region(preprocessing(image), 6200, neighbours=4, engine=FLOOD_FILL)
+        assert isinstance(region, Flood_Fill)
+        assert region.threshold == 60
+
+    def test_invalid_engine(self):
+        with pytest.raises(ValueError):
+            region_growing(np.zeros((3, 3)), 6200, neighbours=4, engine='watershed')
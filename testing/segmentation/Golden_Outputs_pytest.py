@@ -0,0 +1,48 @@
+import numpy as np
+from segmentation.golden import (boundary_mask, check_config, compare, decode_boundary, encode_boundary, golden_output,
+                                 load_corpus, mask_hash)
+
+CORPUS_PATH = "../testing/segmentation/golden_outputs.json"
+
+IMAGES = ["testing_images/mdb00{}.pgm".format(i) for i in range(1, 10)]
+
+
+class TestClass:
+
+    def test_mask_hash(self):
+        mask = np.zeros((4, 4), dtype=bool)
+        assert mask_hash(mask) == mask_hash(mask.copy())
+        assert mask_hash(mask) != mask_hash(np.zeros((2, 8), dtype=bool))
+        mask[3, 3] = True
+        assert mask_hash(mask) != mask_hash(np.zeros((4, 4), dtype=bool))
+
+    def test_boundary_encoding(self):
+        boundary = np.array([0, 5, 255, 17])
+        assert decode_boundary(encode_boundary(boundary)).tolist() == boundary.tolist()
+
+    def test_compare(self):
+        mask = boundary_mask(np.array([2, 2, 0, 0]), 4)
+        reference = golden_output(mask, 1.0)
+        assert compare(mask, 0.5, reference) == {'exact': True, 'dice': 1.0, 'iou': 1.0, 'seconds': 0.5,
+                                                 'reference_seconds': 1.0}
+        result = compare(boundary_mask(np.array([2, 2, 2, 2]), 4), 0.5, reference)
+        assert result['exact'] == False
+        assert result['dice'] == 2 * 4 / (4 + 8)
+        assert result['iou'] == 4 / 8
+
+    def test_region_growing_matches_corpus(self):
+        corpus = load_corpus(CORPUS_PATH)
+        for config_name in ['classic-predicted', 'flood-fill-cascade', 'flood-fill-predicted-roi']:
+            results = check_config(corpus, IMAGES, corpus['configs'][config_name], config_name)
+            assert all(result['exact'] for result in results.values()), config_name
+
+    def test_level_set_matches_corpus(self):
+        corpus = load_corpus(CORPUS_PATH)
+        results = check_config(corpus, IMAGES[:3], corpus['configs']['level-set-roi'], 'level-set-roi')
+        assert all(result['exact'] for result in results.values())
+
+    def test_tiled_level_set_matches_corpus(self):
+        corpus = load_corpus(CORPUS_PATH)
+        config = dict(corpus['configs']['level-set-roi'], threads=4)
+        results = check_config(corpus, IMAGES[3:4], config, 'level-set-roi')
+        assert all(result['exact'] for result in results.values())
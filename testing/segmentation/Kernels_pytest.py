@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+import segmentation.kernels as kernels
+from segmentation import CLASSIC, DOUBLE_WELL, REFERENCE_POLICY, Level_Set, Region_Growing, find_region, \
+    preprocessing, read_image
+
+IMAGES = ["testing_images/mdb00{}.pgm".format(i) for i in range(1, 4)]
+
+
+def grow_both(monkeypatch, image, max_iter, threshold, **kwargs):
+    """
+    Returns:
+        The results and segmentations of Region_Growing with the python loop and with the kernel.
+    """
+    monkeypatch.setattr(kernels, 'JIT_ENABLED', False)
+    interpreted = Region_Growing(image, max_iter, threshold, **kwargs)
+    interpreted_result = interpreted.segment()
+    monkeypatch.setattr(kernels, 'JIT_ENABLED', True)
+    compiled = Region_Growing(image, max_iter, threshold, **kwargs)
+    compiled_result = compiled.segment()
+    return interpreted_result, interpreted.segmentation, compiled_result, compiled.segmentation
+
+
+def find_region_both(monkeypatch, image):
+    """
+    Returns:
+        The regions find_region grows with the classic engine with the python loop and with the kernel.
+    """
+    monkeypatch.setattr(kernels, 'JIT_ENABLED', False)
+    interpreted = find_region(image, 6200, neighbours=4, engine=CLASSIC)
+    monkeypatch.setattr(kernels, 'JIT_ENABLED', True)
+    return interpreted, find_region(image, 6200, neighbours=4, engine=CLASSIC)
+
+
+class TestClass:
+
+    def test_kernel_matches_python_loop(self, monkeypatch):
+        # the kernel run as plain python, so it is checked without Numba too
+        monkeypatch.setattr(kernels, 'compiled_kernels', {'grow_region': kernels.grow_region})
+        image = preprocessing(read_image(IMAGES[0])[0])[:64, :64]
+        for max_iter, threshold, kwargs in [(6200, 30, {}), (100, 60, {}), (100, 2.5, {}), (6200, 20, {'conn': 8}),
+                                            (6200, 30, {'dtype_policy': REFERENCE_POLICY})]:
+            interpreted_result, interpreted, compiled_result, compiled = grow_both(monkeypatch, image, max_iter,
+                                                                                   threshold, **kwargs)
+            assert isinstance(interpreted_result, int) == isinstance(compiled_result, int)
+            assert np.array_equal(interpreted, compiled)
+            assert interpreted.dtype == compiled.dtype
+
+    def test_kernel_matches_python_loop_on_image(self, monkeypatch):
+        # the threshold cascade on a preprocessed image whose region leaks at the first threshold, with the
+        # kernel run as plain python
+        monkeypatch.setattr(kernels, 'compiled_kernels', {'grow_region': kernels.grow_region})
+        image = preprocessing(read_image("testing_images/mdb004.pgm")[0])
+        interpreted, kernel = find_region_both(monkeypatch, image)
+        assert kernel.threshold == interpreted.threshold == 40
+        assert np.array_equal(kernel.segmentation, interpreted.segmentation)
+
+    def test_compiled_kernel_matches_python_loop(self, monkeypatch):
+        pytest.importorskip("numba")
+        assert kernels.warm_up()
+        for path in IMAGES:
+            interpreted, compiled = find_region_both(monkeypatch, preprocessing(read_image(path)[0]))
+            assert compiled.threshold == interpreted.threshold
+            assert np.array_equal(compiled.segmentation, interpreted.segmentation)
+
+    def test_fallback_without_jit(self, monkeypatch):
+        monkeypatch.setattr(kernels, 'JIT_ENABLED', False)
+        assert kernels.get_kernel('grow_region') is None
+        assert not kernels.warm_up()
+
+    def test_segment_image_fills_rows(self):
+        level_set = Level_Set(DOUBLE_WELL)
+        image = preprocessing(read_image(IMAGES[0])[0])
+        phi = level_set.find_lsf(**dict(level_set.initialise_params(image), iter_outer=2))
+        expected = image.copy()
+        for i, column in enumerate(level_set.boundary(phi)):
+            expected[i, :column] = 0
+        assert np.array_equal(level_set.segment_image(phi, image.copy()), expected)
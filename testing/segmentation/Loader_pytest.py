@@ -0,0 +1,69 @@
+import threading
+import time
+
+import numpy as np
+import pytest
+from segmentation import Prefetching_Loader, preprocessing, read_image
+
+IMAGES = ["testing_images/mdb00{}.pgm".format(i) for i in range(1, 4)]
+
+
+def slow_identity(item):
+    # later items load faster, so they finish before the earlier ones
+    time.sleep(0.01 * (10 - item))
+    return item
+
+
+class Counting_Load:
+
+    def __init__(self):
+        self.started = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, item):
+        with self.lock:
+            self.started += 1
+        return item
+
+
+def fail_on_two(item):
+    if item == 2:
+        raise ValueError("cannot load 2")
+    return item
+
+
+class TestClass:
+
+    def test_ordered_delivery(self):
+        with Prefetching_Loader(range(10), load=slow_identity, depth=4, workers=4) as loader:
+            assert [item for _, item in loader] == list(range(10))
+
+    def test_bounded_depth(self):
+        load = Counting_Load()
+        loader = Prefetching_Loader(range(100), load=load, depth=3)
+        next(loader)
+        time.sleep(0.05)
+        # the image handed out and the three loaded ahead
+        assert load.started == 4
+        loader.close()
+
+    def test_load_error_is_raised_at_its_image(self):
+        loader = Prefetching_Loader(range(5), load=fail_on_two)
+        assert next(loader) == (0, 0)
+        assert next(loader) == (1, 1)
+        with pytest.raises(ValueError):
+            next(loader)
+        loader.close()
+
+    def test_loads_overlap_consumer(self):
+        start = time.perf_counter()
+        for _ in Prefetching_Loader(range(5), load=lambda item: time.sleep(0.1), depth=2):
+            time.sleep(0.1)
+        # one load and five 0.1s steps instead of ten
+        assert time.perf_counter() - start < 0.8
+
+    def test_default_load_preprocesses(self):
+        loaded = list(Prefetching_Loader(IMAGES))
+        assert [path for path, _ in loaded] == IMAGES
+        for path, image in loaded:
+            assert np.array_equal(image, preprocessing(read_image(path)[0]))
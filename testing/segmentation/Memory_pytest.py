@@ -0,0 +1,53 @@
+import base64
+
+import numpy as np
+from segmentation.image_io import decode_base64_image, read_image_header
+from segmentation.memory import Memory_Budget, estimate_request_bytes, fitting_reduction, measure_peak
+
+IMAGE_PATH = "testing_images/mdb001.pgm"
+
+
+def encoded_image():
+    with open(IMAGE_PATH, "rb") as image_file:
+        return base64.b64encode(image_file.read()).decode('utf-8')
+
+
+class TestClass:
+
+    def test_estimate(self):
+        small = estimate_request_bytes(1000, 512, 512, 1, 'region-growing')
+        large = estimate_request_bytes(1000, 1024, 1024, 1, 'region-growing')
+        assert small < large
+        assert estimate_request_bytes(1000, 1024, 1024, 1, 'region-growing', reduce=2) < large
+        assert estimate_request_bytes(1000, 1024, 1024, 1, 'region-growing', full_resolution=True) > large
+        assert estimate_request_bytes(1000, 1024, 1024, 3, 'region-growing') > large
+        assert estimate_request_bytes(1000, 1024, 1024, 1, 'level-set') > large
+
+    def test_fitting_reduction(self):
+        estimate = estimate_request_bytes(1000, 1024, 1024, 1, 'region-growing')
+        assert fitting_reduction(estimate, 1000, 1024, 1024, 1, 'region-growing') == 1
+        assert fitting_reduction(estimate - 1, 1000, 1024, 1024, 1, 'region-growing') == 2
+        # the image cannot be made smaller than the working frame
+        assert fitting_reduction(0, 1000, 1024, 1024, 1, 'region-growing') is None
+
+    def test_read_image_header(self):
+        assert read_image_header(encoded_image()) == (1024, 1024, 1)
+        assert read_image_header(base64.b64encode(b"not an image").decode('utf-8')) is None
+
+    def test_decode_reduced(self):
+        image = decode_base64_image(encoded_image(), reduce=2)
+        assert image.size == (512, 512)
+
+    def test_measure_peak(self):
+        result, peak = measure_peak(np.ones, 1024 * 1024, dtype=np.uint8)
+        assert result.shape == (1024 * 1024,)
+        assert peak >= 1024 * 1024
+
+    def test_memory_budget(self):
+        budget = Memory_Budget(100)
+        assert budget.acquire(60)
+        assert not budget.acquire(60, timeout=0.01)
+        budget.release(60)
+        assert budget.acquire(60, timeout=0.01)
+        assert budget.acquire(40, timeout=0.01)
+        assert budget.in_use == 100
@@ -0,0 +1,55 @@
+import numpy as np
+from segmentation import DOUBLE_WELL, PREDICTED, WORKING_SIZE, Level_Set, find_region, preprocessing, read_image, \
+    working_size_for_budget
+from segmentation.resolution import scale_area, scale_length
+
+IMAGE = "testing_images/mdb001.pgm"
+
+
+def muscle_on_original(image, size):
+    preprocessed_image, transform = preprocessing(image, return_transform=True, size=size)
+    region = find_region(preprocessed_image, 6200, neighbours=4, threshold_mode=PREDICTED, size=size)
+    return transform.mask_to_original(region.segmentation == 0)
+
+
+class TestClass:
+
+    def test_working_size_for_budget(self):
+        assert working_size_for_budget(256 * 256) == 256
+        assert working_size_for_budget(256 * 256 - 1) == 128
+        assert working_size_for_budget(10 ** 7) == 512
+        assert working_size_for_budget(1) == 128
+
+    def test_scaling(self):
+        assert scale_length(32, WORKING_SIZE) == 32
+        assert scale_length(32, 128) == 16
+        assert scale_length(1, 128) == 1
+        assert scale_area(6200, WORKING_SIZE) == 6200
+        assert scale_area(6200, 512) == 24800
+
+    def test_preprocessing_size(self):
+        image = read_image(IMAGE)[0]
+        preprocessed_image, transform = preprocessing(image, return_transform=True, size=128)
+        assert preprocessed_image.shape[0] == 128
+        assert transform.size == 128
+        assert transform.working_shape == preprocessed_image.shape
+
+    def test_level_set_params(self):
+        image = np.zeros((128, 100))
+        params = Level_Set(DOUBLE_WELL).initialise_params(image, size=128)
+        assert params['iter_outer'] == 10
+        assert np.count_nonzero(params['initial_lsf'] < 0) == 25
+        assert params['timestep'] == Level_Set(DOUBLE_WELL).initialise_params(image)['timestep']
+
+    def test_level_set_keeps_contour_in_small_frame(self):
+        preprocessed_image = preprocessing(read_image(IMAGE)[0], size=128)
+        phi = Level_Set(DOUBLE_WELL).find_image_lsf(preprocessed_image, size=128)
+        assert (phi <= 0).any()
+
+    def test_region_agrees_across_sizes(self):
+        image = read_image(IMAGE)[0]
+        reference = muscle_on_original(image, WORKING_SIZE)
+        for size in [128, 512]:
+            mask = muscle_on_original(image, size)
+            dice = 2 * np.count_nonzero(mask & reference) / (np.count_nonzero(mask) + np.count_nonzero(reference))
+            assert dice > 0.9
@@ -0,0 +1,53 @@
+import numpy as np
+import segmentation.results_store as results_store
+from segmentation.golden import CONFIGS, golden_output
+from segmentation.results_store import ACCEPTABLE, UNACCEPTABLE, Results_Store, read_evaluations
+
+EVALUATIONS_PATH = "../level-set/level_set_results.csv"
+
+
+def result(area, seconds):
+    mask = np.zeros((4, 3), dtype=bool)
+    mask.flat[:area] = True
+    return dict(golden_output(mask, seconds), input_hash="pixels{}".format(area))
+
+
+class TestClass:
+
+    def test_lookup_returns_the_latest_result(self):
+        with Results_Store() as store:
+            first, second = result(2, 0.5), result(2, 0.25)
+            assert store.add([{'image': "testing_images/mdb001.pgm", 'config': CONFIGS['level-set'], 'result': first},
+                              {'image': "mdb001", 'config': CONFIGS['level-set'], 'result': second}]) == 2
+            # the defaults of segment_mask and the number of threads do not change the parameters
+            config = dict(CONFIGS['level-set'], size=256, threads=4)
+            found = store.lookup("pixels2", config)
+            assert found == {key: second[key] for key in found}
+            assert store.lookup("pixels2", CONFIGS['level-set-roi']) is None
+            assert len(store.query(image="testing_images/mdb001.pgm", config=config)) == 2
+
+    def test_results_of_other_engine_versions_are_not_returned(self, monkeypatch):
+        with Results_Store() as store:
+            store.add([{'image': "mdb001", 'config': CONFIGS['level-set'], 'result': result(2, 0.5)}])
+            monkeypatch.setattr(results_store, 'code_version', "changed")
+            assert store.lookup("pixels2", CONFIGS['level-set']) is None
+            assert store.query(current=True) == []
+            assert len(store.query()) == 1
+
+    def test_reports(self):
+        with Results_Store() as store:
+            store.add([{'image': "mdb00{}".format(i), 'config': CONFIGS['classic-cascade'], 'result': result(i, i)}
+                       for i in range(1, 5)] +
+                      [{'image': "mdb005", 'config': CONFIGS['classic-cascade'], 'result': {'error': "failed"}}])
+            assert store.set_labels({"mdb001": ACCEPTABLE, "mdb002": UNACCEPTABLE, "mdb003": ACCEPTABLE},
+                                    CONFIGS['classic-cascade']) == 3
+            assert store.set_labels({"mdb004": ACCEPTABLE}, CONFIGS['level-set']) == 0
+            latency, = store.latency_report().values()
+            assert latency == {'engine': 'classic', 'count': 5, 'failed': 1, 'mean': 2.5, 'median': 3, 'p95': 4}
+            accuracy, = store.accuracy_report().values()
+            assert accuracy == {'engine': 'classic', 'labelled': 3, 'labels': {UNACCEPTABLE: 1 / 3, ACCEPTABLE: 2 / 3}}
+
+    def test_read_evaluations(self):
+        labels = read_evaluations(EVALUATIONS_PATH)
+        assert len(labels) == 322
+        assert labels["mdb002"] == -1 and labels["mdb003"] == ACCEPTABLE
@@ -0,0 +1,61 @@
+import numpy as np
+from segmentation import CLASSIC, DOUBLE_WELL, FLOOD_FILL, Level_Set, preprocessing, read_image, region_growing
+from segmentation.flood_fill import Flood_Fill
+from segmentation.roi import estimate_roi, map_to_frame, profile_end, touches_roi_edge
+
+
+def synthetic_mammogram():
+    # bright muscle wedge in the top left corner, breast tissue on the left half and background on the right
+    img = np.zeros((256, 200))
+    img[:, 0:100] = 150
+    rows, cols = np.indices(img.shape)
+    img[cols + rows / 2 < 60] = 240
+    return img
+
+
+class TestClass:
+
+    def test_profile_end(self):
+        assert profile_end(np.array([0, 0, 0, 0, 0, 0, 0, 0, 200, 200, 100, 200]), 150) == 10
+        assert profile_end(np.full(20, 200), 150) == 20
+
+    def test_estimate_roi_contains_muscle(self):
+        rows, columns = estimate_roi(synthetic_mammogram())
+        # the muscle wedge spans 120 rows and 60 columns
+        assert 120 < rows < 256
+        assert 60 < columns < 200
+
+    def test_touches_roi_edge(self):
+        mask = np.zeros((10, 10), dtype=bool)
+        mask[9, 0] = True
+        assert touches_roi_edge(mask, (20, 20)) == True
+        assert touches_roi_edge(mask, (10, 20)) == False
+
+    def test_touches_roi_edge_with_guard(self):
+        mask = np.zeros((10, 10), dtype=bool)
+        mask[0, 7] = True
+        assert touches_roi_edge(mask, (20, 20)) == False
+        assert touches_roi_edge(mask, (20, 20), guard=2) == True
+
+    def test_map_to_frame(self):
+        image_data = np.full((4, 4), 100.0)
+        ff = Flood_Fill(image_data[:2, :2], 6200, threshold=40, conn=4)
+        ff.segment()
+        region = map_to_frame(ff, image_data)
+        assert region.segmentation.shape == (4, 4)
+        assert region.segmentation[0, 0] == 0
+        assert region.segmentation[3, 3] == 255
+
+    def test_region_growing_roi_matches_full_image(self):
+        preprocessed_image = preprocessing(read_image("testing_images/mdb006.pgm")[0])
+        for engine in [CLASSIC, FLOOD_FILL]:
+            full_result = region_growing(preprocessed_image, 6200, neighbours=4, engine=engine)
+            roi_result = region_growing(preprocessed_image, 6200, neighbours=4, engine=engine, roi=True)
+            assert np.array_equal(full_result, roi_result)
+
+    def test_level_set_roi_matches_full_image(self):
+        preprocessed_image = preprocessing(read_image("testing_images/mdb007.pgm")[0])
+        ls = Level_Set(DOUBLE_WELL)
+        full_result = ls.run_level_set(preprocessed_image.copy())
+        roi_result = ls.run_level_set(preprocessed_image.copy(), roi=True)
+        assert np.array_equal(full_result, roi_result)
@@ -0,0 +1,45 @@
+import os
+import subprocess
+import sys
+
+import pytest
+import segmentation
+
+# Measured cold import of `segmentation` (numpy included): ~0.07s, against ~0.8s for the eager
+# cv2 + matplotlib + skimage + scipy + pydicom + PIL imports it replaces. The budget leaves
+# headroom for slower machines while still catching a heavy import sneaking back in.
+IMPORT_TIME_BUDGET = 0.5
+HEAVY_MODULES = ['PIL', 'cv2', 'pydicom', 'matplotlib', 'scipy', 'skimage']
+PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(segmentation.__file__)))
+
+
+def run_in_fresh_interpreter(code):
+    output = subprocess.run([sys.executable, '-c', code], cwd=PACKAGE_ROOT, capture_output=True, text=True,
+                            check=True)
+    return output.stdout.strip()
+
+
+class TestClass:
+
+    def test_import_does_not_load_heavy_modules(self):
+        loaded = run_in_fresh_interpreter(
+            "import sys, segmentation; print(','.join(m for m in %r if m in sys.modules))" % HEAVY_MODULES)
+        assert loaded == ''
+
+    def test_import_time_within_budget(self):
+        # take the best of a few runs so a busy machine does not fail the test
+        timings = [float(run_in_fresh_interpreter(
+            "import time; t = time.perf_counter(); import segmentation; print(time.perf_counter() - t)"))
+            for _ in range(3)]
+        assert min(timings) < IMPORT_TIME_BUDGET
+
+    def test_region_growing_on_testing_image(self):
+        image, _ = segmentation.read_image("testing_images/mdb001.pgm")
+        preprocessed_image = segmentation.preprocessing(image)
+        result = segmentation.region_growing(preprocessed_image, 6200, neighbours=4)
+        assert result.shape == preprocessed_image.shape
+        assert result[1, 1] == 0
+
+    def test_read_image_invalid_extension(self):
+        with pytest.raises(ValueError):
+            segmentation.read_image("testing_images/mdb001.txt")
@@ -0,0 +1,112 @@
+import time
+
+import numpy as np
+import pytest
+from segmentation import CASCADE, CLASSIC, DOUBLE_WELL, PREDICTED, Deadline, Level_Set, Region_Growing, find_region, \
+    preprocessing, read_image
+from segmentation.memory import Memory_Budget
+from segmentation.session import MAX_TRACES, Growth_Trace, Level_Set_Session, Region_Growing_Session, Session_Store, \
+    dilate, max_iterations
+
+IMAGES = ["testing_images/mdb00{}.pgm".format(i) for i in [1, 3, 4]]
+
+
+def preprocessed(path):
+    return preprocessing(read_image(path)[0])
+
+
+class TestClass:
+
+    def test_session_matches_find_region(self):
+        for path in IMAGES:
+            image = preprocessed(path)
+            session = Region_Growing_Session(image)
+            for threshold_mode in [CASCADE, PREDICTED]:
+                region = find_region(image, 6200, neighbours=4, threshold_mode=threshold_mode, engine=CLASSIC)
+                segmentation, threshold = session.segment(threshold_mode=threshold_mode)
+                assert threshold == region.threshold
+                assert np.array_equal(segmentation, region.segmentation)
+
+    def test_trace_matches_region_growing(self):
+        image = preprocessed(IMAGES[0])
+        trace = Growth_Trace(image)
+        for threshold, max_iter in [(30, 6200), (10, 500), (60, 100), (2.5, 10)]:
+            region_growing = Region_Growing(image, max_iter, threshold)
+            result = region_growing.segment()
+            size, leaked = trace.region_size(threshold, max_iter)
+            assert leaked == isinstance(result, int)
+            if not leaked:
+                assert np.array_equal(trace.segmentation(size), region_growing.segmentation)
+
+    def test_other_seed(self):
+        image = preprocessed(IMAGES[0])
+        region_growing = Region_Growing(image, 6200, 20)
+        region_growing.seeds = [(5, 3)]
+        region_growing.segment()
+        segmentation, _ = Region_Growing_Session(image).segment(threshold=20, seed=(5, 3))
+        assert np.array_equal(segmentation, region_growing.segmentation)
+
+    def test_partial_trace(self):
+        deadline = Deadline(0)
+        segmentation, _ = Region_Growing_Session(preprocessed(IMAGES[0])).segment(deadline=deadline)
+        assert deadline.exceeded
+        assert np.count_nonzero(segmentation == 0) == 0
+
+    def test_dilate(self):
+        mask = np.zeros((3, 3), dtype=bool)
+        mask[0, 0] = True
+        assert dilate(mask, [(1, 0), (0, 1), (-1, 0), (0, -1)]).tolist() == [[True, True, False],
+                                                                            [True, False, False],
+                                                                            [False, False, False]]
+
+    def test_level_set_session_matches_find_lsf(self):
+        image = preprocessed(IMAGES[0])
+        level_set = Level_Set(DOUBLE_WELL)
+        session = Level_Set_Session(image)
+        for iterations in [3, 2, 4, 12, 7]:
+            phi = level_set.find_lsf(**dict(level_set.initialise_params(image), iter_outer=iterations))
+            assert np.array_equal(session.segment(iterations), phi)
+        # every fifth checkpoint and the last one are kept
+        assert [checkpoint.outer_iterations for checkpoint in session.checkpoints] == [5, 10, 12]
+        assert session.nbytes() <= Level_Set_Session.state_bound(256, 12)
+        with pytest.raises(ValueError):
+            session.segment(max_iterations(256) + 1)
+
+    def test_traces_are_bounded(self):
+        image = preprocessed(IMAGES[0])
+        session = Region_Growing_Session(image)
+        for x in range(MAX_TRACES + 2):
+            session.segment(threshold=20, max_iter=100, seed=(x, 1))
+        assert list(session.traces) == [(x, 1) for x in range(2, MAX_TRACES + 2)]
+        assert session.nbytes() <= Region_Growing_Session.state_bound(256) + (MAX_TRACES - 1) * session.growth_bound()
+
+    def test_session_store_holds_the_sessions_in_the_budget(self):
+        budget = Memory_Budget(1024 * 1024)
+        store = Session_Store(capacity=4, budget=budget)
+        image = preprocessed(IMAGES[0])
+        session = Level_Set_Session(image)
+        first = store.add(session)
+        assert budget.in_use == image.nbytes
+        session.segment(5)
+        store.account(first)
+        assert budget.in_use == session.nbytes() > image.nbytes
+        # sessions that do not fit next to the new one are dropped, least recently used first
+        budget.acquire(budget.budget_bytes - budget.in_use)
+        second = store.add(Level_Set_Session(image))
+        assert store.get(first) is None
+        store.remove(second)
+        assert budget.in_use == budget.budget_bytes - session.nbytes()
+
+    def test_session_store(self):
+        store = Session_Store(ttl=0.1, capacity=2)
+        first = store.add("first")
+        second = store.add("second")
+        assert store.get(first) == "first"
+        # the least recently used session is dropped
+        third = store.add("third")
+        assert store.get(second) is None
+        assert store.get(first) == "first"
+        assert store.remove(third)
+        assert not store.remove(third)
+        time.sleep(0.15)
+        assert store.get(first) is None
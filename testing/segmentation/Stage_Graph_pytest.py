@@ -0,0 +1,152 @@
+import threading
+import time
+
+import numpy as np
+import pytest
+from segmentation import Deadline, Stage_Graph, read_image
+from segmentation.stage_graph import preprocess_pixels
+
+
+def double(values, factor=2):
+    return values * factor
+
+
+def partial(values, deadline=None):
+    deadline.expired()
+    return values
+
+
+class Slow_Stage:
+
+    def __init__(self, seconds=0.2, deadline_exceeded=False):
+        self.seconds = seconds
+        self.deadline_exceeded = deadline_exceeded
+        self.started = threading.Event()
+
+    def __call__(self, values, deadline=None):
+        self.started.set()
+        time.sleep(self.seconds)
+        if self.deadline_exceeded:
+            deadline.exceeded = True
+        return values * 2
+
+
+def run_concurrently(graph, stage, inputs, deadlines):
+    """
+    Runs the stage with the first deadline, and with the others once it has started.
+
+    Returns:
+        The results of every run.
+    """
+    results = [None] * len(deadlines)
+
+    def run(index):
+        results[index] = graph.run("slow", stage, inputs, deadline=deadlines[index])
+
+    threads = [threading.Thread(target=run, args=(index,)) for index in range(len(deadlines))]
+    threads[0].start()
+    stage.started.wait()
+    for thread in threads[1:]:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def array_stage(graph, values):
+    return graph.run("array", lambda data: values, graph.source(values.tobytes()))
+
+
+class TestClass:
+
+    def test_outputs_are_cached_by_input_and_params(self):
+        graph = Stage_Graph()
+        source = graph.source(b"image")
+        first = graph.run("double", double, array_stage(graph, np.arange(4)))
+        second = graph.run("double", double, array_stage(graph, np.arange(4)))
+        assert first.key == second.key
+        assert graph.timings["double"] == {'runs': 1, 'hits': 1, 'coalesced': 0,
+                                           'seconds': graph.timings["double"]['seconds']}
+        third = graph.run("double", double, array_stage(graph, np.arange(4)), factor=3)
+        assert third.key != first.key
+        assert third.value.tolist() == [0, 3, 6, 9]
+        assert graph.source("image").key == source.key
+
+    def test_only_downstream_stages_run_again(self):
+        graph = Stage_Graph()
+        pixels = array_stage(graph, np.arange(4))
+        doubled = graph.run("double", double, pixels)
+        graph.run("triple", double, doubled, factor=3)
+        graph.run("triple", double, doubled, factor=4)
+        assert graph.timings["double"]['runs'] == 1
+        assert graph.timings["triple"]['runs'] == 2
+
+    def test_cached_arrays_are_read_only(self):
+        graph = Stage_Graph()
+        result = graph.run("double", double, array_stage(graph, np.arange(4)))
+        with pytest.raises(ValueError):
+            result.value[0] = 1
+
+    def test_partial_outputs_are_not_cached(self):
+        graph = Stage_Graph()
+        pixels = array_stage(graph, np.arange(4))
+        result = graph.run("partial", partial, pixels, deadline=Deadline(0))
+        assert result.key is None
+        assert graph.run("double", double, result).key is None
+        graph.run("partial", partial, pixels, deadline=Deadline(0))
+        assert graph.timings["partial"]['runs'] == 2
+        assert graph.cached_bytes == pixels.value.nbytes
+
+    def test_least_recently_used_outputs_are_evicted(self):
+        graph = Stage_Graph(cache_bytes=2 * 800)
+        pixels = array_stage(graph, np.arange(100))
+        for factor in [1, 2, 1, 3]:
+            graph.run("double", double, pixels, factor=factor)
+        assert graph.cached_bytes <= 2 * 800
+        # factor 2 was the least recently used one when factor 3 was added
+        graph.run("double", double, pixels, factor=1)
+        graph.run("double", double, pixels, factor=2)
+        assert graph.timings["double"] == {'runs': 4, 'hits': 2, 'coalesced': 0,
+                                           'seconds': graph.timings["double"]['seconds']}
+
+    def test_preprocess_stage(self):
+        graph = Stage_Graph()
+        pixels = array_stage(graph, np.asarray(read_image("testing_images/mdb001.pgm")[0]))
+        preprocessed = graph.run("preprocess", preprocess_pixels, pixels)
+        assert preprocessed.item(0).value.shape == preprocessed.value[1].working_shape
+        assert preprocessed.item(0).key != preprocessed.item(1).key
+
+    def test_concurrent_runs_are_coalesced(self):
+        # coalescing does not depend on the cache
+        graph = Stage_Graph(cache_bytes=0)
+        pixels = array_stage(graph, np.arange(4))
+        results = run_concurrently(graph, Slow_Stage(), pixels, [None, Deadline(5), None])
+        assert graph.timings["slow"]['runs'] == 1
+        assert graph.timings["slow"]['coalesced'] == 2
+        assert all(result.value is results[0].value for result in results)
+        assert not results[0].value.flags.writeable
+        assert not graph.in_flight
+
+    def test_partial_outputs_are_not_shared(self):
+        graph = Stage_Graph()
+        pixels = array_stage(graph, np.arange(4))
+        results = run_concurrently(graph, Slow_Stage(deadline_exceeded=True), pixels, [Deadline(5), Deadline(5)])
+        assert graph.timings["slow"]['runs'] == 2
+        assert graph.timings["slow"]['coalesced'] == 0
+        assert [result.key for result in results] == [None, None]
+
+    def test_waiting_stops_at_the_deadline(self):
+        graph = Stage_Graph()
+        pixels = array_stage(graph, np.arange(4))
+        start = time.perf_counter()
+        results = run_concurrently(graph, Slow_Stage(seconds=0.5), pixels, [None, Deadline(0.05)])
+        assert graph.timings["slow"]['runs'] == 2
+        assert results[1].value.tolist() == [0, 2, 4, 6]
+        assert time.perf_counter() - start < 1.5
+
+    def test_same_pixels_share_a_key(self):
+        graph = Stage_Graph()
+        first = graph.by_content(array_stage(graph, np.arange(4)))
+        second = graph.by_content(graph.run("array", lambda data: np.arange(4), graph.source(b"other encoding")))
+        assert first.key == second.key
+        assert graph.by_content(array_stage(graph, np.arange(5))).key != first.key
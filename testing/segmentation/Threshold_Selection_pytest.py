@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+from segmentation import CASCADE, PREDICTED, THRESHOLDS, predict_threshold, preprocessing, read_image, region_growing
+from segmentation.threshold_selection import histogram_median, muscle_tissue_contrast
+
+
+def synthetic_mammogram(muscle_level, tissue_level):
+    # bright muscle wedge in the top left corner, breast tissue on the left half and background on the right
+    img = np.zeros((256, 200))
+    img[:, 0:100] = tissue_level
+    rows, cols = np.indices(img.shape)
+    img[cols + rows < 120] = muscle_level
+    return img
+
+
+class TestClass:
+
+    def test_histogram_median(self):
+        assert histogram_median(np.array([10, 20, 30, 40, 250])) == 30
+
+    def test_muscle_tissue_contrast(self):
+        assert muscle_tissue_contrast(synthetic_mammogram(240, 150)) == 90
+
+    def test_predict_threshold_high_contrast(self):
+        assert predict_threshold(synthetic_mammogram(240, 140), THRESHOLDS) == 60
+
+    def test_predict_threshold_low_contrast(self):
+        assert predict_threshold(synthetic_mammogram(200, 170), THRESHOLDS) == 10
+
+    def test_predict_threshold_no_contrast(self):
+        assert predict_threshold(synthetic_mammogram(150, 150), THRESHOLDS) == 2.5
+
+    def test_predicted_mode_matches_cascade(self):
+        image, _ = read_image("testing_images/mdb004.pgm")
+        preprocessed_image = preprocessing(image)
+        cascade_result = region_growing(preprocessed_image, 6200, neighbours=4, threshold_mode=CASCADE)
+        predicted_result = region_growing(preprocessed_image, 6200, neighbours=4, threshold_mode=PREDICTED)
+        assert np.array_equal(cascade_result, predicted_result)
+
+    def test_invalid_threshold_mode(self):
+        with pytest.raises(ValueError):
+            region_growing(np.zeros((3, 3)), 6200, neighbours=4, threshold_mode='histogram')
@@ -0,0 +1,29 @@
+import numpy as np
+from segmentation import DOUBLE_WELL, SINGLE_WELL, Level_Set, preprocessing, read_image
+
+
+class TestClass:
+
+    def test_strips_cover_all_rows(self):
+        ls = Level_Set(DOUBLE_WELL, threads=4)
+        assert ls.strips(256) == [(0, 64), (64, 128), (128, 192), (192, 256)]
+
+    def test_strips_not_smaller_than_minimum(self):
+        ls = Level_Set(DOUBLE_WELL, threads=8)
+        assert ls.strips(40) == [(0, 20), (20, 40)]
+        assert ls.strips(10) == [(0, 10)]
+
+    def test_tiled_double_well_matches_single_thread(self):
+        preprocessed_image = preprocessing(read_image("testing_images/mdb001.pgm")[0])
+        params = Level_Set(DOUBLE_WELL).initialise_params(preprocessed_image)
+        phi = Level_Set(DOUBLE_WELL).find_lsf(**params)
+        tiled_phi = Level_Set(DOUBLE_WELL, threads=4).find_lsf(**params)
+        assert np.array_equal(phi, tiled_phi)
+
+    def test_tiled_single_well_matches_single_thread(self):
+        rows, cols = np.indices((64, 48))
+        img = np.where(rows + cols < 40, 240.0, 120.0)
+        params = Level_Set(SINGLE_WELL).initialise_params(img)
+        phi = Level_Set(SINGLE_WELL).find_lsf(**params)
+        tiled_phi = Level_Set(SINGLE_WELL, threads=3).find_lsf(**params)
+        assert np.array_equal(phi, tiled_phi)
@@ -0,0 +1,66 @@
+import numpy as np
+from segmentation import (DOUBLE_WELL, FLOOD_FILL, Level_Set, Preprocessing_Transform, find_region, preprocessing,
+                          read_image, row_boundary, spans_to_mask)
+
+
+class TestClass:
+
+    def test_row_boundary(self):
+        mask = np.array([[1, 1, 0, 0], [1, 0, 1, 0], [0, 0, 0, 0]], dtype=bool)
+        assert row_boundary(mask).tolist() == [2, 3, 0]
+
+    def test_spans_to_mask(self):
+        mask = spans_to_mask(np.array([0, 1, 2]), np.array([2, 3, 2]), 4)
+        assert mask.astype(int).tolist() == [[1, 1, 0, 0], [0, 1, 1, 0], [0, 0, 0, 0]]
+
+    def test_mask_to_original(self):
+        # 8x8 original, 4x4 working frame with a bar of one column
+        transform = Preprocessing_Transform((8, 8), flipped=False, bar_width=1, size=4)
+        mask = np.zeros(transform.working_shape, dtype=bool)
+        mask[0, 0] = True
+        original = transform.mask_to_original(mask)
+        assert original.shape == (8, 8)
+        assert np.argwhere(original).tolist() == [[0, 2], [0, 3], [1, 2], [1, 3]]
+
+    def test_mask_to_original_flipped(self):
+        transform = Preprocessing_Transform((8, 8), flipped=True, bar_width=1, size=4)
+        mask = np.zeros(transform.working_shape, dtype=bool)
+        mask[0, 0] = True
+        assert np.argwhere(transform.mask_to_original(mask)).tolist() == [[0, 4], [0, 5], [1, 4], [1, 5]]
+
+    def test_boundary_matches_mask(self):
+        for flipped in [False, True]:
+            transform = Preprocessing_Transform((700, 523), flipped=flipped, bar_width=37, size=256)
+            boundary = np.random.RandomState(0).randint(0, 219, size=256)
+            mask = spans_to_mask(np.zeros(256, dtype=int), boundary, 219)
+            start, end = transform.boundary_to_original(boundary)
+            assert np.array_equal(spans_to_mask(start, end, 523), transform.mask_to_original(mask))
+
+    def test_preprocessing_transform(self):
+        image, _ = read_image("testing_images/mdb001.pgm")
+        preprocessed_image, transform = preprocessing(image, return_transform=True)
+        assert np.array_equal(preprocessed_image, preprocessing(image))
+        assert transform.original_shape == (1024, 1024)
+        assert transform.working_shape == preprocessed_image.shape
+
+    def test_region_maps_back_onto_working_frame(self):
+        image, _ = read_image("testing_images/mdb004.pgm")
+        preprocessed_image, transform = preprocessing(image, return_transform=True)
+        mask = find_region(preprocessed_image, 6200, neighbours=4, engine=FLOOD_FILL).segmentation == 0
+        original = transform.mask_to_original(mask)
+        if transform.flipped:
+            original = original[:, ::-1]
+        # sample the centres of the working pixels
+        centres = ((np.arange(256) + 0.5) * 1024 / 256).astype(int)
+        assert np.array_equal(original[np.ix_(centres, centres)][:, transform.bar_width:], mask)
+
+    def test_level_set_boundary_maps_back(self):
+        image, _ = read_image("testing_images/mdb002.pgm")
+        preprocessed_image, transform = preprocessing(image, return_transform=True)
+        ls = Level_Set(DOUBLE_WELL)
+        phi = ls.find_image_lsf(preprocessed_image.copy(), roi=True)
+        segmented_image = ls.segment_image(phi, preprocessed_image.copy())
+        start, end = transform.boundary_to_original(ls.boundary(phi))
+        blanked = transform.mask_to_original(spans_to_mask(np.zeros(256, dtype=int), row_boundary(
+            segmented_image != preprocessed_image), preprocessed_image.shape[1]))
+        assert np.array_equal(spans_to_mask(start, end, 1024), blanked)
@@ -0,0 +1,83 @@
+import os
+import time
+
+import numpy as np
+from segmentation import FLOOD_FILL, Deadline, Shared_Memory_Pool, preprocessing, read_image, region_growing
+from segmentation.topology import available_cores, plan_workers
+
+
+def invert(pixels, offset=0, deadline=None):
+    return 255 - pixels + offset
+
+
+def check_deadline(pixels, deadline=None):
+    deadline.expired()
+    return pixels
+
+
+def segment(pixels, deadline=None):
+    from PIL import Image
+
+    return region_growing(preprocessing(Image.fromarray(pixels)), 6200, neighbours=4, deadline=deadline,
+                          engine=FLOOD_FILL)
+
+
+def worker_settings(pixels, deadline=None):
+    import segmentation.topology as topology
+
+    return np.array([topology.worker_index, int(os.environ['OMP_NUM_THREADS']), len(os.sched_getaffinity(0))])
+
+
+class TestClass:
+
+    def test_run_matches_direct_call(self):
+        pixels = np.arange(256 * 256, dtype=np.uint32).reshape(256, 256)
+        with Shared_Memory_Pool(1, slots=1) as pool:
+            # the same slot is reused for every request
+            for offset in range(3):
+                assert np.array_equal(pool.run(invert, pixels, offset=offset), invert(pixels, offset))
+
+    def test_images_larger_than_the_buffers(self):
+        pixels = np.ones((64, 64), dtype=np.uint8)
+        with Shared_Memory_Pool(1, buffer_size=1024) as pool:
+            assert np.array_equal(pool.run(invert, pixels), invert(pixels))
+
+    def test_deadline_is_passed_on(self):
+        pixels = np.ones((4, 4), dtype=np.uint8)
+        with Shared_Memory_Pool(1) as pool:
+            deadline = Deadline(0)
+            pool.run(check_deadline, pixels, deadline=deadline)
+            assert deadline.exceeded == True
+            deadline = Deadline(60)
+            pool.run(check_deadline, pixels, deadline=deadline)
+            assert deadline.exceeded == False
+
+    def test_start_times_out(self):
+        pool = Shared_Memory_Pool(1)
+        # the worker warms up with a segmentation before it is ready
+        assert not pool.start(0.01)
+        start = time.monotonic()
+        pool.close(wait=False)
+        assert time.monotonic() - start < 1
+
+    def test_segmentation_in_worker(self):
+        pixels = np.asarray(read_image("testing_images/mdb002.pgm")[0])
+        with Shared_Memory_Pool(1) as pool:
+            assert np.array_equal(pool.run(segment, pixels), segment(pixels))
+
+    def test_plan_workers(self):
+        cores = list(range(8))
+        assert plan_workers(cores=cores) == (8, 1, None)
+        assert plan_workers(2, cores=cores) == (2, 4, None)
+        assert plan_workers(threads=3, cores=cores) == (2, 3, None)
+        assert plan_workers(4, affinity=True, cores=cores).cores == ((0, 1), (2, 3), (4, 5), (6, 7))
+        # more threads than cores share them round robin
+        assert plan_workers(3, 2, affinity=True, cores=[0, 1]).cores == ((0, 1), (0, 1), (0, 1))
+        assert plan_workers(1, 16, cores=cores) == (1, 16, None)
+
+    def test_workers_are_laid_out(self):
+        core = available_cores()[0]
+        with Shared_Memory_Pool(1, threads=2, affinity=True, warm=False) as pool:
+            assert pool.layout.cores == ((core,),)
+            assert pool.start(timeout=60)
+            assert pool.run(worker_settings, np.zeros(1)).tolist() == [0, 2, 1]